@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Benchmark ``proj inv analyze``: serial vs a bounded worker pool.
+
+Builds a synthetic workspace of projects with a mix of manifests
+(``package.json`` with dependencies, ``pyproject.toml``, ``Cargo.toml``,
+``go.mod``) in a temp directory, then analyzes the same inventory with
+one worker and with ``--jobs`` workers and checks both results match.
+A final rerun on the analyzed inventory shows the incremental case,
+where unchanged manifest fingerprints skip every project.
+``--latency`` adds a delay to every stat, scandir and open to mimic
+network storage, where the pool matters most.
+
+Each line also reports filesystem calls per project. The ``exists``
+line is the baseline a hard-coded detector chain pays: one stat per
+file name in the detector registry, instead of one listing.
+
+Usage:
+    python scripts/bench_analyze.py [--projects N] [--jobs J] [--latency S]
+"""
+
+import argparse
+import builtins
+import copy
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from proj.analyzer import analyze_inventory
+from proj.detectors import DETECTORS
+
+MANIFESTS = [
+    {"package.json": json.dumps({"dependencies": {"react": "18"}})},
+    {"pyproject.toml": "[project]\nname = 'x'\n"},
+    {"Cargo.toml": "[package]\nname = 'x'\n", "go.mod": "module x\n"},
+    {"setup.py": "", "package.json": "{}"},
+]
+
+# Every file name an exists() chain over the registry has to check
+REGISTRY_FILES = sorted({name for d in DETECTORS for name in d.files})
+
+
+def build_tree(root: Path, projects: int) -> list[dict]:
+    """Create projects under root and return their inventory."""
+    inventory = []
+    for i in range(projects):
+        path = root / f"group{i % 10}" / f"project{i}"
+        path.mkdir(parents=True)
+        for name, content in MANIFESTS[i % len(MANIFESTS)].items():
+            (path / name).write_text(content)
+        inventory.append({"name": path.name, "local_path": str(path)})
+    return inventory
+
+
+@contextmanager
+def counted_filesystem(latency: float):
+    """Count os.stat, os.scandir and open, delaying each by ``latency``."""
+    counts = {}
+    lock = threading.Lock()
+    originals = {
+        "stat": (os, os.stat),
+        "scandir": (os, os.scandir),
+        "open": (builtins, builtins.open),
+    }
+
+    def wrap(name, func):
+        def wrapper(*args, **kwargs):
+            with lock:
+                counts[name] = counts.get(name, 0) + 1
+            if latency > 0:
+                time.sleep(latency)
+            return func(*args, **kwargs)
+        return wrapper
+
+    for name, (module, func) in originals.items():
+        setattr(module, name, wrap(name, func))
+    try:
+        yield counts
+    finally:
+        for name, (module, func) in originals.items():
+            setattr(module, name, func)
+
+
+def report(label: str, elapsed: float, counts: dict, projects: int,
+           extra: str = "") -> None:
+    """Print one timing line with filesystem calls per project."""
+    calls = " ".join(
+        f"{name}={count / projects:.1f}"
+        for name, count in sorted(counts.items())
+    )
+    print(f"{label:<12} {elapsed:8.3f}s  per project: {calls}  {extra}")
+
+
+def exists_chain(inventory: list[dict], latency: float) -> None:
+    """Time one exists() per registry file name for every project."""
+    with counted_filesystem(latency) as counts:
+        start = time.perf_counter()
+        for project in inventory:
+            root = Path(project["local_path"])
+            for name in REGISTRY_FILES:
+                (root / name).exists()
+        elapsed = time.perf_counter() - start
+    report("exists", elapsed, counts, len(inventory))
+
+
+def run(label: str, inventory: list[dict], jobs: int, latency: float):
+    """Analyze a copy of the inventory and print the timing."""
+    items = copy.deepcopy(inventory)
+    updates = []
+    with counted_filesystem(latency) as counts:
+        start = time.perf_counter()
+        stats = analyze_inventory(items, jobs, updates.append)
+        elapsed = time.perf_counter() - start
+    report(label, elapsed, counts, len(items),
+           f"analyzed={stats.analyzed} unchanged={stats.unchanged} "
+           f"progress updates={len(updates)}")
+    return items
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=5000)
+    parser.add_argument("--jobs", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.0005)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inventory = build_tree(Path(tmp), args.projects)
+        exists_chain(inventory, args.latency)
+        serial = run("serial", inventory, 1, args.latency)
+        parallel = run(
+            f"jobs-{args.jobs}", inventory, args.jobs, args.latency
+        )
+        assert parallel == serial, "parallel results differ from serial"
+        rerun = run(
+            f"rerun-{args.jobs}", parallel, args.jobs, args.latency
+        )
+        assert rerun == parallel, "rerun changed unchanged projects"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Benchmark GitHub repo listing: serial next-links vs parallel pages.
+
+Starts a local stub of ``/users/<name>/repos`` serving synthetic
+repositories with GitHub-style ``Link`` headers and a fixed per-request
+latency, then lists every repo with one worker (equivalent to following
+``next`` links) and with ``--jobs`` workers.
+
+Usage:
+    python scripts/bench_scan_github.py [--repos N] [--latency S] [--jobs J]
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from proj.forges import GitHubClient
+
+
+def make_handler(repos: list[dict], latency: float):
+    """Build a request handler serving ``repos`` page by page."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency)
+            parts = urlsplit(self.path)
+            query = parse_qs(parts.query)
+            per_page = int(query.get("per_page", ["30"])[0])
+            page = int(query.get("page", ["1"])[0])
+            start = (page - 1) * per_page
+            body = json.dumps(repos[start:start + per_page]).encode()
+            last = max(1, -(-len(repos) // per_page))
+            host = f"http://{self.headers['Host']}{parts.path}"
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            if page < last:
+                self.send_header("Link", (
+                    f'<{host}?per_page={per_page}&page={page + 1}>; '
+                    f'rel="next", '
+                    f'<{host}?per_page={per_page}&page={last}>; rel="last"'
+                ))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def run(label: str, url: str, jobs: int) -> list[str]:
+    """List all repos with ``jobs`` workers and print the timing."""
+    with GitHubClient(api_url=url, jobs=jobs) as client:
+        start = time.perf_counter()
+        names = [repo["name"] for repo in client.iter_repos("bench")]
+        elapsed = time.perf_counter() - start
+    print(f"{label:<10} {elapsed:8.3f}s  repos={len(names)}")
+    return names
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repos", type=int, default=10_000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jobs", type=int, default=8)
+    args = parser.parse_args()
+
+    repos = [
+        {"name": f"repo{i}", "html_url": f"https://github.com/bench/repo{i}",
+         "description": "", "language": "Python",
+         "updated_at": "2025-01-01T00:00:00Z"}
+        for i in range(args.repos)
+    ]
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), make_handler(repos, args.latency)
+    )
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        serial = run("serial", url, 1)
+        parallel = run(f"jobs-{args.jobs}", url, args.jobs)
+        assert parallel == serial, "parallel listing differs from serial"
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
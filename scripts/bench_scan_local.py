@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark the local project walker against the legacy per-marker glob.
+
+Builds a synthetic workspace (repos with ``.git`` internals and
+``node_modules`` trees) in a temp directory, then runs both strategies and
+reports wall time and filesystem syscalls (``scandir``/``stat``/``lstat``
+calls made through the ``os`` module).
+
+Usage:
+    python scripts/bench_scan_local.py [--projects N] [--depth D]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from proj.scanner import walk_projects
+
+LEGACY_MARKERS = [
+    ".git", "package.json", "pyproject.toml", "Cargo.toml", "go.mod",
+]
+
+
+def build_tree(root: Path, projects: int) -> None:
+    """Create a synthetic workspace under root."""
+    for i in range(projects):
+        repo = root / f"group{i % 10}" / f"project{i}"
+        (repo / ".git" / "objects").mkdir(parents=True)
+        for j in range(20):
+            (repo / ".git" / "objects" / f"{j:02x}").mkdir()
+        (repo / "package.json").write_text("{}")
+        (repo / "src").mkdir()
+        for j in range(30):
+            dep = repo / "node_modules" / f"dep{j}"
+            dep.mkdir(parents=True)
+            (dep / "package.json").write_text("{}")
+
+
+def legacy_scan(scan_dir: Path, depth: int) -> list[str]:
+    """The pre-walker implementation: one recursive glob per marker."""
+    projects = []
+    for marker in LEGACY_MARKERS:
+        for project_dir in scan_dir.glob(f"**/{marker}"):
+            if project_dir.parts.count("node_modules") > 0:
+                continue
+            if project_dir.parts.count(".git") > 1:
+                continue
+            root = project_dir.parent
+            if len(root.relative_to(scan_dir).parts) > depth:
+                continue
+            if marker != ".git":
+                check_dir = root.parent
+                is_subproject = False
+                while check_dir != scan_dir and check_dir != check_dir.parent:
+                    if (check_dir / ".git").exists():
+                        is_subproject = True
+                        break
+                    check_dir = check_dir.parent
+                if is_subproject:
+                    continue
+            if str(root) not in projects:
+                projects.append(str(root))
+    return projects
+
+
+def walker_scan(scan_dir: Path, depth: int) -> list[str]:
+    """The single-pass walker."""
+    return [str(found.path) for found in walk_projects(scan_dir, depth)]
+
+
+def parallel_scan(scan_dir: Path, depth: int, workers: int) -> list[str]:
+    """The work-stealing walker."""
+    return [
+        str(found.path)
+        for found in walk_projects(scan_dir, depth, workers=workers)
+    ]
+
+
+@contextmanager
+def count_syscalls(counts: dict):
+    """Count scandir/stat/lstat calls made through the os module."""
+    originals = {
+        name: getattr(os, name) for name in ("scandir", "stat", "lstat")
+    }
+
+    def wrap(name, func):
+        def wrapper(*args, **kwargs):
+            counts[name] = counts.get(name, 0) + 1
+            return func(*args, **kwargs)
+        return wrapper
+
+    for name, func in originals.items():
+        setattr(os, name, wrap(name, func))
+    try:
+        yield counts
+    finally:
+        for name, func in originals.items():
+            setattr(os, name, func)
+
+
+def run(label: str, func, scan_dir: Path, depth: int) -> list[str]:
+    """Run one strategy and print its timing and syscall counts."""
+    counts = {}
+    with count_syscalls(counts):
+        start = time.perf_counter()
+        result = func(scan_dir, depth)
+        elapsed = time.perf_counter() - start
+    total = sum(counts.values())
+    detail = ", ".join(f"{k}={v}" for k, v in sorted(counts.items()))
+    print(f"{label:<10} {elapsed:8.3f}s  syscalls={total:<8} ({detail})  "
+          f"projects={len(result)}")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=500)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scan_dir = Path(tmp)
+        build_tree(scan_dir, args.projects)
+        legacy = run("legacy", legacy_scan, scan_dir, args.depth)
+        walker = run("walker", walker_scan, scan_dir, args.depth)
+        parallel = run(
+            f"walker-{args.workers}",
+            lambda d, n: parallel_scan(d, n, args.workers),
+            scan_dir, args.depth,
+        )
+        assert sorted(legacy) == sorted(walker), "results differ"
+        assert parallel == walker, "parallel walk differs from serial"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""Tech stack detection for ``proj inv analyze``.
+
+analyze_project() lists a local project's root once and matches the
+detector registry (proj.detectors) against that listing. Detection is
+I/O bound, so analyze_inventory() runs it in a thread pool over batches
+of entries. Results are written back on the calling thread in inventory
+order, so the saved inventory is identical whatever the number of
+workers. Lockfiles found in the root are streamed by proj.lockfiles into
+a ``dependencies`` inventory (lockfile name -> ``[name, version]`` pairs).
+
+With ``--loc``, analyze_inventory_loc() also stores each entry's files
+and lines per language (proj.loc) under ``loc``; ranked_languages()
+puts languages with the most code first.
+
+Each analyzed entry keeps an ``analysis_fingerprint``: the mtime and
+inode of its root directory, which change whenever an entry is added,
+removed or renamed, plus the mtime, size and inode of the files whose
+contents detection reads. An entry whose fingerprint is unchanged since
+its last analysis is skipped unless ``force`` is set, at the cost of a
+couple of stats instead of a listing.
+"""
+
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+from proj.detectors import (
+    CATEGORIES, DetectorIndex, list_root, package_dependencies,
+)
+from proj.lockfiles import LOCKFILES, read_lockfile
+from proj.loc import LocCounter
+
+# Entries analyzed per task; also how often progress is reported
+BATCH_SIZE = 32
+
+# Bump when detection changes so stored results are recomputed
+ANALYZER_VERSION = 3
+
+# Files whose contents (not just presence) detection depends on
+CONTENT_FILES = ("package.json", *LOCKFILES)
+
+# Returned (by identity) for entries whose fingerprint still matches
+UNCHANGED = {"unchanged": True}
+
+DEFAULT_INDEX = DetectorIndex()
+
+
+@dataclass
+class AnalyzeStats:
+    """Counts from one analyze run."""
+
+    analyzed: int = 0
+    unchanged: int = 0
+    skipped: int = 0  # no local path, or it no longer exists
+
+
+def _root_stat(root: Path) -> Optional[os.stat_result]:
+    """Stat a project root, or None if it is gone or not a directory."""
+    try:
+        root_stat = os.stat(root)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(root_stat.st_mode):
+        return None
+    return root_stat
+
+
+def _fingerprint(
+    root: Path, root_stat: os.stat_result, names: Iterable[str]
+) -> dict:
+    """Build a fingerprint from a root stat and its content files."""
+    files = {}
+    for name in names:
+        try:
+            st = os.stat(root / name)
+        except OSError:
+            continue
+        files[name] = [st.st_mtime_ns, st.st_size, st.st_ino]
+    return {
+        "version": ANALYZER_VERSION,
+        "dir": [root_stat.st_mtime_ns, root_stat.st_ino],
+        "files": files,
+    }
+
+
+def manifest_fingerprint(
+    root: Path, names: Iterable[str] = CONTENT_FILES
+) -> Optional[dict]:
+    """Fingerprint what detection depends on, or None if root is gone.
+
+    Adding, removing or renaming any file in the root changes the
+    directory's mtime; rewriting a content file changes its own stat.
+    A new ANALYZER_VERSION changes every fingerprint.
+
+    Args:
+        root: Project root
+        names: Content files to stat; missing ones are left out
+    """
+    root_stat = _root_stat(root)
+    if root_stat is None:
+        return None
+    return _fingerprint(root, root_stat, names)
+
+
+def analyze_project(
+    local_path: Optional[str],
+    index: DetectorIndex = DEFAULT_INDEX,
+    listing: Optional[tuple[list[str], list[str]]] = None,
+) -> Optional[dict]:
+    """Detect a local project's languages, frameworks and build systems.
+
+    Costs one ``os.scandir`` of the root, plus reading ``package.json``
+    and any lockfiles present.
+
+    Args:
+        local_path: Project root
+        index: Detector registry to match
+        listing: The root's list_root() result, if already listed
+
+    Returns:
+        Detected names by category (see detectors.CATEGORIES) and
+        ``dependencies`` by lockfile, or None when the entry has no
+        local path or it cannot be listed
+    """
+    if not local_path:
+        return None
+    root = Path(local_path)
+    if listing is None:
+        listing = list_root(root)
+    if listing is None:
+        return None
+    files, dirs = listing
+    dependencies = []
+    if "package.json" in files:
+        dependencies = package_dependencies(root / "package.json")
+    result = index.match(files, dirs, dependencies)
+    result["dependencies"] = {
+        name: read_lockfile(root / name)
+        for name in sorted(files) if name in LOCKFILES
+    }
+    return result
+
+
+def analyze_entry(project: dict, force: bool = False) -> Optional[dict]:
+    """Analyze an inventory entry unless its fingerprint still matches.
+
+    Returns:
+        An analyze_project() result with its ``fingerprint``, UNCHANGED,
+        or None when the entry has no existing local path
+    """
+    local_path = project.get("local_path")
+    if not local_path:
+        return None
+    root = Path(local_path)
+    # Stat the root before listing it: an entry added in between changes
+    # the stored mtime, so the next run analyzes again
+    root_stat = _root_stat(root)
+    if root_stat is None:
+        return None
+    stored = project.get("analysis_fingerprint")
+    if not force and project.get("analyzed") and stored:
+        # While the root's mtime is unchanged no content file can have
+        # been added or removed, so only the stored ones need a stat
+        if _fingerprint(root, root_stat, stored["files"]) == stored:
+            return UNCHANGED
+    listing = list_root(root)
+    if listing is None:
+        return None
+    # Only content files present in the listing need a stat
+    present = [name for name in listing[0] if name in CONTENT_FILES]
+    fingerprint = _fingerprint(root, root_stat, sorted(present))
+    result = analyze_project(local_path, listing=listing)
+    if result is None:
+        return None
+    result["fingerprint"] = fingerprint
+    return result
+
+
+def apply_analysis(project: dict, result: Optional[dict]) -> None:
+    """Store an analyze_entry() result on its inventory entry.
+
+    Detected lists replace earlier ones; keys whose list came out empty
+    are dropped so re-analysis clears stale values.
+    """
+    if result is None or result is UNCHANGED:
+        return
+    for key in (*CATEGORIES, "dependencies"):
+        if result[key]:
+            project[key] = result[key]
+        else:
+            project.pop(key, None)
+    project["analyzed"] = True
+    project["analysis_fingerprint"] = result["fingerprint"]
+
+
+def _batches(items: list, size: int) -> Iterator[list]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def analyze_inventory(
+    inventory: list[dict],
+    jobs: int = 1,
+    on_progress: Optional[Callable[[int], None]] = None,
+    batch_size: int = BATCH_SIZE,
+    force: bool = False,
+) -> AnalyzeStats:
+    """Analyze inventory entries in place.
+
+    Args:
+        inventory: Entries to analyze; updated in place
+        jobs: Worker threads (1 analyzes on the calling thread)
+        on_progress: Called with the number of entries finished, once
+            per batch rather than once per entry
+        batch_size: Largest number of entries per task; smaller batches
+            are used when there are too few to keep every worker busy
+        force: Re-analyze entries whose fingerprint still matches
+
+    Returns:
+        Counts of analyzed, unchanged and skipped entries
+    """
+
+    def analyze_batch(batch: list[dict]) -> list[Optional[dict]]:
+        return [analyze_entry(project, force) for project in batch]
+
+    jobs = max(1, jobs)
+    # Aim for several batches per worker so slow entries even out
+    size = max(1, min(batch_size, -(-len(inventory) // (jobs * 4))))
+    batches = list(_batches(inventory, size))
+
+    stats = AnalyzeStats()
+
+    def write_back(results: Iterable[tuple[list, list]]) -> None:
+        for batch, batch_results in results:
+            for project, result in zip(batch, batch_results):
+                if result is None:
+                    stats.skipped += 1
+                elif result is UNCHANGED:
+                    stats.unchanged += 1
+                else:
+                    apply_analysis(project, result)
+                    stats.analyzed += 1
+            if on_progress is not None:
+                on_progress(len(batch))
+
+    if jobs == 1:
+        write_back((batch, analyze_batch(batch)) for batch in batches)
+        return stats
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        # map() yields in submission order: write-back is deterministic
+        write_back(zip(batches, executor.map(analyze_batch, batches)))
+    return stats
+
+
+def analyze_inventory_loc(
+    inventory: list[dict],
+    counter: LocCounter,
+    on_progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Count lines of code per language for local inventory entries.
+
+    Projects are counted one after another, each spread over the
+    counter's worker pool. Entries without an existing local path are
+    left alone.
+
+    Returns:
+        Number of entries counted
+    """
+    counted = 0
+    for project in inventory:
+        local_path = project.get("local_path")
+        loc = counter.count(local_path) if local_path else None
+        if loc is not None:
+            project["loc"] = loc
+            counted += 1
+        if on_progress is not None:
+            on_progress(1)
+    return counted
+
+
+def ranked_languages(project: dict) -> list[str]:
+    """An entry's languages, those with the most lines of code first.
+
+    Without ``loc`` this is the detected ``languages`` list. With it,
+    counted languages come first by line count, followed by detected
+    ones that have no counted source (e.g. from a manifest alone).
+    """
+    counted = [
+        language for language, counts in project.get("loc", {}).items()
+        if counts.get("lines")
+    ]
+    detected = project.get("languages", [])
+    return counted + [lang for lang in detected if lang not in counted]
@@ -1,11 +1,20 @@
 """API client for work-prod backend."""
 
-from typing import Dict, List, Optional
+import time
+from typing import Callable, Dict, List, Optional
 
 import requests
 
 from proj.config import Config
 from proj.error_handler import APIError, BackendConnectionError, TimeoutError
+from proj.retry import RETRY_STATUSES, CircuitBreaker, RetryPolicy
+from proj.transport import Transport, get_transport
+
+# Sent with every request; the shared session carries no API headers
+JSON_HEADERS = {
+    'Content-Type': 'application/json',
+    'Accept': 'application/json'
+}
 
 
 def _raise_api_error(
@@ -41,19 +50,39 @@ def _raise_api_error(
 class APIClient:
     """Client for interacting with work-prod API."""
 
-    def __init__(self, config: Optional[Config] = None):
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        transport: Optional[Transport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
         """Initialize client with config.
 
         Args:
             config: Config instance (uses Config.load() if not provided)
+            transport: Connection pool and timeout policy (the shared
+                process-wide transport if not provided)
+            retry_policy: Retry policy (from config if not provided)
+            circuit_breaker: Breaker shared by this client's requests
+                (from config if not provided)
+            sleep: Sleep function used between retries
         """
         self.config = config or Config.load()
         self.base_url = self._normalize_url(self.config.api_url)
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        })
+        self.transport = transport or get_transport(self.config)
+        self.retry_policy = retry_policy or RetryPolicy(
+            retries=self.config.api_retries,
+            backoff=self.config.api_retry_backoff,
+            max_delay=self.config.api_retry_max_delay,
+            retry_patch=self.config.api_retry_patch,
+        )
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            threshold=self.config.api_circuit_threshold,
+            reset_after=self.config.api_circuit_reset,
+        )
+        self._sleep = sleep
 
     def _normalize_url(self, url: str) -> str:
         """Normalize API URL, handling None, whitespace, and missing scheme."""
@@ -68,6 +97,71 @@ class APIClient:
         """Build full URL for API path."""
         return f"{self.base_url}/api{path}"
 
+    def _request(
+        self, method: str, path: str, bulk: bool = False, **kwargs
+    ) -> requests.Response:
+        """Send a request to an API path through the transport.
+
+        Idempotent requests are retried per the retry policy after
+        connection errors, timeouts and 429/502/503/504 responses.
+        Connection failures count towards the circuit breaker; while it
+        is open requests fail without being sent. A half-open trial that
+        ends any other way (e.g. an invalid URL) is released, so the next
+        request becomes the trial.
+
+        Raises:
+            CircuitOpenError: The circuit breaker is open
+            BackendConnectionError, TimeoutError, APIError: See
+                _raise_api_error()
+        """
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+        attempt = 0
+        while True:
+            trial = breaker.before_request()
+            try:
+                try:
+                    response = self.transport.request(
+                        method,
+                        self._url(path),
+                        bulk=bulk,
+                        headers=JSON_HEADERS,
+                        **kwargs
+                    )
+                except (
+                    requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout,
+                ) as e:
+                    breaker.record_failure()
+                    delay = None
+                    if policy.can_retry(method, attempt):
+                        delay = policy.delay(attempt)
+                    if delay is None:
+                        _raise_api_error(e)
+                except requests.exceptions.RequestException as e:
+                    _raise_api_error(e, getattr(e, 'response', None))
+                else:
+                    breaker.record_success()
+                    delay = None
+                    if (
+                        response.status_code in RETRY_STATUSES
+                        and policy.can_retry(method, attempt)
+                    ):
+                        delay = policy.delay(attempt, response)
+                    if delay is None:
+                        try:
+                            response.raise_for_status()
+                        except requests.exceptions.HTTPError as e:
+                            _raise_api_error(e, response)
+                        return response
+            finally:
+                if trial:
+                    # No-op after record_success/record_failure
+                    breaker.release_trial()
+
+            self._sleep(delay)
+            attempt += 1
+
     def list_projects(
         self,
         status: Optional[str] = None,
@@ -96,17 +190,7 @@ class APIClient:
         if search:
             params["search"] = search
 
-        try:
-            response = self.session.get(
-                self._url("/projects"),
-                params=params,
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            response = getattr(e, 'response', None)
-            _raise_api_error(e, response)
+        return self._request("GET", "/projects", params=params).json()
 
     def get_project(self, project_id: int) -> Dict:
         """Get a single project by ID.
@@ -117,16 +201,7 @@ class APIClient:
         Returns:
             Project dictionary
         """
-        try:
-            response = self.session.get(
-                self._url(f"/projects/{project_id}"),
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            response = getattr(e, 'response', None)
-            _raise_api_error(e, response)
+        return self._request("GET", f"/projects/{project_id}").json()
 
     def create_project(self, data: Dict) -> Dict:
         """Create a new project.
@@ -137,17 +212,7 @@ class APIClient:
         Returns:
             Created project dictionary
         """
-        try:
-            response = self.session.post(
-                self._url("/projects"),
-                json=data,
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            response = getattr(e, 'response', None)
-            _raise_api_error(e, response)
+        return self._request("POST", "/projects", json=data).json()
 
     def update_project(self, project_id: int, data: Dict) -> Dict:
         """Update an existing project.
@@ -159,17 +224,11 @@ class APIClient:
         Returns:
             Updated project dictionary
         """
-        try:
-            response = self.session.patch(
-                self._url(f"/projects/{project_id}"),
-                json=data,
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            response = getattr(e, 'response', None)
-            _raise_api_error(e, response)
+        return self._request(
+            "PATCH",
+            f"/projects/{project_id}",
+            json=data
+        ).json()
 
     def delete_project(self, project_id: int) -> None:
         """Delete a project permanently.
@@ -177,15 +236,7 @@ class APIClient:
         Args:
             project_id: ID of the project to delete
         """
-        try:
-            response = self.session.delete(
-                self._url(f"/projects/{project_id}"),
-                timeout=10
-            )
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            response = getattr(e, 'response', None)
-            _raise_api_error(e, response)
+        self._request("DELETE", f"/projects/{project_id}")
 
     def search_projects(self, query: str) -> List[Dict]:
         """Search projects by query.
@@ -196,17 +247,11 @@ class APIClient:
         Returns:
             List of matching projects
         """
-        try:
-            response = self.session.get(
-                self._url("/projects"),
-                params={"search": query},
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            response = getattr(e, 'response', None)
-            _raise_api_error(e, response)
+        return self._request(
+            "GET",
+            "/projects",
+            params={"search": query}
+        ).json()
 
     def import_projects(self, projects: List[Dict]) -> Dict:
         """Import multiple projects from JSON data.
@@ -217,17 +262,12 @@ class APIClient:
         Returns:
             Dictionary with import statistics: imported, skipped, errors
         """
-        try:
-            response = self.session.post(
-                self._url("/projects/import"),
-                json={"projects": projects},
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            response = getattr(e, 'response', None)
-            _raise_api_error(e, response)
+        return self._request(
+            "POST",
+            "/projects/import",
+            json={"projects": projects},
+            bulk=True
+        ).json()
 
     def archive_project(self, project_id: int) -> Dict:
         """Archive a project.
@@ -240,13 +280,4 @@ class APIClient:
         Returns:
             Archived project dictionary
         """
-        try:
-            response = self.session.put(
-                self._url(f"/projects/{project_id}/archive"),
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            response = getattr(e, 'response', None)
-            _raise_api_error(e, response)
+        return self._request("PUT", f"/projects/{project_id}/archive").json()
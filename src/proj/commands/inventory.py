@@ -2,8 +2,15 @@
 import json
 import logging
 import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
+from urllib.parse import urlsplit
 
 import requests
 import click
@@ -14,10 +21,25 @@ from rich.progress import (
 )
 from rich.table import Table
 
-from proj.config import Config, get_data_dir
+from proj.analyzer import (
+    analyze_inventory, analyze_inventory_loc, ranked_languages,
+)
+from proj.config import Config, get_cache_dir, get_data_dir
 from proj.error_handler import (
     handle_error, APIError, BackendConnectionError, TimeoutError
 )
+from proj.forges import (
+    FORGES, ForgeClient, GiteaClient, GitHubClient, GitLabClient,
+    GraphQLError, RateLimiter, RateLimitError,
+)
+from proj.gitmeta import GitConfigError, GitMetadataReader
+from proj.http_cache import HTTPCache, credential_identity
+from proj.loc import LocCache, LocCounter
+from proj.scanner import (
+    PathTrie, ScanBudget, ScanCache, ScanFilter, ScanJournal, ScanStats,
+    walk_projects,
+)
+from proj.transport import Transport, get_transport
 
 console = Console()
 logger = logging.getLogger(__name__)
@@ -58,6 +80,97 @@ def get_inventory_file() -> Path:
     return get_data_dir() / "inventory.json"
 
 
+def get_scan_cache_file() -> Path:
+    """Get path to the local scan cache file."""
+    return get_data_dir() / "scan_cache.json"
+
+
+def get_loc_cache_file() -> Path:
+    """Get path to the per-file line count cache."""
+    return get_data_dir() / "loc_cache.json"
+
+
+def get_scan_journal_file() -> Path:
+    """Get path to the resumable local scan journal."""
+    return get_data_dir() / "scan_journal.json"
+
+
+def get_forge_sync_file() -> Path:
+    """Get path to forge sync high-water marks."""
+    return get_data_dir() / "forge_sync.json"
+
+
+def get_legacy_sync_file() -> Path:
+    """Get path to sync marks written before GitLab and Gitea support."""
+    return get_data_dir() / "github_sync.json"
+
+
+def load_forge_sync() -> dict:
+    """Load forge sync state, keyed by API root and owner.
+
+    Falls back to the legacy ``github_sync.json`` until the first save.
+    """
+    for sync_file in (get_forge_sync_file(), get_legacy_sync_file()):
+        try:
+            with open(sync_file, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            continue
+        except (OSError, json.JSONDecodeError):
+            return {}
+    return {}
+
+
+def save_forge_sync(state: dict) -> None:
+    """Save forge sync state."""
+    sync_file = get_forge_sync_file()
+    sync_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(sync_file, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+
+
+def forge_jobs(config: Config, jobs: Optional[int] = None) -> int:
+    """Concurrent requests for a forge scan.
+
+    ``--jobs`` wins, then ``forge_jobs``, then the older ``github_jobs``.
+    """
+    return max(1, jobs or config.forge_jobs or config.github_jobs)
+
+
+def forge_max_wait(config: Config) -> float:
+    """Longest rate limit wait for a forge scan."""
+    if config.forge_max_wait is not None:
+        return config.forge_max_wait
+    return config.github_max_wait
+
+
+def get_rate_limit_file(forge: str) -> Path:
+    """Get path to the last rate limit seen from a forge."""
+    return get_data_dir() / f"{forge}_rate_limit.json"
+
+
+def save_rate_limit(forge: str, quota: dict) -> None:
+    """Record the quota reported by the last request to a forge."""
+    rate_file = get_rate_limit_file(forge)
+    rate_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(rate_file, "w", encoding="utf-8") as f:
+        json.dump({**quota, "checked_at": time.time()}, f)
+
+
+def load_rate_limit(forge: str) -> Optional[dict]:
+    """Load the last recorded quota of a forge, if any."""
+    try:
+        with open(get_rate_limit_file(forge), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def get_http_cache_dir() -> Path:
+    """Get directory of cached API responses."""
+    return get_cache_dir() / "http"
+
+
 def load_inventory() -> list[dict]:
     """Load inventory from data file."""
     inv_file = get_inventory_file()
@@ -86,126 +199,718 @@ def save_inventory(data: list[dict]) -> None:
         json.dump(data, f, indent=2)
 
 
+class JsonlWriter:
+    """Write inventory items as newline-delimited JSON as they are found.
+
+    ``target`` is a file path, or ``-`` for stdout. Every line is flushed
+    at once so consumers such as jq can start before the scan ends.
+    Writes are serialized, so concurrent scan threads may share a writer.
+    """
+
+    def __init__(self, target: str, append: bool = False):
+        self.target = target
+        self.count = 0
+        self._lock = threading.Lock()
+        if target == "-":
+            self._file = sys.stdout
+        else:
+            mode = "a" if append else "w"
+            self._file = open(target, mode, encoding="utf-8")
+
+    def write(self, item: dict) -> None:
+        """Write one item as a JSON line."""
+        line = json.dumps(item, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            self.count += 1
+
+    def close(self) -> None:
+        """Close the output file (stdout is left open)."""
+        if self._file is not sys.stdout:
+            self._file.close()
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def get_status_console(jsonl: Optional[str]) -> Console:
+    """Console for progress and messages.
+
+    Status output moves to stderr while items stream to stdout.
+    """
+    if jsonl == "-":
+        return Console(stderr=True)
+    return console
+
+
+def get_remote_url(
+    root: Path, reader: GitMetadataReader, stats: ScanStats
+) -> str:
+    """Get the origin URL of a repository, preferring the native reader.
+
+    Falls back to ``git remote get-url origin`` only when the repository's
+    config cannot be parsed.
+    """
+    try:
+        remote_url = reader.remote_url(root)
+        stats.git_subprocess_avoided += 1
+        return remote_url or ""
+    except GitConfigError as e:
+        logger.debug(f"Native git metadata failed for {root}: {e}")
+
+    stats.git_subprocess_calls += 1
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(root), "remote", "get-url", "origin"],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+    except Exception:
+        pass
+    return ""
+
+
+def iter_root_items(
+    scan_dir: Path,
+    depth: int,
+    git_reader: GitMetadataReader,
+    stats: ScanStats,
+    skip: frozenset = frozenset(),
+    **walk_options,
+) -> Iterator[dict]:
+    """Yield inventory items for one root as the walk finds them.
+
+    Args:
+        scan_dir: Root directory to walk
+        depth: Max depth of a project root
+        git_reader: Shared git metadata reader
+        stats: Counters for this root, updated in place
+        skip: Project paths not to report (e.g. already streamed before
+            a resume)
+        **walk_options: Passed through to walk_projects (cache, workers,
+            ignore, state, budget, ...)
+
+    Yields:
+        Inventory item dicts in walk order
+    """
+    for found in walk_projects(
+        scan_dir, depth, stats=stats, **walk_options
+    ):
+        root = found.path
+        if root in skip:
+            continue
+
+        remote_url = ""
+        if found.marker == ".git":
+            remote_url = get_remote_url(root, git_reader, stats)
+
+        yield {
+            "name": root.name,
+            "local_path": str(root),
+            "remote_url": remote_url,
+            "source": "local",
+            "marker": found.marker,
+        }
+
+
+def scan_root(
+    scan_dir: Path,
+    depth: int,
+    git_reader: GitMetadataReader,
+    **walk_options,
+) -> tuple[list[dict], ScanStats]:
+    """Scan a single root for projects.
+
+    Returns:
+        Tuple of (inventory items in walk order, stats for this root)
+    """
+    stats = ScanStats()
+    projects = list(
+        iter_root_items(scan_dir, depth, git_reader, stats, **walk_options)
+    )
+    return projects, stats
+
+
+def merge_scan_results(
+    per_root: list[tuple[Path, list[dict]]]
+) -> list[dict]:
+    """Merge per-root scan results, in root order, for overlapping roots.
+
+    A path reported by several roots is kept once. A non-git project that
+    sits inside a repository reported by a *different* root is dropped as
+    a subproject, mirroring what the walker does within a single root.
+    """
+    index = PathTrie()  # local_path -> (item, roots reporting it)
+    ordered = []
+    for scan_dir, items in per_root:
+        for item in items:
+            entry = index.get(item["local_path"])
+            if entry is not None:
+                entry[1].add(scan_dir)
+                continue
+            index.insert(item["local_path"], (item, {scan_dir}))
+            ordered.append((scan_dir, item))
+
+    merged = []
+    for scan_dir, item in ordered:
+        if item["marker"] != ".git" and any(
+            parent["marker"] == ".git" and roots != {scan_dir}
+            for parent, roots in index.ancestors(item["local_path"])
+        ):
+            continue
+        merged.append(item)
+    return merged
+
+
+class ScanResultStream:
+    """Streaming counterpart of merge_scan_results.
+
+    Items are written as soon as they arrive, so the checks can only look
+    at projects already written: a duplicate path is dropped, and so is a
+    non-git project inside a repository another root already reported.
+    Only paths are kept in memory, never the items themselves.
+    """
+
+    def __init__(self, writer: JsonlWriter):
+        self.writer = writer
+        self._index = PathTrie()  # local_path -> (marker, scan_dir)
+        self._lock = threading.Lock()
+
+    def add(self, scan_dir: Path, item: dict) -> bool:
+        """Write an item unless it duplicates one already written."""
+        path = item["local_path"]
+        with self._lock:
+            if path in self._index:
+                return False
+            if item["marker"] != ".git" and any(
+                marker == ".git" and root != scan_dir
+                for marker, root in self._index.ancestors(path)
+            ):
+                return False
+            self._index.insert(path, (item["marker"], scan_dir))
+        self.writer.write(item)
+        return True
+
+
+def upsert_forge_items(
+    existing: list[dict], items: list[dict]
+) -> list[dict]:
+    """Merge scanned forge items, replacing entries for the same repo.
+
+    An entry is replaced only by an item from the same forge
+    (``scan_source``); local entries for a clone are left alone.
+    """
+    by_key = {
+        (item["scan_source"], item["remote_url"]): item for item in items
+    }
+    merged = []
+    for entry in existing:
+        key = (entry.get("scan_source"), entry.get("remote_url"))
+        replacement = by_key.pop(key, None)
+        if replacement is not None:
+            merged.append({**entry, **replacement})
+            continue
+        merged.append(entry)
+    merged.extend(by_key.values())
+    return merged
+
+
+def print_request_stats(out: Console, client: ForgeClient) -> None:
+    """Print how many API requests a scan made and how many were cached."""
+    out.print(
+        f"[dim]{client.requests_made} API requests, "
+        f"{client.not_modified} not modified (served from cache)[/dim]"
+    )
+
+
+def describe_forge_error(error: Exception) -> str:
+    """One-line description of a failed owner scan."""
+    if isinstance(error, RateLimitError):
+        if error.reset_at:
+            reset = datetime.fromtimestamp(error.reset_at)
+            return f"rate limited until {reset:%H:%M}"
+        return "rate limited"
+    if isinstance(error, requests.exceptions.HTTPError):
+        if error.response is not None:
+            response = error.response
+            return f"HTTP {response.status_code} {response.reason}"
+    if isinstance(error, requests.exceptions.ConnectionError):
+        return "connection failed"
+    if isinstance(error, requests.exceptions.Timeout):
+        return "timed out"
+    return str(error)
+
+
+@dataclass
+class OwnerScan:
+    """Progress and outcome of scanning one forge owner."""
+
+    kind: str  # one of the client's owner_kinds, e.g. "users" or "orgs"
+    login: str
+    since: Optional[str] = None
+    items: list[dict] = field(default_factory=list)
+    count: int = 0
+    error: Optional[str] = None
+
+    @property
+    def sync_key(self) -> str:
+        """Listing path identifying this owner's sync mark."""
+        return f"{self.kind}/{self.login}"
+
+
+def scan_forge_owner(
+    client: ForgeClient,
+    scan: OwnerScan,
+    graphql: bool = False,
+    emit: Optional[Callable[[dict], None]] = None,
+) -> None:
+    """List one owner's repos, never raising for API failures.
+
+    Items go to ``emit`` when streaming, else collect in ``scan.items``.
+    Repos listed before a failure are kept and ``scan.error`` is set.
+    ``graphql`` is only supported by GitHubClient.
+    """
+    if graphql:
+        repos = client.iter_repos_graphql(scan.login, since=scan.since)
+        repo_item = client.graphql_repo_item
+    else:
+        repos = client.iter_repos(
+            scan.login, since=scan.since, kind=scan.kind
+        )
+        repo_item = client.repo_item
+    try:
+        for repo in repos:
+            item = repo_item(repo)
+            item["scan_source"] = client.name
+            item["owner"] = scan.login
+            if emit is not None:
+                emit(item)
+            else:
+                scan.items.append(item)
+            scan.count += 1
+    except (requests.RequestException, RateLimitError, GraphQLError) as e:
+        logger.debug(f"{client.title} scan of {scan.login} failed: {e}")
+        scan.error = describe_forge_error(e)
+
+
+def print_owner_results(
+    out: Console, title: str, scans: list[OwnerScan]
+) -> None:
+    """Print per-owner repo counts and failures."""
+    table = Table(title=f"{title} Owners")
+    table.add_column("Owner", style="cyan")
+    table.add_column("Type")
+    table.add_column("Repos", justify="right")
+    table.add_column("Status")
+    for scan in scans:
+        if scan.error:
+            status = f"[red]{scan.error}[/red]"
+            if scan.count:
+                status += " [yellow](partial)[/yellow]"
+        elif scan.since:
+            status = f"[green]changed since {scan.since}[/green]"
+        else:
+            status = "[green]ok[/green]"
+        # "users" -> "user", "orgs" -> "org", "groups" -> "group"
+        table.add_row(scan.login, scan.kind[:-1], str(scan.count), status)
+    out.print(table)
+
+
+def run_forge_scan(
+    client_class: type[ForgeClient],
+    out: Console,
+    owners: dict[str, list[str]],
+    token: Optional[str],
+    api_url: str,
+    output: Optional[Path] = None,
+    jsonl: Optional[str] = None,
+    jobs: int = 4,
+    no_cache: bool = False,
+    full: bool = False,
+    graphql: bool = False,
+    max_wait: float = 900,
+    transport: Optional[Transport] = None,
+) -> None:
+    """Scan forge owners concurrently and store or stream their repos.
+
+    Shared by the ``scan github``/``gitlab``/``gitea`` commands. Owners
+    share one client, so requests are pooled, cached, rate-limited and
+    capped at ``jobs`` across all of them.
+
+    Args:
+        client_class: Forge client to scan with
+        out: Status console
+        owners: Logins to scan by owner kind (e.g. ``{"orgs": [...]}``)
+        token: Access token (anonymous if None)
+        api_url: API root
+        output: Write repos to this JSON file instead of the inventory
+        jsonl: Stream repos as JSON lines to a file or ``-``
+        jobs: Maximum concurrent requests
+        no_cache: Skip HTTP cache revalidation
+        full: List every repo even when the forge supports ``since``
+        graphql: Use GitHubClient's GraphQL listing
+        max_wait: Longest rate limit wait before an owner fails
+        transport: Shared connection pool (a private one if None)
+
+    Raises:
+        typer.Exit: One or more owners failed (exit code 1)
+    """
+    title = client_class.title
+    # Incremental sync applies to inventory updates only
+    incremental = (
+        client_class.supports_since and not output and not jsonl and not full
+    )
+    sync_state = load_forge_sync()
+    api_url = api_url.rstrip("/")
+    scans = []
+    for kind in client_class.owner_kinds:
+        for login in dict.fromkeys(owners.get(kind) or []):
+            scan = OwnerScan(kind, login)
+            if incremental:
+                mark = sync_state.get(f"{api_url}/{scan.sync_key}", {})
+                scan.since = mark.get("updated_at")
+            scans.append(scan)
+
+    total_jobs = max(1, jobs)
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=out,
+    ) as progress:
+        task = progress.add_task(
+            f"Scanning {len(scans)} {title} owner(s)...", total=len(scans)
+        )
+        cache = None
+        if not no_cache:
+            cache = HTTPCache(
+                get_http_cache_dir(), credential_identity(token)
+            )
+
+        def on_wait(delay: float) -> None:
+            desc = f"Rate limited; waiting {delay:.0f}s..."
+            progress.update(task, description=desc)
+
+        limiter = RateLimiter(max_wait=max_wait, on_wait=on_wait)
+        client = client_class(
+            token=token,
+            api_url=api_url,
+            jobs=total_jobs,
+            cache=cache,
+            rate_limiter=limiter,
+            transport=transport,
+        )
+        writer = JsonlWriter(jsonl) if jsonl else None
+        emit = writer.write if writer else None
+
+        def scan_one(scan: OwnerScan) -> None:
+            scan_forge_owner(client, scan, graphql, emit)
+            progress.update(
+                task, advance=1, description=f"Scanned {scan.login}"
+            )
+
+        # Owners share the client's pool; requests are capped globally
+        try:
+            with ThreadPoolExecutor(
+                max_workers=min(total_jobs, len(scans))
+            ) as executor:
+                list(executor.map(scan_one, scans))
+        finally:
+            client.close()
+            if writer is not None:
+                writer.close()
+            if limiter.remaining is not None:
+                save_rate_limit(client.name, limiter.snapshot())
+
+    print_owner_results(out, title, scans)
+    total = sum(scan.count for scan in scans)
+    failed = [scan for scan in scans if scan.error]
+
+    if writer is not None:
+        target = "stdout" if jsonl == "-" else jsonl
+        out.print(f"[green]✓ Streamed {total} repos to {target}[/green]")
+    elif output:
+        inventory_items = [item for scan in scans for item in scan.items]
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(inventory_items, f, indent=2)
+        out.print(f"[green]✓ Saved {total} repos to {output}[/green]")
+    else:
+        # Changed repos replace their previous entries
+        inventory_items = [item for scan in scans for item in scan.items]
+        combined = upsert_forge_items(load_inventory(), inventory_items)
+        save_inventory(combined)
+
+        # Advance high-water marks only for owners synced completely
+        if incremental:
+            for scan in scans:
+                newest = max(
+                    [scan.since or ""]
+                    + [item["updated_at"] or "" for item in scan.items]
+                )
+                if newest and scan.error is None:
+                    key = f"{api_url}/{scan.sync_key}"
+                    sync_state[key] = {"updated_at": newest}
+            save_forge_sync(sync_state)
+        out.print(
+            f"[green]✓ Added {total} {title} repos to inventory[/green]"
+        )
+
+    print_request_stats(out, client)
+    if failed:
+        msg = (
+            f"[yellow]Warning: {len(failed)} of {len(scans)} owner(s) "
+            f"failed; repos fetched before the failure were kept.[/yellow]"
+        )
+        out.print(msg)
+        raise typer.Exit(1)
+
+
+def forge_token_warning(out: Console, title: str) -> None:
+    """Warn that an anonymous scan is subject to low rate limits."""
+    out.print(
+        f"[yellow]Warning: No {title} token set. "
+        "Rate limits may apply.[/yellow]"
+    )
+
+
 @scan_app.command(name="github")
 def scan_github(
-    username: Optional[str] = typer.Option(
-        None, "--user", "-u", help="GitHub username"
+    username: Optional[list[str]] = typer.Option(
+        None, "--user", "-u", help="GitHub username (repeatable)"
+    ),
+    org: Optional[list[str]] = typer.Option(
+        None, "--org", help="GitHub organization (repeatable)"
     ),
     output: Optional[Path] = typer.Option(
         None, "--output", "-o", help="Output file"
     ),
+    jsonl: Optional[str] = typer.Option(
+        None, "--jsonl",
+        help="Stream repos as JSON lines to a file ('-' for stdout) "
+        "instead of updating the inventory"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j",
+        help="Maximum concurrent requests across all owners"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache",
+        help="Do not revalidate against or update the HTTP cache"
+    ),
+    full: bool = typer.Option(
+        False, "--full",
+        help="List every repo instead of only those changed since the "
+        "last sync"
+    ),
+    graphql: bool = typer.Option(
+        False, "--graphql",
+        help="Use the GraphQL API: 100 repos per query with languages, "
+        "topics, archived/fork flags and last commit dates"
+    ),
 ):
-    """Scan GitHub repositories for a user."""
+    """Scan GitHub repositories for users and organizations."""
     config = get_config()
+    out = get_status_console(jsonl)
 
-    # Get username from option or config
-    gh_user = username or config.github_username
-    if not gh_user:
+    # Owners from options, else from config
+    if username or org:
+        users, orgs = username or [], org or []
+    else:
+        users = list(config.github_users)
+        if config.github_username and config.github_username not in users:
+            users.insert(0, config.github_username)
+        orgs = list(config.github_orgs)
+    if not users and not orgs:
         msg = (
             "[red]Error: GitHub username required. "
-            "Use --user or set in config.[/red]"
+            "Use --user/--org or set in config.[/red]"
         )
-        console.print(msg)
+        out.print(msg)
         raise typer.Exit(1)
 
     # Check for GitHub token
     gh_token = config.github_token
-    if not gh_token:
+    if graphql and not gh_token:
         msg = (
-            "[yellow]Warning: No GitHub token set. "
-            "Rate limits may apply.[/yellow]"
+            "[red]Error: The GraphQL API requires a GitHub token. "
+            "Set github_token in config or PROJ_GITHUB_TOKEN.[/red]"
         )
-        console.print(msg)
+        out.print(msg)
+        raise typer.Exit(1)
+    if not gh_token:
+        forge_token_warning(out, "GitHub")
+
+    run_forge_scan(
+        GitHubClient,
+        out,
+        {"users": users, "orgs": orgs},
+        token=gh_token,
+        api_url=config.github_api_url,
+        output=output,
+        jsonl=jsonl,
+        jobs=forge_jobs(config, jobs),
+        no_cache=no_cache,
+        full=full,
+        graphql=graphql,
+        max_wait=forge_max_wait(config),
+        transport=get_transport(config),
+    )
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task(
-            f"Scanning GitHub repos for {gh_user}...", total=None
-        )
 
-        try:
-            url = f"https://api.github.com/users/{gh_user}/repos"
-            headers = {}
-            if gh_token:
-                headers["Authorization"] = f"token {gh_token}"
+@scan_app.command(name="gitlab")
+def scan_gitlab(
+    group: Optional[list[str]] = typer.Option(
+        None, "--group", "-g",
+        help="GitLab group full path, subgroups included (repeatable)"
+    ),
+    username: Optional[list[str]] = typer.Option(
+        None, "--user", "-u", help="GitLab username (repeatable)"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Output file"
+    ),
+    jsonl: Optional[str] = typer.Option(
+        None, "--jsonl",
+        help="Stream repos as JSON lines to a file ('-' for stdout) "
+        "instead of updating the inventory"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j",
+        help="Maximum concurrent requests across all owners"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache",
+        help="Do not revalidate against or update the HTTP cache"
+    ),
+    full: bool = typer.Option(
+        False, "--full",
+        help="List every project instead of only those active since the "
+        "last sync"
+    ),
+):
+    """Scan GitLab projects for groups and users."""
+    config = get_config()
+    out = get_status_console(jsonl)
 
-            params = {"per_page": 100, "sort": "updated"}
-            repos = []
+    if group or username:
+        groups, users = group or [], username or []
+    else:
+        groups, users = config.gitlab_groups, config.gitlab_users
+    if not groups and not users:
+        msg = (
+            "[red]Error: GitLab group or user required. "
+            "Use --group/--user or set gitlab_groups in config.[/red]"
+        )
+        out.print(msg)
+        raise typer.Exit(1)
+    if not config.gitlab_token:
+        forge_token_warning(out, "GitLab")
+
+    run_forge_scan(
+        GitLabClient,
+        out,
+        {"groups": groups, "users": users},
+        token=config.gitlab_token,
+        api_url=config.gitlab_api_url,
+        output=output,
+        jsonl=jsonl,
+        jobs=forge_jobs(config, jobs),
+        no_cache=no_cache,
+        full=full,
+        max_wait=forge_max_wait(config),
+        transport=get_transport(config),
+    )
 
-            while url:
-                response = requests.get(
-                    url, headers=headers, params=params, timeout=15
-                )
-                response.raise_for_status()
-                repos.extend(response.json())
 
-                # Check for pagination
-                url = response.links.get("next", {}).get("url")
-                params = {}  # Clear params for subsequent requests
+@scan_app.command(name="gitea")
+def scan_gitea(
+    org: Optional[list[str]] = typer.Option(
+        None, "--org", help="Gitea organization (repeatable)"
+    ),
+    username: Optional[list[str]] = typer.Option(
+        None, "--user", "-u", help="Gitea username (repeatable)"
+    ),
+    api_url: Optional[str] = typer.Option(
+        None, "--api-url",
+        help="Gitea API root, e.g. https://gitea.example.com/api/v1"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Output file"
+    ),
+    jsonl: Optional[str] = typer.Option(
+        None, "--jsonl",
+        help="Stream repos as JSON lines to a file ('-' for stdout) "
+        "instead of updating the inventory"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j",
+        help="Maximum concurrent requests across all owners"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache",
+        help="Do not revalidate against or update the HTTP cache"
+    ),
+):
+    """Scan repositories on a Gitea instance for orgs and users."""
+    config = get_config()
+    out = get_status_console(jsonl)
 
-            repo_count = len(repos)
-            desc = f"Found {repo_count} repositories"
-            progress.update(task, description=desc)
+    api_url = api_url or config.gitea_api_url
+    if not api_url:
+        msg = (
+            "[red]Error: Gitea API URL required. "
+            "Use --api-url or set gitea_api_url in config.[/red]"
+        )
+        out.print(msg)
+        raise typer.Exit(1)
+    if org or username:
+        orgs, users = org or [], username or []
+    else:
+        orgs, users = config.gitea_orgs, config.gitea_users
+    if not orgs and not users:
+        msg = (
+            "[red]Error: Gitea organization or user required. "
+            "Use --org/--user or set gitea_orgs in config.[/red]"
+        )
+        out.print(msg)
+        raise typer.Exit(1)
+    if not config.gitea_token:
+        forge_token_warning(out, "Gitea")
+
+    run_forge_scan(
+        GiteaClient,
+        out,
+        {"orgs": orgs, "users": users},
+        token=config.gitea_token,
+        api_url=api_url,
+        output=output,
+        jsonl=jsonl,
+        jobs=forge_jobs(config, jobs),
+        no_cache=no_cache,
+        max_wait=forge_max_wait(config),
+        transport=get_transport(config),
+    )
 
-            # Transform to inventory format
-            inventory_items = []
-            for repo in repos:
-                item = {
-                    "name": repo["name"],
-                    "remote_url": repo["html_url"],
-                    "description": repo.get("description", ""),
-                    "source": "github",
-                    "language": repo.get("language", ""),
-                    "updated_at": repo.get("updated_at", ""),
-                }
-                inventory_items.append(item)
-
-            # Save to file or inventory
-            if output:
-                with open(output, "w", encoding="utf-8") as f:
-                    json.dump(inventory_items, f, indent=2)
-                msg = (
-                    f"[green]✓ Saved {len(inventory_items)} repos "
-                    f"to {output}[/green]"
-                )
-                console.print(msg)
-            else:
-                # Merge with existing inventory
-                existing = load_inventory()
-                # Add source tag
-                for item in inventory_items:
-                    item["scan_source"] = "github"
-
-                # Simple merge (will be deduped later)
-                combined = existing + inventory_items
-                save_inventory(combined)
-                count = len(inventory_items)
-                msg = (
-                    f"[green]✓ Added {count} GitHub repos "
-                    f"to inventory[/green]"
-                )
-                console.print(msg)
-
-        except requests.RequestException as e:
-            # Handle GitHub API errors
-            if isinstance(e, requests.exceptions.ConnectionError):
-                handle_error(BackendConnectionError(str(e)), console)
-            elif isinstance(e, requests.exceptions.Timeout):
-                handle_error(TimeoutError(str(e)), console)
-            elif isinstance(e, requests.exceptions.HTTPError):
-                status_code = None
-                if e.response:
-                    status_code = e.response.status_code
-                error = APIError(str(e), status_code=status_code)
-                handle_error(error, console)
-            else:
-                console.print(f"[red]Error: GitHub API error: {e}[/red]")
-            raise typer.Exit(1)
+
+def print_scan_stats(out: Console, stats: ScanStats) -> None:
+    """Print the one-line summary of a local scan."""
+    out.print(
+        f"[dim]Scanned {stats.dirs_scanned} directories "
+        f"({stats.entries_seen} entries), "
+        f"{stats.dirs_cached} unchanged from cache, "
+        f"{stats.dirs_skipped} skipped by ignore rules, "
+        f"{stats.dirs_aliased} already visited, "
+        f"{stats.mounts_skipped} on other filesystems; "
+        f"git remotes read natively: {stats.git_subprocess_avoided}, "
+        f"via git subprocess: {stats.git_subprocess_calls}[/dim]"
+    )
 
 
 @scan_app.command(name="local")
@@ -214,109 +919,239 @@ def scan_local(
         None, "--dir", "-d", help="Directory to scan"
     ),
     depth: int = typer.Option(2, "--depth", help="Max depth to scan"),
+    full: bool = typer.Option(
+        False, "--full",
+        help="Ignore the scan cache and list every directory"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j",
+        help="Threads for scanning (split across roots and each walk)"
+    ),
+    exclude: Optional[list[str]] = typer.Option(
+        None, "--exclude", "-x",
+        help="Extra directory glob to prune (repeatable)"
+    ),
+    gitignore: Optional[bool] = typer.Option(
+        None, "--gitignore/--no-gitignore",
+        help="Prune directories ignored by .gitignore files"
+    ),
+    one_file_system: bool = typer.Option(
+        False, "--one-file-system",
+        help="Do not cross into other filesystems (mounts, shares)"
+    ),
+    follow_symlinks: bool = typer.Option(
+        False, "--follow-symlinks",
+        help="Descend into symlinked directories"
+    ),
+    max_time: Optional[float] = typer.Option(
+        None, "--max-time",
+        help="Stop after this many seconds (resumable)"
+    ),
+    max_entries: Optional[int] = typer.Option(
+        None, "--max-entries",
+        help="Stop after reading this many directory entries (resumable)"
+    ),
+    resume: bool = typer.Option(
+        False, "--resume",
+        help="Continue the last interrupted or budget-limited scan"
+    ),
+    jsonl: Optional[str] = typer.Option(
+        None, "--jsonl",
+        help="Stream projects as JSON lines to a file ('-' for stdout) "
+        "instead of updating the inventory"
+    ),
 ):
     """Scan local directories for projects."""
     config = get_config()
-
-    # Get directories to scan
-    if directory:
-        scan_dirs = [directory]
+    out = get_status_console(jsonl)
+    cache_file = get_scan_cache_file()
+    cache = ScanCache.load(cache_file, use_cached=not full)
+    walk_params = {
+        "exclude": config.scan_exclude + (exclude or []),
+        "use_gitignore": (
+            config.scan_use_gitignore if gitignore is None else gitignore
+        ),
+        "one_file_system": one_file_system,
+        "follow_symlinks": follow_symlinks,
+    }
+
+    journal_file = get_scan_journal_file()
+    journal = None
+    if resume:
+        journal = ScanJournal.load(journal_file)
+        if journal is None:
+            msg = "[red]Error: No resumable scan journal found.[/red]"
+            out.print(msg)
+            raise typer.Exit(1)
+        # The frontier was pruned with the journaled options: walking the
+        # rest differently would mix two scans
+        given = {
+            "--dir": directory is not None,
+            "--exclude": exclude is not None,
+            "--gitignore/--no-gitignore": gitignore is not None,
+            "--one-file-system": one_file_system,
+            "--follow-symlinks": follow_symlinks,
+        }
+        conflicts = [flag for flag, is_set in given.items() if is_set]
+        if conflicts:
+            msg = (
+                f"[red]Error: {', '.join(conflicts)} cannot be combined "
+                f"with --resume; the journaled scan options are used."
+                f"[/red]"
+            )
+            out.print(msg)
+            raise typer.Exit(1)
+        scan_dirs = [Path(d) for d in journal.params["roots"]]
+        depth = journal.params["depth"]
+        walk_params = {key: journal.params[key] for key in walk_params}
+        out.print(
+            f"[dim]Resuming scan of {len(scan_dirs)} root(s)[/dim]"
+        )
     else:
-        scan_dirs = [Path(d) for d in config.local_scan_dirs]
+        if journal_file.exists():
+            msg = (
+                "[yellow]Warning: discarding unfinished scan journal "
+                "(use --resume to continue it)[/yellow]"
+            )
+            out.print(msg)
+        # Get directories to scan
+        if directory:
+            scan_dirs = [directory]
+        else:
+            scan_dirs = [Path(d) for d in config.local_scan_dirs]
+
+    existing_dirs = []
+    for scan_dir in scan_dirs:
+        if not scan_dir.exists():
+            msg = f"[yellow]Warning: {scan_dir} does not exist[/yellow]"
+            out.print(msg)
+            continue
+        existing_dirs.append(scan_dir)
+
+    if journal is None:
+        journal = ScanJournal(journal_file, {
+            "roots": [str(d) for d in scan_dirs],
+            "depth": depth,
+            **walk_params,
+        })
+    ignore = ScanFilter(
+        exclude=walk_params["exclude"],
+        use_gitignore=walk_params["use_gitignore"],
+    )
+    one_file_system = walk_params["one_file_system"]
+    follow_symlinks = walk_params["follow_symlinks"]
+    budget = ScanBudget(max_time=max_time, max_entries=max_entries)
+
+    # Threads are split between roots and the walk inside each root
+    total_jobs = max(1, jobs or config.scan_jobs)
+    max_workers = max(1, min(total_jobs, len(existing_dirs)))
+    walkers = max(1, total_jobs // max_workers)
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
         TaskProgressColumn(),
-        console=console,
+        console=out,
     ) as progress:
-        task = progress.add_task("Scanning local projects...", total=None)
-
-        projects = []
-
-        for scan_dir in scan_dirs:
-            if not scan_dir.exists():
-                msg = f"[yellow]Warning: {scan_dir} does not exist[/yellow]"
-                console.print(msg)
-                continue
+        task = progress.add_task(
+            "Scanning local projects...", total=len(existing_dirs)
+        )
+        git_reader = GitMetadataReader()
+
+        stream = None
+        if jsonl:
+            writer = JsonlWriter(jsonl, append=resume)
+            stream = ScanResultStream(writer)
+
+        def scan_one(scan_dir: Path) -> tuple[list[dict], ScanStats]:
+            progress.update(task, description=f"Scanning {scan_dir}...")
+            state = journal.state(str(scan_dir))
+            walk_options = dict(
+                cache=cache, workers=walkers, ignore=ignore,
+                one_file_system=one_file_system,
+                follow_symlinks=follow_symlinks,
+                state=state,
+                budget=budget,
+                checkpoint=journal.checkpoint,
+            )
+            if stream is None:
+                result = scan_root(
+                    scan_dir, depth, git_reader, **walk_options
+                )
+            else:
+                # Projects found before a resume were already streamed
+                streamed = frozenset(found.path for found in state.found)
+                root_stats = ScanStats()
+                # Parallel walkers hand projects over as they find them
+                for item in iter_root_items(
+                    scan_dir, depth, git_reader, root_stats,
+                    skip=streamed, ordered=False, **walk_options
+                ):
+                    item["scan_source"] = "local"
+                    stream.add(scan_dir, item)
+                result = ([], root_stats)
+            progress.update(task, advance=1)
+            return result
+
+        # Roots are scanned concurrently but merged in configured order
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(scan_one, scan_dir)
+                    for scan_dir in existing_dirs
+                ]
+                try:
+                    for future in futures:
+                        future.result()
+                except KeyboardInterrupt:
+                    # Let walks finish their current directory, then journal
+                    budget.stop()
+                results = [future.result() for future in futures]
+        finally:
+            if stream is not None:
+                writer.close()
+
+        stats = ScanStats()
+        for _, root_stats in results:
+            stats.merge(root_stats)
+        cache.save(cache_file)
+
+        complete = all(
+            journal.state(str(scan_dir)).complete
+            for scan_dir in existing_dirs
+        )
+        if not complete:
+            journal.save()
+            found_count = sum(
+                len(journal.state(str(scan_dir)).found)
+                for scan_dir in existing_dirs
+            )
+            progress.update(task, description="Scan paused")
+            msg = (
+                f"[yellow]Scan stopped ({budget.reason}) after "
+                f"{stats.dirs_scanned + stats.dirs_cached} directories; "
+                f"{found_count} projects found so far. "
+                f"Run 'proj inv scan local --resume' to continue.[/yellow]"
+            )
+            out.print(msg)
+            raise typer.Exit(1)
 
-            desc = f"Scanning {scan_dir}..."
-            progress.update(task, description=desc)
+        if stream is not None:
+            journal.discard()
+            target = "stdout" if jsonl == "-" else jsonl
+            msg = (
+                f"[green]✓ Streamed {writer.count} local projects "
+                f"to {target}[/green]"
+            )
+            out.print(msg)
+            print_scan_stats(out, stats)
+            return
 
-            # Find projects by looking for markers
-            markers = [
-                ".git", "package.json", "pyproject.toml",
-                "Cargo.toml", "go.mod"
-            ]
-
-            for marker in markers:
-                pattern = f"**/{marker}"
-                for project_dir in scan_dir.glob(pattern):
-                    # Skip node_modules and nested .git
-                    if project_dir.parts.count("node_modules") > 0:
-                        continue
-                    if project_dir.parts.count(".git") > 1:
-                        continue
-
-                    # Get project root
-                    root = project_dir.parent
-
-                    # Check depth
-                    try:
-                        rel_path = root.relative_to(scan_dir)
-                        rel_depth = len(rel_path.parts)
-                        if rel_depth > depth:
-                            continue
-                    except ValueError:
-                        # Path not relative (shouldn't happen)
-                        continue
-
-                    # Skip if this is a subdirectory of an existing project
-                    # (e.g., frontend/ inside a repo that already has .git)
-                    is_subproject = False
-                    if marker != ".git":
-                        # Check if any parent directory has .git
-                        check_dir = root.parent
-                        while (
-                            check_dir != scan_dir
-                            and check_dir != check_dir.parent
-                        ):
-                            if (check_dir / ".git").exists():
-                                is_subproject = True
-                                break
-                            check_dir = check_dir.parent
-                    if is_subproject:
-                        continue
-
-                    # Get git remote if available
-                    remote_url = ""
-                    git_dir = root / ".git"
-                    if git_dir.exists():
-                        try:
-                            result = subprocess.run(
-                                [
-                                    "git", "-C", str(root),
-                                    "remote", "get-url", "origin"
-                                ],
-                                capture_output=True,
-                                text=True,
-                            )
-                            if result.returncode == 0:
-                                remote_url = result.stdout.strip()
-                        except Exception:
-                            pass
-
-                    # Add to projects if not already added
-                    path_str = str(root)
-                    if not any(p["local_path"] == path_str for p in projects):
-                        projects.append({
-                            "name": root.name,
-                            "local_path": str(root),
-                            "remote_url": remote_url,
-                            "source": "local",
-                            "marker": marker,
-                        })
+        projects = merge_scan_results([
+            (scan_dir, root_projects)
+            for scan_dir, (root_projects, _) in zip(existing_dirs, results)
+        ])
 
         project_count = len(projects)
         desc = f"Found {project_count} local projects"
@@ -329,17 +1164,33 @@ def scan_local(
 
         combined = existing + projects
         save_inventory(combined)
+        journal.discard()
 
         msg = (
             f"[green]✓ Added {project_count} local projects "
             f"to inventory[/green]"
         )
-        console.print(msg)
+        out.print(msg)
+        print_scan_stats(out, stats)
 
 
 @inv_app.command(name="analyze")
-def analyze():
+def analyze(
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j",
+        help="Projects analyzed concurrently (default: analyze_jobs)"
+    ),
+    force: bool = typer.Option(
+        False, "--force",
+        help="Re-analyze projects whose manifests have not changed"
+    ),
+    loc: bool = typer.Option(
+        False, "--loc",
+        help="Also count files and lines of code per language"
+    ),
+):
     """Analyze tech stack of inventory projects."""
+    config = get_config()
     inventory = load_inventory()
 
     if not inventory:
@@ -347,6 +1198,7 @@ def analyze():
         console.print(msg)
         raise typer.Exit(1)
 
+    total_jobs = max(1, jobs or config.analyze_jobs)
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -356,64 +1208,195 @@ def analyze():
     ) as progress:
         task = progress.add_task("Analyzing projects...", total=len(inventory))
 
-        for project in inventory:
-            name = project.get('name', 'unknown')
-            desc = f"Analyzing {name}..."
-            progress.update(task, advance=1, description=desc)
+        def on_progress(count: int) -> None:
+            progress.update(task, advance=count)
 
-            local_path = project.get("local_path")
-            if not local_path or not Path(local_path).exists():
-                continue
+        stats = analyze_inventory(
+            inventory, total_jobs, on_progress, force=force
+        )
 
-            root = Path(local_path)
+        if loc:
+            cache_file = get_loc_cache_file()
+            cache = LocCache.load(cache_file, use_cached=not force)
+            ignore = ScanFilter(
+                exclude=config.scan_exclude,
+                use_gitignore=config.scan_use_gitignore,
+            )
+            loc_task = progress.add_task(
+                "Counting lines of code...", total=len(inventory)
+            )
 
-            # Detect languages/frameworks
-            languages = []
-            frameworks = []
+            def on_loc_progress(count: int) -> None:
+                progress.update(loc_task, advance=count)
 
-            if (root / "package.json").exists():
-                languages.append("JavaScript")
-                try:
-                    pkg_path = root / "package.json"
-                    with open(pkg_path, encoding="utf-8") as f:
-                        pkg = json.load(f)
-                        deps = {
-                            **pkg.get("dependencies", {}),
-                            **pkg.get("devDependencies", {})
-                        }
-                        if "react" in deps:
-                            frameworks.append("React")
-                        if "vue" in deps:
-                            frameworks.append("Vue")
-                        if "express" in deps:
-                            frameworks.append("Express")
-                except Exception:
-                    pass
-
-            pyproject_exists = (root / "pyproject.toml").exists()
-            setup_exists = (root / "setup.py").exists()
-            if pyproject_exists or setup_exists:
-                languages.append("Python")
-
-            if (root / "Cargo.toml").exists():
-                languages.append("Rust")
-
-            if (root / "go.mod").exists():
-                languages.append("Go")
-
-            # Update project
-            if languages:
-                project["languages"] = languages
-            if frameworks:
-                project["frameworks"] = frameworks
-            project["analyzed"] = True
+            with LocCounter(total_jobs, ignore, cache) as counter:
+                counted = analyze_inventory_loc(
+                    inventory, counter, on_loc_progress
+                )
+            cache.save(cache_file)
 
     # Save and print success message OUTSIDE progress context
+    if stats.analyzed or (loc and counted):
+        save_inventory(inventory)
+
+    msg = f"[green]✓ Analyzed {stats.analyzed} projects[/green]"
+    if stats.unchanged:
+        msg += (
+            f" [dim]({stats.unchanged} unchanged since the last run; "
+            f"--force re-analyzes them)[/dim]"
+        )
+    console.print(msg)
+    if loc:
+        loc_stats = counter.stats
+        console.print(
+            f"[green]✓ Counted lines in {counted} projects[/green] "
+            f"[dim]({loc_stats.files_read} files read, "
+            f"{loc_stats.files_cached} unchanged)[/dim]"
+        )
+
+
+def github_languages_url(item: dict, api_url: str) -> Optional[str]:
+    """REST URL of a GitHub item's language byte counts."""
+    if item.get("languages_url"):
+        return item["languages_url"]
+    path = urlsplit(item.get("remote_url") or "").path.strip("/")
+    parts = path.removesuffix(".git").split("/")
+    if len(parts) != 2 or not all(parts):
+        return None
+    return f"{api_url}/repos/{parts[0]}/{parts[1]}/languages"
+
+
+@dataclass
+class EnrichStats:
+    """Outcome counts of a language enrichment run."""
+
+    updated: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+
+def enrich_github_languages(
+    client: GitHubClient,
+    items: list[dict],
+    jobs: int,
+    on_done: Optional[Callable[[dict], None]] = None,
+) -> EnrichStats:
+    """Fetch language byte counts for GitHub items concurrently.
+
+    Each item gets ``language_bytes`` ({language: bytes}) and
+    ``languages`` (names, largest first). Responses revalidated by the
+    client's HTTP cache count as unchanged. Failures are counted and
+    leave the item as it was.
+    """
+    stats = EnrichStats()
+    lock = threading.Lock()
+
+    def enrich_one(item: dict) -> None:
+        url = github_languages_url(item, client.api_url)
+        outcome = "skipped"
+        if url is not None:
+            try:
+                response = client.get(url)
+                language_bytes = response.json()
+                item["language_bytes"] = language_bytes
+                item["languages"] = sorted(
+                    language_bytes, key=language_bytes.get, reverse=True
+                )
+                cached = getattr(response, "from_cache", False)
+                outcome = "unchanged" if cached else "updated"
+            except (requests.RequestException, RateLimitError,
+                    ValueError) as e:
+                logger.debug(f"Languages for {url} failed: {e}")
+                outcome = "failed"
+        with lock:
+            setattr(stats, outcome, getattr(stats, outcome) + 1)
+        if on_done is not None:
+            on_done(item)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        list(executor.map(enrich_one, items))
+    return stats
+
+
+@inv_app.command(name="enrich")
+def enrich(
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j",
+        help="Concurrent requests"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache",
+        help="Do not revalidate against or update the HTTP cache"
+    ),
+):
+    """Fetch language breakdowns for GitHub inventory entries."""
+    config = get_config()
+    inventory = load_inventory()
+    items = [p for p in inventory if p.get("scan_source") == "github"]
+
+    if not items:
+        msg = (
+            "[yellow]No GitHub projects in inventory. "
+            "Run scan github first.[/yellow]"
+        )
+        console.print(msg)
+        raise typer.Exit(1)
+
+    gh_token = config.github_token
+    cache = None
+    if not no_cache:
+        cache = HTTPCache(get_http_cache_dir(), credential_identity(gh_token))
+    total_jobs = forge_jobs(config, jobs)
+    limiter = RateLimiter(max_wait=forge_max_wait(config))
+    client = GitHubClient(
+        token=gh_token,
+        api_url=config.github_api_url,
+        jobs=total_jobs,
+        cache=cache,
+        rate_limiter=limiter,
+        transport=get_transport(config),
+    )
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=console,
+    ) as progress:
+        task = progress.add_task(
+            "Fetching GitHub languages...", total=len(items)
+        )
+
+        def on_done(item: dict) -> None:
+            desc = f"Fetched {item.get('name', 'unknown')}"
+            progress.update(task, advance=1, description=desc)
+
+        try:
+            stats = enrich_github_languages(
+                client, items, total_jobs, on_done
+            )
+        finally:
+            client.close()
+            if limiter.remaining is not None:
+                save_rate_limit(client.name, limiter.snapshot())
+
+    # Items were updated in place
     save_inventory(inventory)
 
-    analyzed_count = sum(1 for p in inventory if p.get("analyzed"))
-    msg = f"[green]✓ Analyzed {analyzed_count} projects[/green]"
+    msg = (
+        f"[green]✓ Languages for {stats.updated + stats.unchanged} "
+        f"GitHub projects[/green]"
+    )
     console.print(msg)
+    console.print(
+        f"[dim]{stats.updated} fetched, {stats.unchanged} unchanged "
+        f"(served from cache), {stats.skipped} without a GitHub URL, "
+        f"{stats.failed} failed[/dim]"
+    )
+    if stats.failed:
+        raise typer.Exit(1)
 
 
 @inv_app.command(name="dedupe")
@@ -488,8 +1471,9 @@ def export_json(
                 "local_path": item.get("local_path", ""),
                 "status": "active",
             }
-            if item.get("languages"):
-                project["languages"] = item["languages"]
+            languages = ranked_languages(item)
+            if languages:
+                project["languages"] = languages
             projects.append(project)
 
         data = {"projects": projects}
@@ -606,6 +1590,18 @@ def status():
     file_exists = "Yes" if inv_file.exists() else "No"
     table.add_row("File Exists", file_exists)
 
+    for name, forge in FORGES.items():
+        quota = load_rate_limit(name)
+        if not quota or quota.get("remaining") is None:
+            continue
+        value = f"{max(quota['remaining'], 0)}/{quota.get('limit') or '?'}"
+        if quota.get("reset_at"):
+            reset = datetime.fromtimestamp(quota["reset_at"])
+            value += f" (resets {reset:%H:%M})"
+        checked = datetime.fromtimestamp(quota["checked_at"])
+        value += f", as of {checked:%Y-%m-%d %H:%M}"
+        table.add_row(f"{forge.title} API Quota", value)
+
     if inventory:
         # Count by source
         github_count = sum(
@@ -617,13 +1613,21 @@ def status():
         analyzed_count = sum(1 for p in inventory if p.get("analyzed"))
 
         table.add_row("GitHub Projects", str(github_count))
+        for name in ("gitlab", "gitea"):
+            count = sum(
+                1 for p in inventory if p.get("scan_source") == name
+            )
+            if count:
+                table.add_row(
+                    f"{FORGES[name].title} Projects", str(count)
+                )
         table.add_row("Local Projects", str(local_count))
         table.add_row("Analyzed", str(analyzed_count))
 
         # Languages
         all_langs = []
         for p in inventory:
-            all_langs.extend(p.get("languages", []))
+            all_langs.extend(ranked_languages(p))
         if all_langs:
             from collections import Counter
             lang_counts = Counter(all_langs).most_common(5)
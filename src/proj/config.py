@@ -20,6 +20,11 @@ def get_xdg_data_home() -> Path:
     return Path(os.environ.get("XDG_DATA_HOME", xdg_data))
 
 
+def get_xdg_cache_home() -> Path:
+    """Get XDG_CACHE_HOME or default."""
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+
+
 def get_config_dir() -> Path:
     """Get proj config directory."""
     return get_xdg_config_home() / "proj"
@@ -30,6 +35,11 @@ def get_data_dir() -> Path:
     return get_xdg_data_home() / "proj"
 
 
+def get_cache_dir() -> Path:
+    """Get proj cache directory."""
+    return get_xdg_cache_home() / "proj"
+
+
 def get_config_file() -> Path:
     """Get config file path."""
     return get_config_dir() / "config.yaml"
@@ -49,6 +59,32 @@ class Config(BaseSettings):
         default="http://localhost:5000",
         description="URL of the work-prod API",
     )
+    api_retries: int = Field(
+        default=3,
+        description="Retries of idempotent work-prod API requests",
+    )
+    api_retry_backoff: float = Field(
+        default=0.5,
+        description="Base delay (seconds) of exponential retry backoff",
+    )
+    api_retry_max_delay: float = Field(
+        default=30.0,
+        description="Longest wait before a retry, including Retry-After",
+    )
+    api_retry_patch: bool = Field(
+        default=False,
+        description="Also retry PATCH requests (safe if the API's PATCH "
+        "is idempotent)",
+    )
+    api_circuit_threshold: int = Field(
+        default=5,
+        description="Consecutive connection failures before requests "
+        "fail fast",
+    )
+    api_circuit_reset: float = Field(
+        default=30.0,
+        description="Seconds requests fail fast before one is retried",
+    )
 
     # GitHub Settings
     github_token: Optional[str] = Field(
@@ -59,12 +95,125 @@ class Config(BaseSettings):
         default=None,
         description="GitHub username for scanning repos",
     )
+    github_users: list[str] = Field(
+        default_factory=list,
+        description="Additional GitHub users scanned by default",
+    )
+    github_orgs: list[str] = Field(
+        default_factory=list,
+        description="GitHub organizations scanned by default",
+    )
+    github_api_url: str = Field(
+        default="https://api.github.com",
+        description="GitHub REST API root (change for GitHub Enterprise)",
+    )
+    github_jobs: int = Field(
+        default=4,
+        description="Concurrent page requests for GitHub scans (also "
+        "other forges when forge_jobs is unset)",
+    )
+    github_max_wait: float = Field(
+        default=900,
+        description="Longest rate limit wait (seconds) before a GitHub "
+        "scan stops with partial results (also other forges when "
+        "forge_max_wait is unset)",
+    )
+
+    # Forge Settings (GitHub, GitLab, Gitea)
+    forge_jobs: Optional[int] = Field(
+        default=None,
+        description="Concurrent page requests for every forge scan "
+        "(default: github_jobs)",
+    )
+    forge_max_wait: Optional[float] = Field(
+        default=None,
+        description="Longest rate limit wait (seconds) before any forge "
+        "scan stops with partial results (default: github_max_wait)",
+    )
+
+    # GitLab Settings
+    gitlab_token: Optional[str] = Field(
+        default=None,
+        description="GitLab personal access token",
+    )
+    gitlab_api_url: str = Field(
+        default="https://gitlab.com/api/v4",
+        description="GitLab REST API root (change for self-managed GitLab)",
+    )
+    gitlab_groups: list[str] = Field(
+        default_factory=list,
+        description="GitLab groups (full paths) scanned by default",
+    )
+    gitlab_users: list[str] = Field(
+        default_factory=list,
+        description="GitLab users scanned by default",
+    )
+
+    # Gitea Settings
+    gitea_token: Optional[str] = Field(
+        default=None,
+        description="Gitea access token",
+    )
+    gitea_api_url: Optional[str] = Field(
+        default=None,
+        description="Gitea API root, e.g. https://gitea.example.com/api/v1",
+    )
+    gitea_orgs: list[str] = Field(
+        default_factory=list,
+        description="Gitea organizations scanned by default",
+    )
+    gitea_users: list[str] = Field(
+        default_factory=list,
+        description="Gitea users scanned by default",
+    )
+
+    # HTTP Settings (shared by forge scans and the work-prod API client)
+    http_pool_size: int = Field(
+        default=10,
+        description="Keep-alive connections kept, and allowed at once, "
+        "per host",
+    )
+    http_connect_timeout: float = Field(
+        default=5.0,
+        description="Seconds to wait for a connection",
+    )
+    http_read_timeout: float = Field(
+        default=15.0,
+        description="Seconds to wait for a response",
+    )
+    http_bulk_read_timeout: float = Field(
+        default=60.0,
+        description="Seconds to wait for bulk responses (project imports)",
+    )
 
     # Scan Settings
     local_scan_dirs: list[str] = Field(
         default_factory=lambda: [str(Path.home() / "Projects")],
         description="Directories to scan for local projects",
     )
+    scan_exclude: list[str] = Field(
+        default_factory=lambda: [
+            ".venv", "venv", ".tox", "target", "build", "vendor", "bazel-*",
+        ],
+        description="Gitignore-style globs for directories scans prune",
+    )
+    scan_use_gitignore: bool = Field(
+        default=False,
+        description=(
+            "Also prune directories ignored by .gitignore files "
+            "(scan_exclude and .projignore still win over negations)"
+        ),
+    )
+    scan_jobs: int = Field(
+        default=1,
+        description="Threads for local scans (across and within roots)",
+    )
+
+    # Analyze Settings
+    analyze_jobs: int = Field(
+        default=4,
+        description="Projects analyzed (and --loc workers) in inv analyze",
+    )
 
     @classmethod
     def load(cls) -> "Config":
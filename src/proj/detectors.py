@@ -0,0 +1,181 @@
+"""Declarative tech stack detectors for ``proj inv analyze``.
+
+A Detector names a language, framework or build system and the entries
+of a project root that reveal it: exact file names, file suffixes,
+directory names, or ``package.json`` dependencies. DetectorIndex turns a
+registry into lookup tables, so matching a project costs one pass over a
+single ``os.scandir`` listing of its root, however many detectors are
+registered. ``package.json`` is the only file read, and only when a
+detector needs its dependencies.
+
+Add a detector by appending to DETECTORS; results keep registry order.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+# Inventory keys detectors report into, in output order
+CATEGORIES = ("languages", "frameworks", "build_systems")
+
+
+@dataclass(frozen=True)
+class Detector:
+    """One technology and the root entries that reveal it."""
+
+    name: str
+    category: str  # one of CATEGORIES
+    files: tuple[str, ...] = ()
+    suffixes: tuple[str, ...] = ()  # e.g. ".csproj"
+    dirs: tuple[str, ...] = ()
+    dependencies: tuple[str, ...] = ()  # package.json (dev)dependencies
+
+
+DETECTORS: tuple[Detector, ...] = (
+    # Languages
+    Detector("JavaScript", "languages", files=("package.json",)),
+    Detector("TypeScript", "languages", files=("tsconfig.json",)),
+    Detector("Python", "languages", files=(
+        "pyproject.toml", "setup.py", "setup.cfg", "requirements.txt",
+        "Pipfile",
+    )),
+    Detector("Rust", "languages", files=("Cargo.toml",)),
+    Detector("Go", "languages", files=("go.mod",)),
+    Detector("Java", "languages", files=(
+        "pom.xml", "build.gradle", "build.gradle.kts",
+    )),
+    Detector("Kotlin", "languages", files=("build.gradle.kts",)),
+    Detector("Scala", "languages", files=("build.sbt",)),
+    Detector("Clojure", "languages", files=("project.clj", "deps.edn")),
+    Detector("Ruby", "languages", files=("Gemfile",), suffixes=(".gemspec",)),
+    Detector("C#", "languages", suffixes=(".csproj", ".sln")),
+    Detector("F#", "languages", suffixes=(".fsproj",)),
+    Detector("PHP", "languages", files=("composer.json",)),
+    Detector("Elixir", "languages", files=("mix.exs",)),
+    Detector("Erlang", "languages", files=("rebar.config",)),
+    Detector("Haskell", "languages", files=("stack.yaml",),
+             suffixes=(".cabal",)),
+    Detector("Swift", "languages", files=("Package.swift",)),
+    Detector("Dart", "languages", files=("pubspec.yaml",)),
+    Detector("C/C++", "languages", files=(
+        "CMakeLists.txt", "meson.build", "configure.ac",
+    )),
+    Detector("Zig", "languages", files=("build.zig",)),
+    Detector("Julia", "languages", files=("Project.toml",)),
+    Detector("HCL", "languages", suffixes=(".tf",)),
+    # Frameworks
+    Detector("React", "frameworks", dependencies=("react",)),
+    Detector("Vue", "frameworks", dependencies=("vue",)),
+    Detector("Express", "frameworks", dependencies=("express",)),
+    Detector("Next.js", "frameworks", dependencies=("next",),
+             files=("next.config.js", "next.config.mjs")),
+    Detector("Svelte", "frameworks", dependencies=("svelte",)),
+    Detector("Angular", "frameworks", files=("angular.json",)),
+    Detector("Django", "frameworks", files=("manage.py",)),
+    Detector("Storybook", "frameworks", dirs=(".storybook",)),
+    Detector("Helm", "frameworks", files=("Chart.yaml",)),
+    # Build systems
+    Detector("npm", "build_systems", files=("package-lock.json",)),
+    Detector("Yarn", "build_systems", files=("yarn.lock",)),
+    Detector("pnpm", "build_systems", files=("pnpm-lock.yaml",)),
+    Detector("Poetry", "build_systems", files=("poetry.lock",)),
+    Detector("uv", "build_systems", files=("uv.lock",)),
+    Detector("Cargo", "build_systems", files=("Cargo.toml",)),
+    Detector("Go modules", "build_systems", files=("go.mod",)),
+    Detector("Maven", "build_systems", files=("pom.xml", "mvnw")),
+    Detector("Gradle", "build_systems", files=(
+        "build.gradle", "build.gradle.kts", "gradlew",
+    )),
+    Detector("MSBuild", "build_systems", suffixes=(".sln", ".csproj")),
+    Detector("Bundler", "build_systems", files=("Gemfile.lock",)),
+    Detector("Composer", "build_systems", files=("composer.lock",)),
+    Detector("CMake", "build_systems", files=("CMakeLists.txt",)),
+    Detector("Meson", "build_systems", files=("meson.build",)),
+    Detector("Bazel", "build_systems", files=(
+        "WORKSPACE", "WORKSPACE.bazel", "MODULE.bazel",
+    )),
+    Detector("Make", "build_systems", files=("Makefile", "GNUmakefile")),
+    Detector("Docker", "build_systems", files=(
+        "Dockerfile", "docker-compose.yml", "compose.yaml",
+    )),
+    Detector("Nix", "build_systems", files=("flake.nix", "default.nix")),
+)
+
+
+class DetectorIndex:
+    """Lookup tables matching a registry against a directory listing."""
+
+    def __init__(self, detectors: Iterable[Detector] = DETECTORS):
+        self.detectors = tuple(detectors)
+        self._files: dict[str, list[int]] = {}
+        self._suffixes: dict[str, list[int]] = {}
+        self._dirs: dict[str, list[int]] = {}
+        self._dependencies: dict[str, list[int]] = {}
+        for position, detector in enumerate(self.detectors):
+            for table, keys in (
+                (self._files, detector.files),
+                (self._suffixes, detector.suffixes),
+                (self._dirs, detector.dirs),
+                (self._dependencies, detector.dependencies),
+            ):
+                for key in keys:
+                    table.setdefault(key, []).append(position)
+
+    def match(
+        self,
+        files: Iterable[str],
+        dirs: Iterable[str],
+        dependencies: Iterable[str] = (),
+    ) -> dict[str, list[str]]:
+        """Return detected names by category, in registry order."""
+        hits = set()
+        for name in files:
+            hits.update(self._files.get(name, ()))
+            suffix = os.path.splitext(name)[1]
+            if suffix:
+                hits.update(self._suffixes.get(suffix, ()))
+        for name in dirs:
+            hits.update(self._dirs.get(name, ()))
+        for name in dependencies:
+            hits.update(self._dependencies.get(name, ()))
+        result = {category: [] for category in CATEGORIES}
+        for position in sorted(hits):
+            detector = self.detectors[position]
+            result[detector.category].append(detector.name)
+        return result
+
+
+def list_root(root: Path) -> Optional[tuple[list[str], list[str]]]:
+    """List a project root once: (file names, directory names).
+
+    DirEntry types come from the listing itself (``d_type``), so no
+    per-entry stat is made on common filesystems. Returns None if the
+    root cannot be listed.
+    """
+    files, dirs = [], []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                (dirs if is_dir else files).append(entry.name)
+    except OSError:
+        return None
+    return files, dirs
+
+
+def package_dependencies(path: Path) -> list[str]:
+    """Dependency names from a package.json (empty if unreadable)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            pkg = json.load(f)
+        return [
+            *pkg.get("dependencies", {}),
+            *pkg.get("devDependencies", {}),
+        ]
+    except Exception:
+        return []
@@ -20,6 +20,11 @@ class BackendConnectionError(CLIError):
     pass
 
 
+class CircuitOpenError(BackendConnectionError):
+    """Raised without a request after repeated connection failures."""
+    pass
+
+
 class TimeoutError(CLIError):
     """Raised when a request times out."""
     pass
@@ -0,0 +1,31 @@
+"""Repository listing for code forges (GitHub, GitLab, Gitea)."""
+
+from proj.forges.base import (
+    ForgeClient,
+    RateLimiter,
+    RateLimitError,
+    page_number,
+    with_page,
+)
+from proj.forges.gitea import GiteaClient
+from proj.forges.github import GitHubClient, GraphQLError
+from proj.forges.gitlab import GitLabClient
+
+# Forge clients by name, as used by ``proj inv scan <name>``
+FORGES: dict[str, type[ForgeClient]] = {
+    client.name: client
+    for client in (GitHubClient, GitLabClient, GiteaClient)
+}
+
+__all__ = [
+    "FORGES",
+    "ForgeClient",
+    "GiteaClient",
+    "GitHubClient",
+    "GitLabClient",
+    "GraphQLError",
+    "RateLimiter",
+    "RateLimitError",
+    "page_number",
+    "with_page",
+]
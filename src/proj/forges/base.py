@@ -0,0 +1,455 @@
+"""Shared engine for listing repositories on code forges.
+
+ForgeClient owns everything that is the same across forges: requests
+through a pooled Transport, a global cap on requests in flight,
+conditional requests through an HTTPCache, rate limit scheduling and
+concurrent pagination. A forge
+subclass only describes its API: the authentication header, how a page
+points at the next and last pages, the listing URLs and how a repository
+maps onto an inventory item.
+
+Listings are paginated. The first page is fetched alone to learn the
+page count; the remaining pages are then fetched concurrently and
+yielded in page order. Without a page count the client follows ``next``
+pages one at a time.
+
+Every request goes through a RateLimiter, which spreads the last part of
+the quota over the time left until it resets and, on 403/429 rate limit
+responses, pauses all workers and retries instead of failing. Connection
+errors, timeouts and 502/503/504 responses are retried per a
+proj.retry.RetryPolicy, so one flaky page does not drop a whole owner.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
+
+import requests
+
+from proj.http_cache import HTTPCache
+from proj.retry import RETRY_STATUSES, RetryPolicy
+from proj.transport import Transport
+
+# Rate-limited responses retried per request before giving up
+RATE_LIMIT_RETRIES = 5
+
+# Header prefixes forges use for quota headers (GitHub/Gitea, GitLab)
+RATE_LIMIT_PREFIXES = ("X-RateLimit-", "RateLimit-")
+
+
+class RateLimitError(Exception):
+    """The rate limit would not reset within the allowed wait."""
+
+    def __init__(self, message: str, reset_at: Optional[float] = None):
+        super().__init__(message)
+        self.reset_at = reset_at
+
+
+def _header_number(response: requests.Response, name: str) -> Optional[int]:
+    try:
+        return int(response.headers[name])
+    except (KeyError, ValueError):
+        return None
+
+
+def _quota_header(response: requests.Response, name: str) -> Optional[int]:
+    for prefix in RATE_LIMIT_PREFIXES:
+        value = _header_number(response, prefix + name)
+        if value is not None:
+            return value
+    return None
+
+
+class RateLimiter:
+    """Schedule requests against a forge's rate limit headers.
+
+    Tracks ``X-RateLimit-Limit``/``-Remaining``/``-Reset`` (GitLab:
+    ``RateLimit-*``) from every response. Once less than LOW_WATER of the
+    quota is left, requests are spaced evenly over the time until the
+    reset; with none left they wait for the reset. A rate-limited
+    response (403/429 with ``Retry-After`` or an exhausted quota) pauses
+    every worker sharing the limiter. Waits longer than ``max_wait``
+    raise RateLimitError instead.
+    """
+
+    # Fraction of the quota below which requests are paced
+    LOW_WATER = 0.1
+
+    def __init__(
+        self,
+        max_wait: float = 900,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.time,
+        on_wait: Optional[Callable[[float], None]] = None,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            max_wait: Longest single wait in seconds before giving up
+            sleep: Sleep function (replaceable in tests)
+            clock: Wall clock returning epoch seconds
+            on_wait: Called with the delay before any wait over a second
+        """
+        self.max_wait = max_wait
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.waited = 0.0
+        self._sleep = sleep
+        self._clock = clock
+        self._on_wait = on_wait
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the next request may be sent."""
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot)
+            interval = 0.0
+            if self.remaining is not None and self.reset_at is not None:
+                window = max(0.0, self.reset_at - slot)
+                if self.remaining <= 0:
+                    slot = max(slot, self.reset_at + 1)
+                elif (
+                    self.limit
+                    and self.remaining < self.limit * self.LOW_WATER
+                ):
+                    # Spread what is left of the quota over the window
+                    interval = window / self.remaining
+                # Count requests in flight until the server reports back
+                self.remaining -= 1
+            delay = slot - now
+            if delay > self.max_wait:
+                raise RateLimitError(
+                    f"Rate limit exhausted for {delay:.0f}s",
+                    reset_at=self.reset_at,
+                )
+            self._next_slot = slot + interval
+            self.waited += delay
+        self._wait(delay)
+
+    def update(self, response: requests.Response) -> None:
+        """Record the quota reported by a response."""
+        remaining = _quota_header(response, "Remaining")
+        if remaining is None:
+            return
+        with self._lock:
+            self.remaining = remaining
+            self.limit = _quota_header(response, "Limit")
+            reset = _quota_header(response, "Reset")
+            self.reset_at = float(reset) if reset is not None else None
+
+    def is_rate_limited(self, response: requests.Response) -> bool:
+        """True if a response was refused because of rate limits."""
+        if response.status_code not in (403, 429):
+            return False
+        return (
+            "Retry-After" in response.headers
+            or _quota_header(response, "Remaining") == 0
+        )
+
+    def backoff(self, response: requests.Response) -> None:
+        """Pause all requests after a rate-limited response."""
+        now = self._clock()
+        retry_after = _header_number(response, "Retry-After")
+        if retry_after is not None:
+            resume_at = now + retry_after
+        elif self.reset_at is not None:
+            resume_at = self.reset_at + 1
+        else:
+            resume_at = now + 60
+        if resume_at - now > self.max_wait:
+            raise RateLimitError(
+                f"Rate limit exhausted for {resume_at - now:.0f}s",
+                reset_at=self.reset_at,
+            )
+        with self._lock:
+            self._next_slot = max(self._next_slot, resume_at)
+
+    def snapshot(self) -> dict:
+        """Last known quota, for display in ``inv status``."""
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "reset_at": self.reset_at,
+        }
+
+    def _wait(self, delay: float) -> None:
+        if delay <= 0:
+            return
+        if self._on_wait is not None and delay >= 1:
+            self._on_wait(delay)
+        self._sleep(delay)
+
+
+def page_number(url: str) -> Optional[int]:
+    """Return the ``page`` query parameter of a URL, if any."""
+    values = parse_qs(urlsplit(url).query).get("page")
+    if not values:
+        return None
+    try:
+        return int(values[0])
+    except ValueError:
+        return None
+
+
+def with_page(url: str, page: int) -> str:
+    """Return ``url`` with its ``page`` query parameter set."""
+    parts = urlsplit(url)
+    query = parse_qs(parts.query, keep_blank_values=True)
+    query["page"] = [str(page)]
+    return urlunsplit(parts._replace(query=urlencode(query, doseq=True)))
+
+
+class ForgeClient:
+    """Concurrent, cached, rate-limited repository listing for a forge.
+
+    One client may be shared by threads scanning different owners: they
+    use the same connection pool and rate limiter, and at most ``jobs``
+    requests are in flight across all of them. Clients of different
+    forges may share one Transport; credentials are sent per request.
+
+    Subclasses set the class attributes and implement auth_headers(),
+    iter_repos() and repo_item(); page_links() defaults to RFC 8288
+    ``Link`` headers.
+    """
+
+    # Forge identifier, also used as the items' scan_source
+    name = "forge"
+    # Display name for messages
+    title = "Forge"
+    default_api_url = ""
+    # Owner kinds iter_repos() accepts, e.g. ("users", "orgs")
+    owner_kinds: tuple[str, ...] = ()
+    # True when listings are newest-first, so ``since`` can stop early
+    supports_since = False
+    # Response headers page_links() reads besides ``Link``; cached with
+    # each page so a replayed 304 still points at the next page
+    page_headers: tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        api_url: Optional[str] = None,
+        jobs: int = 4,
+        cache: Optional[HTTPCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[Transport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the client.
+
+        Args:
+            token: Access token (anonymous if None)
+            api_url: API root (the forge's public instance if None)
+            jobs: Maximum concurrent requests
+            cache: Conditional request cache (None disables it)
+            rate_limiter: Shared scheduler (a default one if None)
+            transport: Shared connection pool and timeout policy (a
+                private one sized for ``jobs`` if None)
+            retry_policy: Retries after transient failures (defaults
+                if None)
+            sleep: Sleep function between retries (replaceable in tests)
+        """
+        self.api_url = (api_url or self.default_api_url).rstrip("/")
+        self.jobs = max(1, jobs)
+        self.cache = cache
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._sleep = sleep
+        # Global cap on requests in flight, shared by every caller
+        self._slots = threading.BoundedSemaphore(self.jobs)
+        self.requests_made = 0
+        self.not_modified = 0
+        self._count_lock = threading.Lock()
+        self._owns_transport = transport is None
+        self.transport = transport or Transport(pool_size=self.jobs)
+        # Sent with every request, never set on the shared session
+        self.headers = self.auth_headers(token) if token else {}
+
+    def auth_headers(self, token: str) -> dict:
+        """Headers authenticating requests with ``token``."""
+        return {"Authorization": f"token {token}"}
+
+    def page_links(
+        self, response: requests.Response
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Return the (next, last) page URLs of a listing page."""
+        next_url = response.links.get("next", {}).get("url")
+        last_url = response.links.get("last", {}).get("url")
+        return next_url, last_url
+
+    def iter_repos(
+        self, owner: str, since: Optional[str] = None, kind: str = ""
+    ) -> Iterator[dict]:
+        """Yield an owner's repositories as returned by the API."""
+        raise NotImplementedError
+
+    def repo_item(self, repo: dict) -> dict:
+        """Transform an API repository to inventory format."""
+        raise NotImplementedError
+
+    def get(
+        self, url: str, params: Optional[dict] = None
+    ) -> requests.Response:
+        """GET a URL, raising for HTTP errors.
+
+        Rate-limited responses are retried after the limiter's pause;
+        RateLimitError is raised when that pause would be too long.
+        """
+        if params:
+            url = requests.Request("GET", url, params=params).prepare().url
+        entry = None
+        headers = {}
+        if self.cache is not None:
+            entry = self.cache.lookup(url)
+            headers = self.cache.conditional_headers(entry)
+
+        response = self._send("GET", url, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            with self._count_lock:
+                self.not_modified += 1
+            return self.cache.replay(entry, response)
+        response.raise_for_status()
+        if self.cache is not None:
+            self.cache.store(url, response, self.page_headers)
+        return response
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Send a request through the rate limiter, retrying on limits.
+
+        Connection errors, timeouts and 502/503/504 responses are
+        retried per the retry policy; the last failure is returned (or
+        raised) once it gives up.
+        """
+        headers = {**self.headers, **(headers or {})}
+        limiter = self.rate_limiter
+        policy = self.retry_policy
+        rate_limited = 0
+        attempt = 0
+        while True:
+            limiter.acquire()
+            try:
+                with self._slots:
+                    response = self.transport.request(
+                        method, url, headers=headers, **kwargs
+                    )
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ):
+                if not policy.can_retry(method, attempt):
+                    raise
+                self._sleep(policy.delay(attempt))
+                attempt += 1
+                continue
+            with self._count_lock:
+                self.requests_made += 1
+            limiter.update(response)
+            if limiter.is_rate_limited(response):
+                if rate_limited >= RATE_LIMIT_RETRIES:
+                    raise RateLimitError(
+                        f"{self.title} rate limit: gave up on {url}",
+                        reset_at=limiter.reset_at,
+                    )
+                limiter.backoff(response)
+                rate_limited += 1
+                continue
+            if (
+                response.status_code in RETRY_STATUSES
+                and policy.can_retry(method, attempt)
+            ):
+                delay = policy.delay(attempt, response)
+                if delay is not None:
+                    self._sleep(delay)
+                    attempt += 1
+                    continue
+            return response
+
+    def iter_pages(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        parallel: bool = True,
+    ) -> Iterator[list]:
+        """Yield each page of a paginated listing in order.
+
+        With ``parallel=False`` pages are requested one at a time, so a
+        caller that stops early never pays for pages it does not read.
+        """
+        response = self.get(url, params)
+        yield response.json()
+
+        next_url, last_url = self.page_links(response)
+        first = page_number(next_url) if next_url else None
+        last = page_number(last_url) if last_url else None
+        if not parallel or first is None or last is None:
+            # No page count to fan out over: follow next pages serially
+            while next_url:
+                response = self.get(next_url)
+                yield response.json()
+                next_url, _ = self.page_links(response)
+            return
+
+        urls = (with_page(last_url, page) for page in range(first, last + 1))
+        executor = ThreadPoolExecutor(max_workers=self.jobs)
+        pending = deque()
+        try:
+            # Keep a bounded window of requests in flight, oldest first
+            for page_url in urls:
+                pending.append(executor.submit(self.get, page_url))
+                if len(pending) >= self.jobs * 2:
+                    yield pending.popleft().result().json()
+            while pending:
+                yield pending.popleft().result().json()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def iter_listing(
+        self,
+        url: str,
+        params: dict,
+        since: Optional[str] = None,
+        updated_key: str = "updated_at",
+    ) -> Iterator[dict]:
+        """Yield the items of a newest-first listing.
+
+        Args:
+            url: Listing URL
+            params: Query parameters of the first page
+            since: High-water mark of a previous sync; the listing stops
+                at the first item whose ``updated_key`` is older
+            updated_key: Item field holding its update time
+        """
+        # Incremental listings usually end on the first page
+        pages = self.iter_pages(url, params, parallel=since is None)
+        for page in pages:
+            for repo in page:
+                if since and (repo.get(updated_key) or "") < since:
+                    pages.close()
+                    return
+                yield repo
+
+    def close(self) -> None:
+        """Close pooled connections unless the transport is shared."""
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self) -> "ForgeClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
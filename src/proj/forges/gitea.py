@@ -0,0 +1,55 @@
+"""Gitea scanner for ``proj inv scan gitea``.
+
+Lists organization and user repositories of a Gitea (or Forgejo)
+instance. Pages are sized with ``limit`` and linked with ``Link``
+headers like GitHub's; listings are not ordered by update time, so every
+scan lists all repositories.
+"""
+
+from typing import Iterator, Optional
+
+from proj.forges.base import ForgeClient
+
+# Gitea's default maximum page size (MAX_RESPONSE_ITEMS)
+PER_PAGE = 50
+
+
+class GiteaClient(ForgeClient):
+    """Gitea repository listing."""
+
+    name = "gitea"
+    title = "Gitea"
+    # No public default: the instance URL comes from config
+    default_api_url = ""
+    owner_kinds = ("orgs", "users")
+    supports_since = False
+
+    def iter_repos(
+        self,
+        owner: str,
+        since: Optional[str] = None,
+        kind: str = "orgs",
+    ) -> Iterator[dict]:
+        """Yield an owner's repositories.
+
+        Args:
+            owner: Organization or user name
+            since: Ignored; Gitea listings cannot be sorted by update time
+            kind: ``orgs`` or ``users``
+        """
+        url = f"{self.api_url}/{kind}/{owner}/repos"
+        yield from self.iter_listing(url, {"limit": PER_PAGE})
+
+    def repo_item(self, repo: dict) -> dict:
+        """Transform a Gitea repository to inventory format."""
+        return {
+            "name": repo["name"],
+            "remote_url": repo["html_url"],
+            "description": repo.get("description") or "",
+            "source": "gitea",
+            "language": repo.get("language") or "",
+            "updated_at": repo.get("updated_at") or "",
+            "topics": repo.get("topics") or [],
+            "archived": bool(repo.get("archived")),
+            "fork": bool(repo.get("fork")),
+        }
@@ -0,0 +1,203 @@
+"""GitHub scanner for ``proj inv scan github``.
+
+Lists users' and organizations' repositories through the REST API on the
+shared ForgeClient engine (``Link`` header pagination, most recently
+updated first), or 100 at a time through GraphQL with languages, topics
+and last commit dates included.
+"""
+
+from typing import Iterator, Optional
+
+from proj.forges.base import RATE_LIMIT_RETRIES, ForgeClient
+
+DEFAULT_API_URL = "https://api.github.com"
+
+# GitHub's maximum page size for repository listings
+PER_PAGE = 100
+
+
+REPOS_QUERY = """
+query($login: String!, $cursor: String) {
+  repositoryOwner(login: $login) {
+    repositories(
+      first: %d
+      after: $cursor
+      ownerAffiliations: OWNER
+      orderBy: {field: UPDATED_AT, direction: DESC}
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        url
+        description
+        isArchived
+        isFork
+        updatedAt
+        primaryLanguage { name }
+        languages(first: 20, orderBy: {field: SIZE, direction: DESC}) {
+          edges { size node { name } }
+        }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+        defaultBranchRef {
+          name
+          target { ... on Commit { committedDate } }
+        }
+      }
+    }
+  }
+}
+""" % PER_PAGE
+
+
+class GraphQLError(Exception):
+    """A GraphQL response carried errors."""
+
+
+class GitHubClient(ForgeClient):
+    """GitHub REST and GraphQL repository listing."""
+
+    name = "github"
+    title = "GitHub"
+    default_api_url = DEFAULT_API_URL
+    owner_kinds = ("users", "orgs")
+    supports_since = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.headers["Accept"] = "application/vnd.github+json"
+
+    def iter_repos(
+        self,
+        owner: str,
+        since: Optional[str] = None,
+        kind: str = "users",
+    ) -> Iterator[dict]:
+        """Yield an owner's repositories, most recently updated first.
+
+        Args:
+            owner: GitHub user or organization login
+            since: ``updated_at`` high-water mark of a previous sync; the
+                listing stops at the first repository updated before it
+            kind: ``users`` or ``orgs``
+        """
+        url = f"{self.api_url}/{kind}/{owner}/repos"
+        params = {"per_page": PER_PAGE, "sort": "updated"}
+        yield from self.iter_listing(url, params, since)
+
+    def repo_item(self, repo: dict) -> dict:
+        """Transform a REST repository to inventory format."""
+        return {
+            "name": repo["name"],
+            "remote_url": repo["html_url"],
+            "description": repo.get("description", ""),
+            "source": "github",
+            "language": repo.get("language", ""),
+            "updated_at": repo.get("updated_at", ""),
+            "languages_url": repo.get("languages_url"),
+        }
+
+    @property
+    def graphql_url(self) -> str:
+        """GraphQL endpoint matching the REST root.
+
+        ``https://api.github.com`` serves it at ``/graphql``; GitHub
+        Enterprise REST roots end in ``/api/v3`` and GraphQL lives at
+        ``/api/graphql``.
+        """
+        if self.api_url.endswith("/v3"):
+            return self.api_url[:-len("/v3")] + "/graphql"
+        return self.api_url + "/graphql"
+
+    def graphql(self, query: str, variables: dict) -> dict:
+        """Run a GraphQL query and return its ``data``.
+
+        Raises:
+            GraphQLError: The response carried errors
+        """
+        body = {"query": query, "variables": variables}
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            response = self._send("POST", self.graphql_url, json=body)
+            response.raise_for_status()
+            payload = response.json()
+            errors = payload.get("errors") or []
+            # An exhausted GraphQL quota is reported as a 200 with errors
+            limited = any(e.get("type") == "RATE_LIMITED" for e in errors)
+            if not limited or attempt == RATE_LIMIT_RETRIES:
+                break
+            self.rate_limiter.backoff(response)
+        if errors:
+            messages = "; ".join(
+                error.get("message", "unknown error") for error in errors
+            )
+            raise GraphQLError(messages)
+        return payload["data"]
+
+    def iter_repos_graphql(
+        self, owner: str, since: Optional[str] = None
+    ) -> Iterator[dict]:
+        """Yield an owner's repositories with languages and topics.
+
+        Each GraphQL query returns PER_PAGE repositories with everything
+        the inventory stores, so no per-repo requests are needed. Pages
+        follow cursors and therefore arrive one at a time.
+
+        Args:
+            owner: GitHub user or organization login
+            since: ``updated_at`` high-water mark, as for iter_repos()
+
+        Yields:
+            Repository nodes as returned by REPOS_QUERY
+        """
+        cursor = None
+        while True:
+            data = self.graphql(
+                REPOS_QUERY, {"login": owner, "cursor": cursor}
+            )
+            if data.get("repositoryOwner") is None:
+                raise GraphQLError(f"Could not resolve owner {owner!r}")
+            repositories = data["repositoryOwner"]["repositories"]
+            for node in repositories["nodes"]:
+                if since and (node.get("updatedAt") or "") < since:
+                    return
+                yield node
+            page_info = repositories["pageInfo"]
+            if not page_info["hasNextPage"]:
+                return
+            cursor = page_info["endCursor"]
+
+    def graphql_repo_item(self, node: dict) -> dict:
+        """Transform a GraphQL repository node to inventory format.
+
+        Carries the REST item's fields plus the language breakdown,
+        topics, archived/fork flags and the default branch's last commit
+        date.
+        """
+        language_bytes = {
+            edge["node"]["name"]: edge["size"]
+            for edge in (node.get("languages") or {}).get("edges", [])
+        }
+        topics = [
+            topic["topic"]["name"]
+            for topic in (node.get("repositoryTopics") or {}).get(
+                "nodes", []
+            )
+        ]
+        branch = node.get("defaultBranchRef") or {}
+        primary = node.get("primaryLanguage") or {}
+        target = branch.get("target") or {}
+        return {
+            "name": node["name"],
+            "remote_url": node["url"],
+            "description": node.get("description") or "",
+            "source": "github",
+            "language": primary.get("name") or "",
+            "updated_at": node.get("updatedAt") or "",
+            "languages_url": None,
+            "languages": list(language_bytes),
+            "language_bytes": language_bytes,
+            "topics": topics,
+            "archived": bool(node.get("isArchived")),
+            "fork": bool(node.get("isFork")),
+            "default_branch": branch.get("name"),
+            "last_commit_at": target.get("committedDate"),
+        }
@@ -0,0 +1,378 @@
+"""Native reader for git repository metadata.
+
+Resolves a repository's ``origin`` URL by parsing git config files directly
+instead of spawning ``git remote get-url origin`` for every repository.
+Supports ``gitdir:`` pointer files (worktrees and submodules),
+``include.path`` / ``includeIf "gitdir:"`` includes and
+``url.<base>.insteadOf`` rewrites. Anything the reader cannot interpret
+raises GitConfigError so callers can fall back to the ``git`` binary.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Callable, Optional
+
+# Nesting limit for include.path, matching git's own limit
+MAX_INCLUDE_DEPTH = 10
+
+_ESCAPES = {'"': '"', "\\": "\\", "n": "\n", "t": "\t", "b": "\b"}
+
+
+class GitConfigError(Exception):
+    """Raised when git metadata cannot be resolved natively."""
+    pass
+
+
+def resolve_git_dir(worktree: Path) -> Path:
+    """Return the git directory for a working tree.
+
+    Follows ``gitdir:`` pointer files used by linked worktrees and
+    submodules.
+
+    Args:
+        worktree: Directory containing ``.git``
+
+    Returns:
+        Path to the repository's git directory
+    """
+    dot_git = worktree / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    try:
+        content = dot_git.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError) as e:
+        raise GitConfigError(f"Cannot read {dot_git}: {e}") from e
+    if not content.startswith("gitdir:"):
+        raise GitConfigError(f"Unrecognized .git file: {dot_git}")
+    git_dir = Path(content[len("gitdir:"):].strip())
+    if not git_dir.is_absolute():
+        git_dir = worktree / git_dir
+    if not git_dir.is_dir():
+        raise GitConfigError(f"gitdir does not exist: {git_dir}")
+    return git_dir
+
+
+def _common_dir(git_dir: Path) -> Path:
+    """Return the common git directory (differs for linked worktrees)."""
+    commondir_file = git_dir / "commondir"
+    try:
+        common = Path(commondir_file.read_text(encoding="utf-8").strip())
+    except FileNotFoundError:
+        return git_dir
+    except (OSError, UnicodeDecodeError) as e:
+        raise GitConfigError(f"Cannot read {commondir_file}: {e}") from e
+    return common if common.is_absolute() else git_dir / common
+
+
+def _parse_value(raw: str, path: Path, lineno: int) -> tuple[str, bool]:
+    """Parse a config value, returning (value, continues_on_next_line)."""
+    out = []
+    pending_ws = ""
+    in_quotes = False
+    i = 0
+    while i < len(raw):
+        ch = raw[i]
+        if ch == "\\":
+            if i + 1 == len(raw):
+                return "".join(out) + pending_ws, True
+            esc = raw[i + 1]
+            if esc not in _ESCAPES:
+                raise GitConfigError(f"{path}:{lineno}: bad escape \\{esc}")
+            out.append(pending_ws + _ESCAPES[esc])
+            pending_ws = ""
+            i += 2
+            continue
+        if ch == '"':
+            in_quotes = not in_quotes
+        elif not in_quotes and ch in "#;":
+            break
+        elif not in_quotes and ch.isspace():
+            if out:
+                pending_ws += ch
+        else:
+            out.append(pending_ws + ch)
+            pending_ws = ""
+        i += 1
+    if in_quotes:
+        raise GitConfigError(f"{path}:{lineno}: unterminated quote")
+    return "".join(out), False
+
+
+def _parse_section(header: str, path: Path, lineno: int) -> tuple[str, str]:
+    """Parse the inside of a ``[...]`` header into (section, subsection)."""
+    header = header.strip()
+    if '"' in header:
+        name, _, rest = header.partition('"')
+        if not rest.endswith('"'):
+            raise GitConfigError(f"{path}:{lineno}: bad section header")
+        sub = rest[:-1]
+        for esc in ('\\"', "\\\\"):
+            sub = sub.replace(esc, esc[1])
+        return name.strip().lower(), sub
+    name, _, sub = header.partition(".")
+    # Deprecated [section.subsection] syntax is case-insensitive
+    return name.lower(), sub.lower()
+
+
+def parse_config(path: Path) -> list[tuple[str, str, str, str]]:
+    """Parse a git config file.
+
+    Args:
+        path: Config file to read
+
+    Returns:
+        List of (section, subsection, key, value) in file order. Section
+        and key names are lower-cased; subsections keep their case.
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        raise GitConfigError(f"Cannot read {path}: {e}") from e
+
+    entries = []
+    section = subsection = None
+    lines = text.splitlines()
+    lineno = 0
+    while lineno < len(lines):
+        line = lines[lineno].strip()
+        lineno += 1
+        if line.startswith("["):
+            end = line.find("]")
+            if end < 0:
+                raise GitConfigError(f"{path}:{lineno}: bad section header")
+            section, subsection = _parse_section(line[1:end], path, lineno)
+            line = line[end + 1:].strip()
+        if not line or line[0] in "#;":
+            continue
+        if section is None:
+            raise GitConfigError(f"{path}:{lineno}: key outside section")
+
+        key, sep, raw = line.partition("=")
+        key = key.strip().lower()
+        if not key or not (key[0].isalpha()) or not all(
+            c.isalnum() or c == "-" for c in key
+        ):
+            raise GitConfigError(f"{path}:{lineno}: bad key {key!r}")
+        if not sep:
+            # A bare key is boolean true
+            entries.append((section, subsection, key, "true"))
+            continue
+
+        value, continues = _parse_value(raw.strip(), path, lineno)
+        while continues:
+            if lineno >= len(lines):
+                raise GitConfigError(f"{path}:{lineno}: dangling backslash")
+            more, continues = _parse_value(lines[lineno], path, lineno + 1)
+            value += more
+            lineno += 1
+        entries.append((section, subsection, key, value))
+    return entries
+
+
+def _expand_path(value: str, base: Path) -> Path:
+    """Expand ``~`` and resolve a path relative to the including file."""
+    path = Path(os.path.expanduser(value))
+    return path if path.is_absolute() else base / path
+
+
+def wildmatch_regex(pattern: str) -> "re.Pattern[str]":
+    """Compile a git wildmatch pattern (``*``, ``?``, ``[...]``, ``**``).
+
+    ``*`` and ``?`` never match ``/``; ``**`` between slashes matches any
+    number of directories.
+    """
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif pattern[i] == "[":
+            end = pattern.find("]", i + 2)
+            if end < 0:
+                out.append(re.escape("["))
+                i += 1
+                continue
+            body = pattern[i + 1:end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append("[" + body.replace("\\", "\\\\") + "]")
+            i = end + 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile("".join(out) + r"\Z", re.DOTALL)
+
+
+def _gitdir_matches(pattern: str, git_dir: Path, base: Path,
+                    ignore_case: bool) -> bool:
+    """Evaluate an ``includeIf "gitdir:<pattern>"`` condition."""
+    if pattern.startswith("./"):
+        pattern = str(base / pattern[2:])
+    pattern = os.path.expanduser(pattern)
+    if not (pattern.startswith("/") or pattern.startswith("**/")):
+        pattern = "**/" + pattern
+    if pattern.endswith("/"):
+        pattern += "**"
+    if ignore_case:
+        pattern = pattern.lower()
+    regex = wildmatch_regex(pattern)
+    for candidate in {str(git_dir.absolute()), str(git_dir.resolve())}:
+        if ignore_case:
+            candidate = candidate.lower()
+        if regex.match(candidate):
+            return True
+    return False
+
+
+def _resolve_includes(
+    path: Path,
+    git_dir: Path,
+    depth: int = 0,
+    parse: Optional[Callable[[Path], list]] = None,
+) -> list[tuple[str, str, str, str]]:
+    """Parse a config file and splice in included files in place.
+
+    Args:
+        path: Config file
+        git_dir: Repository the ``includeIf`` conditions are checked for
+        depth: Include nesting level of ``path``
+        parse: Parses one file, here and for every included file
+            (parse_config() if None)
+    """
+    if depth > MAX_INCLUDE_DEPTH:
+        raise GitConfigError(f"Include depth exceeded at {path}")
+
+    resolved = []
+    for entry in (parse or parse_config)(path):
+        section, subsection, key, value = entry
+        resolved.append(entry)
+        if key != "path" or section not in ("include", "includeif"):
+            continue
+        if section == "includeif":
+            if subsection.startswith("gitdir:"):
+                cond, ignore_case = subsection[len("gitdir:"):], False
+            elif subsection.startswith("gitdir/i:"):
+                cond, ignore_case = subsection[len("gitdir/i:"):], True
+            else:
+                raise GitConfigError(
+                    f"Unsupported includeIf condition: {subsection}"
+                )
+            if not _gitdir_matches(cond, git_dir, path.parent, ignore_case):
+                continue
+        include = _expand_path(value, path.parent)
+        if include.is_file():
+            resolved.extend(
+                _resolve_includes(include, git_dir, depth + 1, parse)
+            )
+    return resolved
+
+
+def _system_config_files() -> list[Path]:
+    """Return the system and global config files git would read."""
+    files = []
+    if not os.environ.get("GIT_CONFIG_NOSYSTEM"):
+        files.append(
+            Path(os.environ.get("GIT_CONFIG_SYSTEM", "/etc/gitconfig"))
+        )
+    if "GIT_CONFIG_GLOBAL" in os.environ:
+        files.append(Path(os.environ["GIT_CONFIG_GLOBAL"]))
+    else:
+        xdg = (
+            os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+        )
+        files.append(Path(xdg) / "git" / "config")
+        files.append(Path.home() / ".gitconfig")
+    return files
+
+
+def apply_instead_of(
+    url: str, entries: list[tuple[str, str, str, str]]
+) -> str:
+    """Apply ``url.<base>.insteadOf`` rewrites (longest prefix wins)."""
+    best_prefix, best_base = "", None
+    for section, subsection, key, value in entries:
+        if section == "url" and key == "insteadof":
+            if url.startswith(value) and len(value) > len(best_prefix):
+                best_prefix, best_base = value, subsection
+    if best_base is None:
+        return url
+    return best_base + url[len(best_prefix):]
+
+
+class GitMetadataReader:
+    """Resolve git remotes by reading config files.
+
+    System and global config files, and the files they include, are
+    parsed once per reader; only their ``includeIf`` conditions are
+    evaluated per repository, so one reader should be shared across a
+    scan.
+    """
+
+    def __init__(self):
+        self._outer_files = [
+            p for p in _system_config_files() if p.is_file()
+        ]
+        self._parsed: dict[Path, list[tuple[str, str, str, str]]] = {}
+
+    def _parse_outer(self, path: Path) -> list[tuple[str, str, str, str]]:
+        """parse_config() for files outside repositories, memoized."""
+        entries = self._parsed.get(path)
+        if entries is None:
+            entries = self._parsed[path] = parse_config(path)
+        return entries
+
+    def config_entries(
+        self, worktree: Path
+    ) -> list[tuple[str, str, str, str]]:
+        """Return all config entries visible to a repository, in git order."""
+        git_dir = resolve_git_dir(worktree)
+        common = _common_dir(git_dir)
+
+        entries = []
+        for path in self._outer_files:
+            entries.extend(_resolve_includes(
+                path, git_dir, parse=self._parse_outer
+            ))
+
+        repo_config = common / "config"
+        if not repo_config.is_file():
+            raise GitConfigError(f"Missing repository config: {repo_config}")
+        entries.extend(_resolve_includes(repo_config, git_dir))
+
+        worktree_config = git_dir / "config.worktree"
+        if worktree_config.is_file():
+            entries.extend(_resolve_includes(worktree_config, git_dir))
+        return entries
+
+    def remote_url(
+        self, worktree: Path, remote: str = "origin"
+    ) -> Optional[str]:
+        """Return the (rewritten) URL of a remote, or None if it has none.
+
+        Raises:
+            GitConfigError: If the metadata cannot be resolved natively
+        """
+        entries = self.config_entries(worktree)
+        urls = [
+            value for section, subsection, key, value in entries
+            if section == "remote" and subsection == remote and key == "url"
+        ]
+        if not urls:
+            # Legacy remotes stored outside config are left to git
+            common = _common_dir(resolve_git_dir(worktree))
+            for legacy in ("remotes", "branches"):
+                if (common / legacy / remote).exists():
+                    raise GitConfigError(f"Legacy {legacy}/{remote} file")
+            return None
+        return apply_instead_of(urls[0], entries)
@@ -0,0 +1,134 @@
+"""On-disk cache of validated HTTP GET responses.
+
+Entries are keyed by URL and by the identity of the credentials used, so
+responses fetched with one token are never replayed for another. Each
+entry keeps the body, validators (``ETag``, ``Last-Modified``), ``Link``
+and any headers the client asks for (e.g. GitLab's paging headers); a
+client sends the validators back as ``If-None-Match`` /
+``If-Modified-Since`` and reuses the stored body and headers when the
+server answers ``304 Not Modified``.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Response headers stored with each entry
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Link")
+
+
+def credential_identity(token: Optional[str]) -> str:
+    """Return a non-reversible identity for a token ("" if anonymous)."""
+    if not token:
+        return ""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class HTTPCache:
+    """Directory of cached responses, one JSON file per URL."""
+
+    VERSION = 2
+
+    def __init__(self, directory: Path, identity: str = ""):
+        """Initialize the cache.
+
+        Args:
+            directory: Where entries are stored
+            identity: Credential identity, see credential_identity()
+        """
+        self.directory = directory
+        self.identity = identity
+
+    def _entry_path(self, url: str) -> Path:
+        key = hashlib.sha256(
+            f"{self.identity}\0{url}".encode()
+        ).hexdigest()
+        return self.directory / key[:2] / f"{key}.json"
+
+    def lookup(self, url: str) -> Optional[dict]:
+        """Return the stored entry for ``url``, or None."""
+        try:
+            with open(self._entry_path(url), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if entry.get("version") != self.VERSION or entry.get("url") != url:
+            return None
+        return entry
+
+    def conditional_headers(self, entry: Optional[dict]) -> dict:
+        """Request headers revalidating ``entry``."""
+        if entry is None:
+            return {}
+        headers = {}
+        stored = CaseInsensitiveDict(entry["headers"])
+        if "ETag" in stored:
+            headers["If-None-Match"] = stored["ETag"]
+        if "Last-Modified" in stored:
+            headers["If-Modified-Since"] = stored["Last-Modified"]
+        return headers
+
+    def store(
+        self,
+        url: str,
+        response: requests.Response,
+        extra_headers: tuple[str, ...] = (),
+    ) -> None:
+        """Store a 200 response that carries a validator.
+
+        Args:
+            url: Request URL
+            response: Response to store
+            extra_headers: Headers kept besides KEPT_HEADERS, restored
+                by replay()
+        """
+        headers = {
+            name: response.headers[name]
+            for name in (*KEPT_HEADERS, *extra_headers)
+            if name in response.headers
+        }
+        if "ETag" not in headers and "Last-Modified" not in headers:
+            return
+        entry = {
+            "version": self.VERSION,
+            "url": url,
+            "headers": headers,
+            "body": response.text,
+        }
+        path = self._entry_path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp file: pages are stored from several threads
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def replay(self, entry: dict, response: requests.Response
+               ) -> requests.Response:
+        """Turn a 304 ``response`` into a 200 carrying the cached body."""
+        cached = requests.Response()
+        cached.status_code = 200
+        cached.reason = "OK (cached)"
+        cached.url = entry["url"]
+        cached.request = response.request
+        cached.headers = CaseInsensitiveDict(entry["headers"])
+        # Fresh rate limit and validator headers from the 304 win
+        for name, value in response.headers.items():
+            if name.lower() not in ("content-length", "transfer-encoding"):
+                cached.headers[name] = value
+        cached.encoding = "utf-8"
+        cached._content = entry["body"].encode("utf-8")
+        cached.from_cache = True
+        return cached
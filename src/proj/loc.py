@@ -0,0 +1,367 @@
+"""Lines of code per language for ``proj inv analyze --loc``.
+
+LocCounter walks a project with ``os.scandir`` in a thread pool, one task
+per directory, applying the same pruning as ``proj inv scan local``
+(``.git``, ``node_modules``, configured excludes, ``.projignore`` and,
+optionally, ``.gitignore``). Source files are recognized by name or
+suffix and read in CHUNK_SIZE blocks, counting newlines without
+decoding.
+
+LocCache keeps every counted file's mtime, size and inode with its line
+count, grouped by project root, so a rerun only reads files whose stat
+changed; the per-file stat is still needed, since editing a file does
+not touch its directory.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Optional
+
+from proj.scanner import PRUNE_DIRS, IgnoreRules, ScanCache, ScanFilter
+
+# Bytes read per call when counting lines
+CHUNK_SIZE = 1 << 20
+
+# File suffix -> language. Names match the proj.detectors languages so
+# counted and detected lists merge in ranked_languages(); framework files
+# (.vue, .svelte) and build files (Makefile, Dockerfile) are not counted
+SUFFIX_LANGUAGES = {
+    ".py": "Python", ".pyi": "Python", ".pyx": "Python",
+    ".js": "JavaScript", ".mjs": "JavaScript", ".cjs": "JavaScript",
+    ".jsx": "JavaScript",
+    ".ts": "TypeScript", ".tsx": "TypeScript", ".mts": "TypeScript",
+    ".rs": "Rust",
+    ".go": "Go",
+    ".java": "Java",
+    ".kt": "Kotlin", ".kts": "Kotlin",
+    ".scala": "Scala",
+    ".clj": "Clojure", ".cljs": "Clojure", ".cljc": "Clojure",
+    ".rb": "Ruby",
+    ".cs": "C#",
+    ".fs": "F#", ".fsx": "F#",
+    ".php": "PHP",
+    ".ex": "Elixir", ".exs": "Elixir",
+    ".erl": "Erlang", ".hrl": "Erlang",
+    ".hs": "Haskell",
+    ".swift": "Swift",
+    ".dart": "Dart",
+    ".c": "C/C++", ".h": "C/C++",
+    ".cc": "C/C++", ".cpp": "C/C++", ".cxx": "C/C++", ".hh": "C/C++",
+    ".hpp": "C/C++", ".hxx": "C/C++",
+    ".m": "Objective-C", ".mm": "Objective-C",
+    ".zig": "Zig",
+    ".jl": "Julia",
+    ".tf": "HCL", ".hcl": "HCL",
+    ".lua": "Lua",
+    ".r": "R", ".R": "R",
+    ".pl": "Perl", ".pm": "Perl",
+    ".sh": "Shell", ".bash": "Shell", ".zsh": "Shell",
+    ".ps1": "PowerShell",
+    ".sql": "SQL",
+    ".html": "HTML", ".htm": "HTML",
+    ".css": "CSS", ".scss": "SCSS", ".sass": "SCSS", ".less": "Less",
+}
+
+# Exact file name -> language, for files without a telling suffix
+NAME_LANGUAGES = {
+    "Rakefile": "Ruby", "Gemfile": "Ruby",
+}
+
+
+def file_language(name: str) -> Optional[str]:
+    """Language of a file by name or suffix, or None if not source."""
+    language = NAME_LANGUAGES.get(name)
+    if language is None:
+        language = SUFFIX_LANGUAGES.get(os.path.splitext(name)[1])
+    return language
+
+
+def count_lines(path: str, chunk_size: int = CHUNK_SIZE) -> Optional[int]:
+    """Count a file's lines, reading it in ``chunk_size`` blocks.
+
+    A last line without a trailing newline still counts. Returns None
+    for binary files (a NUL byte in the first block) and unreadable ones.
+    """
+    lines = 0
+    last = b"\n"
+    try:
+        with open(path, "rb", buffering=0) as f:
+            chunk = f.read(chunk_size)
+            if b"\0" in chunk:
+                return None
+            while chunk:
+                lines += chunk.count(b"\n")
+                last = chunk[-1:]
+                chunk = f.read(chunk_size)
+    except OSError:
+        return None
+    return lines if last == b"\n" else lines + 1
+
+
+class LocCache:
+    """Persistent per-file line counts for incremental ``--loc`` runs.
+
+    Records are grouped by project root and keyed by path relative to
+    it, and reused while the file's mtime, size and inode are unchanged.
+    Saving replaces the whole entry of each root counted this run, so
+    records of deleted files are dropped without scanning other roots.
+    Files modified within ScanCache.RACY_WINDOW_NS of the run are not
+    cached.
+    """
+
+    VERSION = 2
+
+    def __init__(self, roots: Optional[dict] = None, use_cached: bool = True):
+        """Initialize cache.
+
+        Args:
+            roots: Previously saved ``{root: {relpath: record}}``
+            use_cached: Reuse records (False recounts every file while
+                still recording fresh counts)
+        """
+        self.roots = roots or {}
+        self.use_cached = use_cached
+        self.updated: dict[str, dict[str, list]] = {}
+        self._started_ns = time.time_ns()
+
+    @classmethod
+    def load(cls, path: Path, use_cached: bool = True) -> "LocCache":
+        """Load cache from file, starting empty if missing or unreadable."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return cls(use_cached=use_cached)
+        if not isinstance(data, dict) or data.get("version") != cls.VERSION:
+            return cls(use_cached=use_cached)
+        return cls(data.get("roots", {}), use_cached=use_cached)
+
+    def save(self, path: Path) -> None:
+        """Save cache, replacing the records of roots counted this run."""
+        roots = {**self.roots, **self.updated}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "roots": roots}, f)
+        os.replace(tmp_path, path)
+
+    def begin(self, root: str) -> None:
+        """Start recording a root; its saved records are replaced."""
+        self.updated[root] = {}
+
+    def lookup(
+        self, root: str, relpath: str, st: os.stat_result
+    ) -> Optional[list]:
+        """Return ``[mtime_ns, size, ino, lines]`` if the file is unchanged.
+
+        ``lines`` is None for a file found to be binary.
+        """
+        if not self.use_cached:
+            return None
+        record = self.roots.get(root, {}).get(relpath)
+        if (
+            record
+            and record[0] == st.st_mtime_ns
+            and record[1] == st.st_size
+            and record[2] == st.st_ino
+        ):
+            self.updated[root][relpath] = record
+            return record
+        return None
+
+    def store(
+        self,
+        root: str,
+        relpath: str,
+        st: os.stat_result,
+        lines: Optional[int],
+    ) -> None:
+        """Record a fresh line count."""
+        if st.st_mtime_ns >= self._started_ns - ScanCache.RACY_WINDOW_NS:
+            return
+        self.updated[root][relpath] = [
+            st.st_mtime_ns, st.st_size, st.st_ino, lines,
+        ]
+
+
+@dataclass
+class LocStats:
+    """Counters collected while counting lines."""
+
+    dirs_scanned: int = 0
+    dirs_skipped: int = 0
+    files_read: int = 0
+    files_cached: int = 0
+    bytes_read: int = 0
+
+    def merge(self, other: "LocStats") -> None:
+        """Add another set of counters into this one."""
+        for f in fields(self):
+            total = getattr(self, f.name) + getattr(other, f.name)
+            setattr(self, f.name, total)
+
+
+class LocCounter:
+    """Counts files and lines per language under project roots.
+
+    Directories are listed and their files counted by ``jobs`` worker
+    threads; subdirectories are queued as soon as their parent is
+    listed, so one large monorepo keeps every worker busy. Use as a
+    context manager, or call close(), to shut the pool down.
+    """
+
+    def __init__(
+        self,
+        jobs: int = 1,
+        ignore: Optional[ScanFilter] = None,
+        cache: Optional[LocCache] = None,
+    ):
+        self.jobs = max(1, jobs)
+        self.ignore = ignore
+        self.cache = cache
+        self.stats = LocStats()
+        self._pool = (
+            ThreadPoolExecutor(max_workers=self.jobs)
+            if self.jobs > 1 else None
+        )
+
+    def __enter__(self) -> "LocCounter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown()
+
+    def count(self, root: str) -> Optional[dict]:
+        """Count a project's source files and lines.
+
+        Returns:
+            ``{language: {"files": n, "lines": n}}`` ordered by lines,
+            largest first, or None if root is not a directory
+        """
+        root = os.path.abspath(root)
+        if not os.path.isdir(root):
+            return None
+        if self.cache is not None:
+            self.cache.begin(root)
+        root_rules = (
+            self.ignore.root_rules(root) if self.ignore is not None else None
+        )
+        totals: dict[str, list[int]] = {}
+
+        def collect(result) -> list:
+            counts, children, stats = result
+            for language, (files, lines) in counts.items():
+                total = totals.setdefault(language, [0, 0])
+                total[0] += files
+                total[1] += lines
+            self.stats.merge(stats)
+            return children
+
+        if self._pool is None:
+            tasks = [(root, ())]
+            while tasks:
+                path, rule_dirs = tasks.pop()
+                tasks.extend(collect(
+                    self._count_dir(path, root, root_rules, rule_dirs)
+                ))
+        else:
+            pending = {self._pool.submit(
+                self._count_dir, root, root, root_rules, ()
+            )}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for path, rule_dirs in collect(future.result()):
+                        pending.add(self._pool.submit(
+                            self._count_dir, path, root, root_rules,
+                            rule_dirs,
+                        ))
+
+        ranked = sorted(
+            totals.items(), key=lambda item: (-item[1][1], item[0])
+        )
+        return {
+            language: {"files": files, "lines": lines}
+            for language, (files, lines) in ranked
+        }
+
+    def _count_dir(
+        self,
+        path: str,
+        root: str,
+        root_rules: Optional[IgnoreRules],
+        rule_dirs: tuple[str, ...],
+    ) -> tuple[dict, list, LocStats]:
+        """List one directory and count its source files.
+
+        Returns:
+            Tuple of ({language: [files, lines]}, subdirectories as
+            (path, rule_dirs), counters)
+        """
+        stats = LocStats()
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return {}, [], stats
+        stats.dirs_scanned += 1
+
+        ignore = self.ignore
+        if (
+            ignore is not None
+            and ignore.use_gitignore
+            and any(entry.name == ".gitignore" for entry in entries)
+        ):
+            rule_dirs = rule_dirs + (path,)
+
+        def ignored(entry_path: str) -> bool:
+            return ignore is not None and ignore.is_ignored(
+                entry_path, root, root_rules, rule_dirs
+            )
+
+        counts: dict[str, list[int]] = {}
+        children = []
+        cache = self.cache
+        prefix_len = len(os.path.join(root, ""))
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in PRUNE_DIRS or ignored(entry.path):
+                        stats.dirs_skipped += 1
+                    else:
+                        children.append((entry.path, rule_dirs))
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                language = file_language(entry.name)
+                if language is None or ignored(entry.path):
+                    continue
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            relpath = entry.path[prefix_len:]
+            record = cache.lookup(root, relpath, st) if cache else None
+            if record is not None:
+                lines = record[3]
+                stats.files_cached += 1
+            else:
+                lines = count_lines(entry.path)
+                stats.files_read += 1
+                stats.bytes_read += st.st_size
+                if cache is not None:
+                    cache.store(root, relpath, st, lines)
+            if lines is None:
+                continue
+            total = counts.setdefault(language, [0, 0])
+            total[0] += 1
+            total[1] += lines
+        return counts, children, stats
@@ -0,0 +1,213 @@
+"""Streaming dependency extraction from lockfiles.
+
+Lockfiles can run to tens of megabytes, so none is loaded whole: each
+parser reads its file in CHUNK_SIZE pieces (or line by line) and yields
+``(name, version)`` pairs as it goes. Working memory is bounded by the
+chunk size and the longest single token, not by the file size; only
+the distinct pairs collected by read_lockfile() grow with the input.
+
+``package-lock.json`` is tokenized with one regular expression that
+returns strings (flagged when they are object keys) and brackets, and
+skips everything else, so only the nesting path is tracked. The other
+formats are line oriented and parsed one line at a time.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, TextIO
+
+# Characters read per chunk by the JSON tokenizer
+CHUNK_SIZE = 1 << 20
+
+Pair = tuple[str, str]
+
+# Anything up to the next string or bracket (whitespace, commas, colons
+# and literals), then a string (with a following colon when it is an
+# object key) or a bracket
+_JSON_TOKEN = re.compile(
+    r'[^"{}\[\]]*(?:"([^"\\]*(?:\\.[^"\\]*)*)"(\s*:)?|([{}\[\]]))',
+    re.DOTALL,
+)
+_WHITESPACE_TO_END = re.compile(r"\s*\Z")
+
+
+def _json_string(raw: str) -> str:
+    return json.loads(f'"{raw}"') if "\\" in raw else raw
+
+
+def iter_json_tokens(
+    f: TextIO, chunk_size: int = CHUNK_SIZE
+) -> Iterator[tuple[str, str]]:
+    """Yield ``("key" | "string" | "open" | "close", text)`` tokens.
+
+    Numbers, booleans and null are skipped. A token cut by a chunk
+    boundary is carried over to the next read, so tokens never split.
+    """
+    buffer = ""
+    eof = False
+    while not eof:
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buffer += chunk
+        pos = 0
+        for match in _JSON_TOKEN.finditer(buffer):
+            if match.start() != pos:
+                break  # an unterminated string: wait for more input
+            raw, colon, bracket = match.groups()
+            if bracket:
+                kind = "open" if bracket in "{[" else "close"
+                yield kind, bracket
+            elif colon:
+                yield "key", _json_string(raw)
+            else:
+                # "name" at the end of the buffer may yet be followed by
+                # a colon in the next chunk
+                if not eof and _WHITESPACE_TO_END.match(buffer, match.end()):
+                    break
+                yield "string", _json_string(raw)
+            pos = match.end()
+        buffer = buffer[pos:]
+
+
+def parse_package_lock(f: TextIO) -> Iterator[Pair]:
+    """Yield pairs from npm's ``package-lock.json`` (lockfile v1-v3).
+
+    v2 and v3 list every installed package under ``packages``, keyed by
+    its ``node_modules`` path. v1 nests packages under ``dependencies``;
+    that tree is only read when no ``packages`` section came first.
+    """
+    path: list[Optional[str]] = []  # keys of the open containers
+    key = None
+    saw_packages = False
+    for kind, text in iter_json_tokens(f):
+        if kind == "key":
+            key = text
+        elif kind == "open":
+            path.append(key)
+            key = None
+            if len(path) == 2 and path[1] == "packages":
+                saw_packages = True
+        elif kind == "close":
+            if path:
+                path.pop()
+            key = None
+        else:
+            if key == "version":
+                if (
+                    len(path) == 3
+                    and path[1] == "packages"
+                    and "node_modules/" in path[2]
+                ):
+                    name = path[2].rsplit("node_modules/", 1)[1]
+                    yield name, text
+                elif (
+                    not saw_packages
+                    and len(path) >= 3
+                    and len(path) % 2 == 1
+                    and all(part == "dependencies" for part in path[1::2])
+                ):
+                    yield path[-1], text
+            key = None
+
+
+def _yarn_name(spec: str) -> str:
+    # "@scope/name@^1.0.0" or "name@npm:^1.0.0" -> package name
+    spec = spec.strip().strip('"')
+    at = spec.find("@", 1)
+    return spec[:at] if at > 0 else spec
+
+
+def parse_yarn_lock(f: TextIO) -> Iterator[Pair]:
+    """Yield pairs from ``yarn.lock`` (classic v1 and Berry)."""
+    name = None
+    for line in f:
+        if not line.strip() or line.startswith("#"):
+            continue
+        if not line[0].isspace():
+            header = line.rstrip().rstrip(":")
+            first = header.split(",", 1)[0]
+            name = None
+            if first.strip('"') != "__metadata" and "@workspace:" not in first:
+                name = _yarn_name(first)
+            continue
+        stripped = line.strip()
+        if name and stripped.startswith("version"):
+            # version "1.2.3" (v1) or version: 1.2.3 (Berry)
+            version = stripped[len("version"):].lstrip(" :").strip('"')
+            if version:
+                yield name, version
+            name = None
+
+
+_TOML_STRING = re.compile(r'^(name|version)\s*=\s*"([^"]*)"')
+
+
+def parse_toml_packages(f: TextIO) -> Iterator[Pair]:
+    """Yield pairs from ``[[package]]`` tables.
+
+    Covers ``poetry.lock``, ``uv.lock`` and ``Cargo.lock``, which all
+    give each package a ``[[package]]`` table with top-level ``name``
+    and ``version`` keys. Keys of sub-tables and inline tables are
+    ignored.
+    """
+    in_package = False
+    name = version = None
+    for line in f:
+        if line.startswith("["):
+            if in_package and name and version:
+                yield name, version
+            in_package = line.strip() == "[[package]]"
+            name = version = None
+            continue
+        if in_package:
+            match = _TOML_STRING.match(line)
+            if match:
+                if match.group(1) == "name":
+                    name = match.group(2)
+                else:
+                    version = match.group(2)
+    if in_package and name and version:
+        yield name, version
+
+
+def parse_go_sum(f: TextIO) -> Iterator[Pair]:
+    """Yield pairs from ``go.sum``.
+
+    Each module version has a line for its content and one for its
+    ``go.mod``; both yield the same pair.
+    """
+    for line in f:
+        fields = line.split()
+        if len(fields) >= 2:
+            yield fields[0], fields[1].removesuffix("/go.mod")
+
+
+# Lockfile name -> parser
+LOCKFILES: dict[str, Callable[[TextIO], Iterable[Pair]]] = {
+    "package-lock.json": parse_package_lock,
+    "yarn.lock": parse_yarn_lock,
+    "poetry.lock": parse_toml_packages,
+    "uv.lock": parse_toml_packages,
+    "Cargo.lock": parse_toml_packages,
+    "go.sum": parse_go_sum,
+}
+
+
+def iter_lockfile(path: Path) -> Iterator[Pair]:
+    """Stream the ``(name, version)`` pairs of a known lockfile."""
+    parser = LOCKFILES[Path(path).name]
+    with open(path, encoding="utf-8", errors="replace") as f:
+        yield from parser(f)
+
+
+def read_lockfile(path: Path) -> list[list[str]]:
+    """Distinct ``[name, version]`` pairs of a lockfile, sorted.
+
+    Returns an empty list if the file cannot be read.
+    """
+    try:
+        pairs = set(iter_lockfile(path))
+    except (OSError, ValueError):
+        return []
+    return [list(pair) for pair in sorted(pairs)]
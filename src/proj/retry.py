@@ -0,0 +1,171 @@
+"""Retry policy and circuit breaker for work-prod API requests.
+
+RetryPolicy decides which failed requests are retried and how long to
+wait first: idempotent methods only (PATCH on request), after connection
+errors, timeouts and 429/502/503/504 responses, with exponential backoff
+and full jitter unless the server sends ``Retry-After``.
+
+CircuitBreaker stops a batch of requests from timing out one by one
+against a backend that is down: after ``threshold`` consecutive
+connection failures it opens and requests fail immediately until
+``reset_after`` seconds pass; then one trial request is let through and
+its outcome closes or re-opens the circuit.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+import requests
+
+from proj.error_handler import CircuitOpenError
+
+# Methods that can be repeated without changing the outcome
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Responses worth retrying: rate limited or backend briefly unavailable
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+def retry_after_seconds(
+    response: requests.Response, now: Optional[datetime] = None
+) -> Optional[float]:
+    """Return the delay a ``Retry-After`` header asks for, if any.
+
+    Accepts both forms of the header: delta seconds and an HTTP date.
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Which requests are retried, how often and after what delay."""
+
+    retries: int = 3
+    backoff: float = 0.5
+    max_delay: float = 30.0
+    retry_patch: bool = False
+    jitter: bool = True
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        """True if a failed ``attempt`` (0-based) of ``method`` may repeat."""
+        if attempt >= self.retries:
+            return False
+        method = method.upper()
+        return method in IDEMPOTENT_METHODS or (
+            method == "PATCH" and self.retry_patch
+        )
+
+    def delay(
+        self, attempt: int, response: Optional[requests.Response] = None
+    ) -> Optional[float]:
+        """Seconds to wait before retrying, or None to give up.
+
+        A ``Retry-After`` header is honored as long as it is within
+        ``max_delay``; otherwise the delay grows exponentially from
+        ``backoff`` and, with jitter, is drawn uniformly below that bound
+        so clients that failed together do not retry together.
+        """
+        if response is not None:
+            retry_after = retry_after_seconds(response)
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_delay else None
+        bound = min(self.max_delay, self.backoff * 2 ** attempt)
+        return random.uniform(0, bound) if self.jitter else bound
+
+
+class CircuitBreaker:
+    """Fail fast after repeated connection failures."""
+
+    def __init__(
+        self,
+        threshold: int = 5,
+        reset_after: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the breaker.
+
+        Args:
+            threshold: Consecutive failures that open the circuit
+            reset_after: Seconds before an open circuit lets a trial
+                request through
+            clock: Monotonic clock (replaceable in tests)
+        """
+        self.threshold = max(1, threshold)
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._clock = clock
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """True while requests are being refused."""
+        return self.opened_at is not None
+
+    def before_request(self) -> bool:
+        """Admit a request or refuse it while the circuit is open.
+
+        Returns:
+            True if the request is the half-open trial; the caller must
+            end it with record_success(), record_failure() or
+            release_trial()
+
+        Raises:
+            CircuitOpenError: The circuit is open, or a trial request is
+                already in flight
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return False
+            waited = self._clock() - self.opened_at
+            if waited >= self.reset_after and not self._trial:
+                # Half open: let one request find out if the backend is back
+                self._trial = True
+                return True
+            retry_in = max(0.0, self.reset_after - waited)
+        raise CircuitOpenError(
+            f"Backend unreachable after {self.failures} consecutive "
+            f"failures; not retrying for {retry_in:.0f}s"
+        )
+
+    def record_success(self) -> None:
+        """Close the circuit after a request reached the backend."""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def release_trial(self) -> None:
+        """End a trial whose outcome says nothing about the backend.
+
+        The circuit stays open, and the next request becomes the trial.
+        A no-op once record_success() or record_failure() has run.
+        """
+        with self._lock:
+            self._trial = False
+
+    def record_failure(self) -> None:
+        """Count a connection failure, opening the circuit at threshold."""
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.threshold:
+                self.opened_at = self._clock()
+            self._trial = False
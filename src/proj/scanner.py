@@ -0,0 +1,955 @@
+"""Filesystem walker for discovering local projects.
+
+Walks each scan root once with ``os.scandir``, checking every directory
+for all project markers in a single listing instead of globbing the tree
+once per marker.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Callable, Iterator, NamedTuple, Optional
+
+from proj.gitmeta import wildmatch_regex
+
+# Files (or directories) whose presence marks a project root, in priority
+# order: the first marker found in a directory is the one recorded.
+PROJECT_MARKERS = (
+    ".git", "package.json", "pyproject.toml", "Cargo.toml", "go.mod"
+)
+
+# Directories that are never descended into
+PRUNE_DIRS = frozenset({".git", "node_modules"})
+
+# Entry names the walker needs from a listing (markers plus ignore files)
+TRACKED_NAMES = PROJECT_MARKERS + (".gitignore",)
+
+# Per-root ignore file, gitignore syntax, relative to the scan root
+PROJIGNORE_FILE = ".projignore"
+
+
+@dataclass
+class ScanStats:
+    """Counters collected while walking scan roots."""
+
+    dirs_scanned: int = 0
+    dirs_cached: int = 0
+    dirs_skipped: int = 0
+    dirs_aliased: int = 0
+    mounts_skipped: int = 0
+    entries_seen: int = 0
+    git_subprocess_avoided: int = 0
+    git_subprocess_calls: int = 0
+
+    def merge(self, other: "ScanStats") -> None:
+        """Add another set of counters into this one."""
+        for f in fields(self):
+            total = getattr(self, f.name) + getattr(other, f.name)
+            setattr(self, f.name, total)
+
+
+@dataclass
+class FoundProject:
+    """A project root discovered by the walker."""
+
+    path: Path
+    marker: str
+
+
+class _TrieNode:
+    """A path component in a PathTrie."""
+
+    __slots__ = ("children", "value", "has_value")
+
+    def __init__(self):
+        self.children: dict[str, "_TrieNode"] = {}
+        self.value = None
+        self.has_value = False
+
+
+class PathTrie:
+    """Mapping keyed by filesystem path, stored as a trie of components.
+
+    Membership and ancestor queries cost one dict lookup per path
+    component instead of a scan over every stored path or a filesystem
+    call per parent directory.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, path) -> bool:
+        node = self._find(path)
+        return node is not None and node.has_value
+
+    def _find(self, path) -> Optional[_TrieNode]:
+        node = self._root
+        for part in Path(path).parts:
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def get(self, path, default=None):
+        """Return the value stored at path, or default."""
+        node = self._find(path)
+        if node is None or not node.has_value:
+            return default
+        return node.value
+
+    def insert(self, path, value) -> bool:
+        """Store value at path unless a value is already there.
+
+        Returns:
+            True if inserted, False if path was already present
+        """
+        node = self._root
+        for part in Path(path).parts:
+            node = node.children.setdefault(part, _TrieNode())
+        if node.has_value:
+            return False
+        node.value = value
+        node.has_value = True
+        self._size += 1
+        return True
+
+    def ancestors(self, path) -> Iterator:
+        """Yield values stored at strict ancestors of path, outermost first."""
+        node = self._root
+        parts = Path(path).parts
+        for part in parts[:-1]:
+            node = node.children.get(part)
+            if node is None:
+                return
+            if node.has_value:
+                yield node.value
+
+
+class ScanCache:
+    """Persistent per-directory listing cache for incremental rescans.
+
+    Records each visited directory's mtime, inode and device together with
+    the tracked names (markers, ignore files) and subdirectories it
+    contained. A directory's
+    mtime changes whenever an entry is added, removed or renamed, so an
+    unchanged stat means the cached listing can be reused without calling
+    ``os.scandir``. Subdirectories are still stat-ed, because changes
+    further down do not touch the parent's mtime.
+    """
+
+    VERSION = 3
+
+    # Directories modified this close to the scan are not cached, since
+    # a later change within the same mtime tick would go unnoticed
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, dirs: Optional[dict] = None, use_cached: bool = True):
+        """Initialize cache.
+
+        Args:
+            dirs: Previously saved directory records keyed by path
+            use_cached: Reuse records (False forces a full walk while
+                still recording fresh listings)
+        """
+        self.dirs = dirs or {}
+        self.use_cached = use_cached
+        self.updated: dict[str, dict] = {}
+        self.roots: list[str] = []
+        self._started_ns = time.time_ns()
+
+    @classmethod
+    def load(cls, path: Path, use_cached: bool = True) -> "ScanCache":
+        """Load cache from file, starting empty if missing or unreadable."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return cls(use_cached=use_cached)
+        if not isinstance(data, dict) or data.get("version") != cls.VERSION:
+            return cls(use_cached=use_cached)
+        return cls(data.get("dirs", {}), use_cached=use_cached)
+
+    def save(self, path: Path) -> None:
+        """Save cache, replacing records under the roots walked this run."""
+        prefixes = tuple(root.rstrip(os.sep) + os.sep for root in self.roots)
+        dirs = {
+            key: record for key, record in self.dirs.items()
+            if key not in self.roots and not key.startswith(prefixes)
+        }
+        dirs.update(self.updated)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "dirs": dirs}, f)
+        os.replace(tmp_path, path)
+
+    def lookup(self, path: str, st: os.stat_result) -> Optional[dict]:
+        """Return the cached record for path if the directory is unchanged."""
+        if not self.use_cached:
+            return None
+        record = self.dirs.get(path)
+        if (
+            record
+            and record["mtime_ns"] == st.st_mtime_ns
+            and record["ino"] == st.st_ino
+            and record["dev"] == st.st_dev
+        ):
+            self.updated[path] = record
+            return record
+        return None
+
+    def store(
+        self,
+        path: str,
+        st: os.stat_result,
+        names: list[str],
+        subdirs: list[str],
+        links: list[str],
+    ) -> None:
+        """Record a fresh directory listing."""
+        if st.st_mtime_ns >= self._started_ns - self.RACY_WINDOW_NS:
+            return
+        self.updated[path] = {
+            "mtime_ns": st.st_mtime_ns,
+            "ino": st.st_ino,
+            "dev": st.st_dev,
+            "names": names,
+            "subdirs": subdirs,
+            "links": links,
+        }
+
+
+class IgnoreRules:
+    """Gitignore-style patterns anchored at a base directory.
+
+    Supports comments, ``!`` negation, trailing ``/``, leading or inner
+    ``/`` anchoring and ``*``/``?``/``[...]``/``**`` wildcards. The
+    walker only matches directories, since it prunes directories;
+    ``analyze --loc`` also matches source files.
+    """
+
+    def __init__(self, patterns: list[str]):
+        self._rules = []
+        for line in patterns:
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            elif line.startswith("\\"):
+                line = line[1:]
+            line = line.rstrip("/")
+            if not line:
+                continue
+            anchored = "/" in line
+            regex = wildmatch_regex(line.lstrip("/"))
+            self._rules.append((regex, anchored, negate))
+
+    @classmethod
+    def from_file(cls, path: str) -> Optional["IgnoreRules"]:
+        """Load rules from a file, or None if it cannot be read."""
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                return cls(f.readlines())
+        except OSError:
+            return None
+
+    def __bool__(self) -> bool:
+        return bool(self._rules)
+
+    def match(self, rel_path: str) -> Optional[bool]:
+        """Match a directory path relative to the rules' base.
+
+        Returns:
+            True if ignored, False if re-included by a negated pattern,
+            None if no pattern matches
+        """
+        name = rel_path.rsplit("/", 1)[-1]
+        for regex, anchored, negate in reversed(self._rules):
+            if regex.match(rel_path if anchored else name):
+                return not negate
+        return None
+
+
+class ScanFilter:
+    """Decides which directories a walk prunes.
+
+    Combines configured exclude globs and the scan root's ``.projignore``
+    (both relative to the root) with, optionally, every ``.gitignore``
+    found on the way down. Explicit excludes win: a ``.gitignore``
+    negation cannot re-include a directory the root rules exclude.
+    Among ``.gitignore`` files the deeper ones take precedence, as in git.
+    """
+
+    def __init__(self, exclude: Optional[list[str]] = None,
+                 use_gitignore: bool = False):
+        self.exclude = list(exclude or [])
+        self.use_gitignore = use_gitignore
+        self._gitignores: dict[str, Optional[IgnoreRules]] = {}
+
+    def root_rules(self, root: str) -> IgnoreRules:
+        """Build the rules anchored at a scan root."""
+        patterns = list(self.exclude)
+        try:
+            with open(os.path.join(root, PROJIGNORE_FILE),
+                      encoding="utf-8", errors="replace") as f:
+                patterns.extend(f.readlines())
+        except OSError:
+            pass
+        return IgnoreRules(patterns)
+
+    def gitignore(self, directory: str) -> Optional[IgnoreRules]:
+        """Return the (memoized) ``.gitignore`` rules of a directory."""
+        if directory not in self._gitignores:
+            self._gitignores[directory] = IgnoreRules.from_file(
+                os.path.join(directory, ".gitignore")
+            )
+        return self._gitignores[directory]
+
+    def is_ignored(
+        self,
+        path: str,
+        root: str,
+        root_rules: IgnoreRules,
+        rule_dirs: tuple[str, ...],
+    ) -> bool:
+        """Return True if the directory at path should be pruned."""
+        if root_rules and root_rules.match(_relpath(path, root)):
+            return True
+        for directory in reversed(rule_dirs):
+            rules = self.gitignore(directory)
+            if rules:
+                result = rules.match(_relpath(path, directory))
+                if result is not None:
+                    return result
+        return False
+
+
+def _relpath(path: str, base: str) -> str:
+    """Return path relative to base with ``/`` separators."""
+    rel = path[len(base):].lstrip(os.sep)
+    return rel.replace(os.sep, "/")
+
+
+class DirTask(NamedTuple):
+    """A directory waiting to be visited by the walker."""
+
+    path: str
+    depth: int
+    in_repo: bool
+    # Directories whose .gitignore applies below this one
+    rule_dirs: tuple[str, ...] = ()
+
+
+@dataclass
+class _Walk:
+    """Settings shared by every directory visit of one walk."""
+
+    root: str
+    max_depth: int
+    cache: Optional[ScanCache] = None
+    ignore: Optional[ScanFilter] = None
+    root_rules: Optional[IgnoreRules] = None
+    one_file_system: bool = False
+    follow_symlinks: bool = False
+    root_dev: Optional[int] = None
+    # (st_dev, st_ino) of every directory visited, to break symlink loops
+    # and skip trees reachable through several paths (bind mounts)
+    visited: set = field(default_factory=set)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    budget: Optional["ScanBudget"] = None
+
+
+def _read_dir(
+    path: str,
+    walk: _Walk,
+    stats: Optional[ScanStats],
+) -> Optional[tuple[list[str], list[str], list[str]]]:
+    """Return (tracked names, subdirectories, dir symlinks) for a directory.
+
+    Uses the cache when the directory is unchanged, otherwise lists it
+    with ``os.scandir``. Returns None if the directory cannot be read, was
+    already visited, or is on another filesystem in one-file-system mode.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if walk.one_file_system and st.st_dev != walk.root_dev:
+        if stats is not None:
+            stats.mounts_skipped += 1
+        return None
+    with walk.lock:
+        key = (st.st_dev, st.st_ino)
+        if key in walk.visited:
+            if stats is not None:
+                stats.dirs_aliased += 1
+            return None
+        walk.visited.add(key)
+
+    cache = walk.cache
+    if cache is not None:
+        record = cache.lookup(path, st)
+        if record is not None:
+            if stats is not None:
+                stats.dirs_cached += 1
+            return record["names"], record["subdirs"], record["links"]
+
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return None
+
+    if stats is not None:
+        stats.dirs_scanned += 1
+        stats.entries_seen += len(entries)
+    if walk.budget is not None:
+        walk.budget.charge(len(entries))
+
+    names = {entry.name for entry in entries}
+    tracked = [name for name in TRACKED_NAMES if name in names]
+    subdirs = []
+    links = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.name)
+        elif entry.is_symlink() and entry.is_dir():
+            links.append(entry.name)
+    subdirs.sort()
+    links.sort()
+    if cache is not None:
+        cache.store(path, st, tracked, subdirs, links)
+    return tracked, subdirs, links
+
+
+def _visit(
+    task: DirTask,
+    walk: _Walk,
+    stats: Optional[ScanStats],
+) -> tuple[Optional[FoundProject], list[DirTask]]:
+    """Visit one directory.
+
+    Returns:
+        Tuple of (project found here or None, child tasks in name order)
+    """
+    listing = _read_dir(task.path, walk, stats)
+    if listing is None:
+        return None, []
+    names, subdirs, links = listing
+    if walk.follow_symlinks and links:
+        subdirs = sorted(subdirs + links)
+    markers = [name for name in names if name in PROJECT_MARKERS]
+
+    found = None
+    if markers and (markers[0] == ".git" or not task.in_repo):
+        found = FoundProject(path=Path(task.path), marker=markers[0])
+
+    if task.depth >= walk.max_depth:
+        return found, []
+
+    # The scan root itself never makes its children subprojects
+    child_in_repo = task.in_repo or (task.depth > 0 and ".git" in markers)
+    rule_dirs = task.rule_dirs
+    ignore = walk.ignore
+    if ignore is not None and ignore.use_gitignore and ".gitignore" in names:
+        rule_dirs = rule_dirs + (task.path,)
+
+    children = []
+    for name in subdirs:
+        if name in PRUNE_DIRS:
+            continue
+        path = os.path.join(task.path, name)
+        if ignore is not None and ignore.is_ignored(
+            path, walk.root, walk.root_rules, rule_dirs
+        ):
+            if stats is not None:
+                stats.dirs_skipped += 1
+            continue
+        children.append(
+            DirTask(path, task.depth + 1, child_in_repo, rule_dirs)
+        )
+    return found, children
+
+
+class ScanBudget:
+    """Time and entry limits shared by every walk of one scan.
+
+    Walks stop taking new directories once the budget is exhausted or
+    ``stop()`` is called (e.g. on Ctrl-C); their unvisited directories
+    stay in WalkState.pending so the scan can be resumed.
+    """
+
+    def __init__(
+        self,
+        max_time: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.deadline = (
+            time.monotonic() + max_time if max_time is not None else None
+        )
+        self.max_entries = max_entries
+        self.entries = 0
+        self.reason: Optional[str] = None
+
+    def charge(self, entries: int) -> None:
+        """Account for directory entries read."""
+        self.entries += entries
+
+    def stop(self, reason: str = "interrupted") -> None:
+        """Stop all walks as soon as their current directory is done."""
+        if self.reason is None:
+            self.reason = reason
+
+    @property
+    def exhausted(self) -> bool:
+        """True once a limit is reached or stop() was called."""
+        if self.reason is None:
+            if self.deadline is not None and time.monotonic() >= self.deadline:
+                self.reason = "time budget exhausted"
+            elif (
+                self.max_entries is not None
+                and self.entries >= self.max_entries
+            ):
+                self.reason = "entry budget exhausted"
+        return self.reason is not None
+
+
+class WalkState:
+    """Resumable progress of one root's walk.
+
+    ``pending`` holds directories queued but not yet visited, in walk
+    order, and ``found`` the projects discovered so far. All mutation
+    happens under ``lock`` so a checkpoint always sees a consistent pair.
+    """
+
+    def __init__(
+        self,
+        pending: Optional[list[DirTask]] = None,
+        found: Optional[list[FoundProject]] = None,
+        started: bool = False,
+        complete: bool = False,
+    ):
+        self.pending = pending or []
+        self.found = found or []
+        self.started = started
+        self.complete = complete
+        self.lock = threading.Lock()
+        # Installed by the active walker to report its live frontier
+        self._frontier: Optional[Callable[[], list[DirTask]]] = None
+
+    def to_dict(self) -> dict:
+        """Snapshot state for the scan journal."""
+        with self.lock:
+            pending = self._frontier() if self._frontier else self.pending
+            return {
+                "pending": [
+                    [t.path, t.depth, t.in_repo, list(t.rule_dirs)]
+                    for t in pending
+                ],
+                "found": [[str(f.path), f.marker] for f in self.found],
+                "started": self.started,
+                "complete": self.complete,
+            }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WalkState":
+        """Restore state saved by to_dict()."""
+        return cls(
+            pending=[
+                DirTask(path, depth, in_repo, tuple(rule_dirs))
+                for path, depth, in_repo, rule_dirs in data["pending"]
+            ],
+            found=[
+                FoundProject(Path(path), marker)
+                for path, marker in data["found"]
+            ],
+            started=data["started"],
+            complete=data["complete"],
+        )
+
+
+class ScanJournal:
+    """Periodically saved progress of a local scan, for ``--resume``.
+
+    ``params`` holds the roots, depth and walk options (excludes,
+    gitignore, one-file-system, symlinks) a resumed scan must reuse.
+    """
+
+    VERSION = 2
+
+    # Minimum seconds between checkpoints
+    INTERVAL = 5.0
+
+    def __init__(
+        self,
+        path: Path,
+        params: dict,
+        states: Optional[dict[str, WalkState]] = None,
+    ):
+        self.path = path
+        self.params = params
+        self.states = states or {}
+        self._lock = threading.Lock()
+        self._last_save = time.monotonic()
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["ScanJournal"]:
+        """Load a journal, or None if missing or unreadable."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != cls.VERSION:
+                return None
+            states = {
+                root: WalkState.from_dict(state)
+                for root, state in data["roots"].items()
+            }
+            return cls(path, data["params"], states)
+        except (OSError, json.JSONDecodeError, KeyError, TypeError,
+                ValueError, AttributeError):
+            return None
+
+    def state(self, root: str) -> WalkState:
+        """Return the state for a root, creating it if needed."""
+        with self._lock:
+            return self.states.setdefault(root, WalkState())
+
+    def checkpoint(self) -> None:
+        """Save if the checkpoint interval has elapsed."""
+        if time.monotonic() - self._last_save >= self.INTERVAL:
+            self.save()
+
+    def save(self) -> None:
+        """Write the journal atomically."""
+        with self._lock:
+            data = {
+                "version": self.VERSION,
+                "params": self.params,
+                "roots": {
+                    root: state.to_dict()
+                    for root, state in self.states.items()
+                },
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+            self._last_save = time.monotonic()
+
+    def discard(self) -> None:
+        """Delete the journal file."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def walk_projects(
+    root: Path,
+    max_depth: int,
+    stats: Optional[ScanStats] = None,
+    cache: Optional[ScanCache] = None,
+    workers: int = 1,
+    ignore: Optional[ScanFilter] = None,
+    one_file_system: bool = False,
+    follow_symlinks: bool = False,
+    state: Optional[WalkState] = None,
+    budget: Optional[ScanBudget] = None,
+    checkpoint: Optional[Callable[[], None]] = None,
+    ordered: bool = True,
+) -> Iterator[FoundProject]:
+    """Yield project roots under ``root`` in sorted depth-first order.
+
+    Each directory is listed at most once. Directories deeper than
+    ``max_depth`` (relative to ``root``) are never listed, and ``.git`` and
+    ``node_modules`` are never descended into. A directory carrying a
+    non-``.git`` marker is skipped when an ancestor below ``root`` is a git
+    repository (e.g. ``frontend/package.json`` inside a repo).
+
+    Directories are identified by ``(st_dev, st_ino)`` and never walked
+    twice, so symlink loops and aliased paths are harmless. When an inode
+    is reachable through several paths, a parallel walk may report any
+    one of them.
+
+    Args:
+        root: Directory to walk
+        max_depth: Maximum depth of a project root relative to ``root``
+        stats: Optional counters updated in place
+        cache: Optional listing cache for incremental rescans
+        workers: Threads walking the tree; more than one uses
+            ParallelWalker
+        ignore: Optional filter pruning excluded directories
+        one_file_system: Do not descend into other filesystems (mounts)
+        follow_symlinks: Descend into symlinks to directories
+        state: Progress to resume from and record into; projects already
+            in ``state.found`` are yielded first
+        budget: Limits after which the walk stops early, leaving
+            ``state.complete`` False
+        checkpoint: Called after each directory so the caller can persist
+            ``state``
+        ordered: With several workers, yield in sorted order once the
+            walk has finished; False yields each project as soon as a
+            worker finds it, in discovery order (for streaming output)
+
+    Yields:
+        FoundProject for each project root
+    """
+    if max_depth < 0:
+        return
+    if state is None:
+        state = WalkState()
+
+    try:
+        root_dev = os.stat(root).st_dev
+    except OSError:
+        return
+    walk = _Walk(
+        str(root), max_depth, cache=cache, ignore=ignore,
+        one_file_system=one_file_system, follow_symlinks=follow_symlinks,
+        root_dev=root_dev, budget=budget,
+    )
+    if ignore is not None:
+        walk.root_rules = ignore.root_rules(walk.root)
+
+    with state.lock:
+        if not state.started:
+            state.pending = [DirTask(walk.root, 0, False)]
+            state.started = True
+        pending = list(state.pending)
+        state.pending = []
+
+    if workers > 1:
+        walker = ParallelWalker(walk, workers)
+        if ordered:
+            walker.run(pending, state, stats, checkpoint)
+            with state.lock:
+                state.found.sort(key=lambda found: found.path.parts)
+            yield from list(state.found)
+        else:
+            yield from list(state.found)
+            yield from walker.iter_found(pending, state, stats, checkpoint)
+            with state.lock:
+                state.found.sort(key=lambda found: found.path.parts)
+        with state.lock:
+            state.complete = not state.pending
+    else:
+        yield from list(state.found)
+        stack = list(reversed(pending))
+        state._frontier = lambda: list(reversed(stack))
+        try:
+            while stack and not (budget is not None and budget.exhausted):
+                task = stack[-1]
+                found, children = _visit(task, walk, stats)
+                with state.lock:
+                    stack.pop()
+                    # Push in reverse so the smallest name is walked first
+                    stack.extend(reversed(children))
+                    if found is not None:
+                        state.found.append(found)
+                if checkpoint is not None:
+                    checkpoint()
+                if found is not None:
+                    yield found
+        finally:
+            with state.lock:
+                state._frontier = None
+                state.pending = list(reversed(stack))
+                state.complete = not stack
+
+    # Only a finished walk may evict stale cache records under the root
+    if cache is not None and state.complete:
+        cache.roots.append(walk.root)
+
+
+class ParallelWalker:
+    """Walk one tree with a pool of work-stealing threads.
+
+    Every worker owns a deque: it pushes the children of the directory it
+    just listed onto its own end and pops from there (depth-first, good
+    locality), while idle workers steal from the opposite end of another
+    worker's deque, taking the shallowest and therefore largest pending
+    subtrees. Queue operations and result commits happen under the walk
+    state's lock, so checkpoints see a consistent frontier; directory
+    listing happens outside it. walk_projects() sorts run() results into
+    the serial walker's order, so the output is identical to a
+    single-threaded walk; iter_found() instead hands projects over as
+    they are found.
+    """
+
+    # How long an idle worker sleeps before looking for work again
+    IDLE_WAIT = 0.05
+
+    def __init__(self, walk: _Walk, workers: int):
+        self.walk = walk
+        self.workers = workers
+        self._deques = [deque() for _ in range(workers)]
+        self._in_flight: dict[int, DirTask] = {}
+        self._cond: Optional[threading.Condition] = None
+        self._pending = 0
+        self._error: Optional[BaseException] = None
+        self._stopped = False
+        self._on_found: Optional[Callable[[FoundProject], None]] = None
+
+    def iter_found(
+        self,
+        pending: list[DirTask],
+        state: WalkState,
+        stats: Optional[ScanStats] = None,
+        checkpoint: Optional[Callable[[], None]] = None,
+    ) -> Iterator[FoundProject]:
+        """Run the walk in the background, yielding projects as found.
+
+        Workers hand each project to a queue that this generator drains,
+        so the caller sees it while the rest of the tree is still being
+        walked. Closing the generator early stops the workers; the
+        unvisited directories stay in ``state.pending``.
+        """
+        found_queue: queue.Queue = queue.Queue()
+        done = object()
+        self._on_found = found_queue.put
+
+        def run() -> None:
+            try:
+                self.run(pending, state, stats, checkpoint)
+            except BaseException as e:
+                found_queue.put(e)
+            finally:
+                found_queue.put(done)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = found_queue.get()
+                if item is done:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            self.stop()
+            thread.join()
+
+    def stop(self) -> None:
+        """Make workers return after their current directory."""
+        self._stopped = True
+        if self._cond is not None:
+            with self._cond:
+                self._cond.notify_all()
+
+    def run(
+        self,
+        pending: list[DirTask],
+        state: WalkState,
+        stats: Optional[ScanStats] = None,
+        checkpoint: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Walk from ``pending``, recording results into ``state``.
+
+        On return ``state.pending`` holds any directories left unvisited
+        because the budget ran out or stop() was called.
+        """
+        self._cond = threading.Condition(state.lock)
+        self._deques[0].extend(reversed(pending))
+        self._pending = len(pending)
+        worker_stats = [ScanStats() for _ in range(self.workers)]
+        state._frontier = self._frontier
+
+        threads = [
+            threading.Thread(
+                target=self._work,
+                args=(i, state, worker_stats[i], checkpoint),
+                daemon=True,
+            )
+            for i in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with state.lock:
+            state._frontier = None
+            state.pending = self._frontier()
+        if self._error is not None:
+            raise self._error
+        if stats is not None:
+            for ws in worker_stats:
+                stats.merge(ws)
+
+    def _frontier(self) -> list[DirTask]:
+        """Unvisited directories, including in-flight ones (lock held)."""
+        tasks = list(self._in_flight.values())
+        for dq in self._deques:
+            tasks.extend(dq)
+        tasks.sort(key=lambda task: Path(task.path).parts)
+        return tasks
+
+    def _take(self, index: int) -> Optional[DirTask]:
+        """Pop from our own deque, else steal from another (lock held)."""
+        if self._deques[index]:
+            return self._deques[index].pop()
+        for offset in range(1, self.workers):
+            victim = self._deques[(index + offset) % self.workers]
+            if victim:
+                return victim.popleft()
+        return None
+
+    def _work(
+        self,
+        index: int,
+        state: WalkState,
+        stats: ScanStats,
+        checkpoint: Optional[Callable[[], None]],
+    ) -> None:
+        """Worker loop: visit directories until none are pending."""
+        budget = self.walk.budget
+        while True:
+            with self._cond:
+                while True:
+                    if self._pending == 0 or self._error is not None:
+                        return
+                    if self._stopped:
+                        return
+                    if budget is not None and budget.exhausted:
+                        return
+                    task = self._take(index)
+                    if task is not None:
+                        self._in_flight[index] = task
+                        break
+                    self._cond.wait(self.IDLE_WAIT)
+
+            try:
+                found, children = _visit(task, self.walk, stats)
+            except BaseException as e:
+                with self._cond:
+                    self._error = e
+                    self._cond.notify_all()
+                return
+
+            with self._cond:
+                del self._in_flight[index]
+                if found is not None:
+                    state.found.append(found)
+                    if self._on_found is not None:
+                        self._on_found(found)
+                self._deques[index].extend(reversed(children))
+                self._pending += len(children) - 1
+                if self._pending == 0:
+                    self._cond.notify_all()
+                elif children:
+                    self._cond.notify(len(children))
+            if checkpoint is not None:
+                checkpoint()
@@ -0,0 +1,126 @@
+"""Shared HTTP transport for API clients.
+
+One Transport owns a pooled ``requests.Session`` that forge scans and the
+work-prod APIClient send their requests through, so concurrent features
+reuse warm keep-alive connections instead of opening a new TCP and TLS
+connection per request. The pool keeps up to ``pool_size`` connections
+per host and blocks callers beyond that, which caps concurrency per host
+no matter how many threads share it. Responses are requested gzip
+compressed and every request gets a (connect, read) timeout from the
+transport's TimeoutPolicy.
+
+Clients sharing a transport must pass their credentials per request
+rather than setting them on the session.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from proj import __version__
+from proj.config import Config
+
+USER_AGENT = f"proj/{__version__}"
+
+
+@dataclass(frozen=True)
+class TimeoutPolicy:
+    """Connect and read timeouts, in seconds, for every request."""
+
+    connect: float = 5.0
+    read: float = 15.0
+    # Read timeout of bulk requests such as project imports
+    bulk_read: float = 60.0
+
+    def timeout(self, bulk: bool = False) -> tuple[float, float]:
+        """Return the ``(connect, read)`` timeout passed to requests."""
+        return (self.connect, self.bulk_read if bulk else self.read)
+
+
+class Transport:
+    """Pooled keep-alive session with per-host connection limits."""
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        max_hosts: int = 10,
+        timeouts: Optional[TimeoutPolicy] = None,
+    ):
+        """Initialize the transport.
+
+        Args:
+            pool_size: Connections kept (and allowed at once) per host
+            max_hosts: Hosts whose connection pools are kept open
+            timeouts: Timeout policy (defaults if None)
+        """
+        self.pool_size = max(1, pool_size)
+        self.timeouts = timeouts or TimeoutPolicy()
+        self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        })
+        # pool_block: wait for a free connection instead of opening
+        # throwaway ones past the per-host limit
+        adapter = HTTPAdapter(
+            pool_connections=max(1, max_hosts),
+            pool_maxsize=self.pool_size,
+            pool_block=True,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @classmethod
+    def from_config(cls, config: Config) -> "Transport":
+        """Build a transport from the ``http_*`` config settings."""
+        return cls(
+            pool_size=config.http_pool_size,
+            timeouts=TimeoutPolicy(
+                connect=config.http_connect_timeout,
+                read=config.http_read_timeout,
+                bulk_read=config.http_bulk_read_timeout,
+            ),
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        bulk: bool = False,
+        **kwargs,
+    ) -> requests.Response:
+        """Send a request with the policy's timeout unless one is given."""
+        kwargs.setdefault("timeout", self.timeouts.timeout(bulk))
+        return self.session.request(method, url, **kwargs)
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+_shared: Optional[Transport] = None
+_shared_lock = threading.Lock()
+
+
+def get_transport(config: Optional[Config] = None) -> Transport:
+    """Return the process-wide transport, creating it on first use.
+
+    Args:
+        config: Config used to size the transport when it is created
+            (``Config.load()`` if None); ignored afterwards
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = Transport.from_config(config or Config.load())
+        return _shared
@@ -1,7 +1,12 @@
 """Test fixtures for proj-cli."""
+import hashlib
 import json
 import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
 from unittest.mock import Mock, patch
 
 import pytest
@@ -56,3 +61,155 @@ def mock_api_client():
         mock.return_value = client
         yield client
 
+
+class RepoServer(ThreadingHTTPServer):
+    """Stub forge API serving ``repos`` for any <kind>/<name> listing.
+
+    ``paging`` selects the forge's pagination: "github" (``Link`` headers,
+    ``per_page``), "gitea" (``Link`` headers, ``limit``) or "gitlab"
+    (``X-Next-Page``/``X-Total-Pages`` headers).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, repos, last_link=True, delay=0.0, throttle=(),
+                 paging="github", flaky=(), drop=()):
+        super().__init__(("127.0.0.1", 0), RepoHandler)
+        self.repos = repos
+        # Whether the page count (rel="last", X-Total-Pages) is sent
+        self.last_link = last_link
+        self.paging = paging
+        self.delay = delay
+        # Pages answered once with 429 Retry-After before being served
+        self.throttle = set(throttle)
+        # Pages answered once with 503, or whose connection is dropped
+        self.flaky = set(flaky)
+        self.drop = set(drop)
+        # Language byte counts served for /repos/<owner>/<name>/languages
+        self.languages = lambda name: {"Python": 100 * len(name), "C": 10}
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class RepoHandler(BaseHTTPRequestHandler):
+    """Serve one page of the stub server's repos with paging headers."""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            time.sleep(server.delay)
+            parts = urlsplit(self.path)
+            query = parse_qs(parts.query)
+            size_param = "limit" if server.paging == "gitea" else "per_page"
+            per_page = int(query.get(size_param, ["30"])[0])
+            page = int(query.get("page", ["1"])[0])
+            if "missing" in parts.path:
+                self.send_error(404)
+                return
+            if parts.path.endswith("/languages"):
+                self.send_json(server.languages(parts.path.split("/")[3]))
+                return
+            if page > 3 and "fail" in parts.path:
+                self.send_error(500)
+                return
+            with server.lock:
+                throttled = page in server.throttle
+                server.throttle.discard(page)
+                flaky = page in server.flaky
+                server.flaky.discard(page)
+                dropped = page in server.drop
+                server.drop.discard(page)
+            if dropped:
+                self.close_connection = True
+                return
+            if flaky:
+                self.send_error(503)
+                return
+            if throttled:
+                self.send_response(429)
+                self.send_header("Retry-After", "30")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            start = (page - 1) * per_page
+            body = json.dumps(server.repos[start:start + per_page]).encode()
+            last = max(1, -(-len(server.repos) // per_page))
+            etag = '"%s"' % hashlib.sha1(body).hexdigest()
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+
+            def link(n):
+                return (f"{server.url}{parts.path}"
+                        f"?{size_param}={per_page}&page={n}")
+
+            links = []
+            if page < last and server.paging != "gitlab":
+                links.append(f'<{link(page + 1)}>; rel="next"')
+                if server.last_link:
+                    links.append(f'<{link(last)}>; rel="last"')
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            if links:
+                self.send_header("Link", ", ".join(links))
+            if server.paging == "gitlab":
+                next_page = str(page + 1) if page < last else ""
+                self.send_header("X-Page", str(page))
+                self.send_header("X-Next-Page", next_page)
+                if server.last_link:
+                    self.send_header("X-Total-Pages", str(last))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def send_json(self, data):
+        """Send a JSON body with an ETag, or 304 if it still matches."""
+        body = json.dumps(data).encode()
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def repo_server():
+    """Start stub servers; yields a factory taking RepoServer arguments."""
+    servers = []
+
+    def start(repos, **kwargs):
+        server = RepoServer(repos, **kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,251 @@
+"""Tests for tech stack detection."""
+import json
+import os
+
+from proj.analyzer import (
+    analyze_inventory, analyze_project, manifest_fingerprint,
+)
+
+
+def make_project(root, name, files):
+    """Create a project directory holding ``files`` (name -> content)."""
+    path = root / name
+    path.mkdir()
+    for filename, content in files.items():
+        (path / filename).write_text(content)
+    return str(path)
+
+
+def test_analyze_project_detects_languages_and_frameworks(tmp_path):
+    """Test manifests map to languages and package.json deps to frameworks."""
+    pkg = json.dumps({"dependencies": {"react": "18"},
+                      "devDependencies": {"express": "4"}})
+    path = make_project(tmp_path, "app", {
+        "package.json": pkg, "setup.py": "", "go.mod": "module x",
+        "yarn.lock": "", "App.csproj": "", "Makefile": "",
+    })
+    (tmp_path / "app" / ".storybook").mkdir()
+
+    assert analyze_project(path) == {
+        "languages": ["JavaScript", "Python", "Go", "C#"],
+        "frameworks": ["React", "Express", "Storybook"],
+        "build_systems": ["Yarn", "Go modules", "MSBuild", "Make"],
+        "dependencies": {"yarn.lock": []},
+    }
+    assert analyze_project(str(tmp_path / "gone")) is None
+    assert analyze_project(None) is None
+
+
+def test_analyze_project_tolerates_bad_package_json(tmp_path):
+    """Test an unreadable package.json still counts as JavaScript."""
+    path = make_project(tmp_path, "broken", {"package.json": "{not json"})
+
+    assert analyze_project(path) == {
+        "languages": ["JavaScript"], "frameworks": [], "build_systems": [],
+        "dependencies": {},
+    }
+
+
+def test_analyze_project_lists_root_once(tmp_path, monkeypatch):
+    """Test detection costs one scandir, however many detectors exist."""
+    from proj.detectors import DETECTORS, Detector, DetectorIndex
+
+    path = make_project(tmp_path, "app", {
+        "Cargo.toml": "", "README.md": "", "Gemfile": "",
+    })
+    (tmp_path / "app" / "src").mkdir()
+    extra = [
+        Detector(f"Tool{i}", "build_systems", files=(f"tool{i}.cfg",),
+                 suffixes=(f".t{i}",), dirs=(f"tool{i}",))
+        for i in range(30)
+    ]
+    calls = []
+    for name in ("scandir", "stat", "lstat"):
+        original = getattr(os, name)
+
+        def counted(*args, _name=name, _original=original, **kwargs):
+            calls.append(_name)
+            return _original(*args, **kwargs)
+
+        monkeypatch.setattr(os, name, counted)
+
+    base = analyze_project(path, DetectorIndex(DETECTORS))
+    base_calls = list(calls)
+    calls.clear()
+    more = analyze_project(path, DetectorIndex(DETECTORS + tuple(extra)))
+
+    assert base == more
+    assert base["languages"] == ["Rust", "Ruby"]
+    assert base_calls == calls == ["scandir"]
+
+
+def test_analyze_inventory_parallel_matches_serial(tmp_path):
+    """Test worker count changes neither results nor their order."""
+    manifests = [
+        {"Cargo.toml": ""},
+        {"pyproject.toml": ""},
+        {"package.json": json.dumps({"dependencies": {"vue": "3"}})},
+        {},
+    ]
+
+    def build():
+        return [
+            {"name": f"p{i}", "local_path": str(tmp_path / f"p{i}")}
+            for i in range(200)
+        ] + [{"name": "remote", "remote_url": "https://x/r"}]
+
+    for i in range(200):
+        make_project(tmp_path, f"p{i}", manifests[i % 4])
+
+    serial = build()
+    assert analyze_inventory(serial, jobs=1).analyzed == 200
+    progress = []
+    parallel = build()
+    stats = analyze_inventory(
+        parallel, jobs=8, on_progress=progress.append, batch_size=16
+    )
+    assert (stats.analyzed, stats.skipped) == (200, 1)
+
+    assert parallel == serial
+    assert serial[2]["frameworks"] == ["Vue"]
+    assert "languages" not in serial[3]
+    assert "analyzed" not in serial[-1]
+    # Batched progress: far fewer updates than entries, summing to all
+    assert sum(progress) == 201
+    assert len(progress) < 40
+
+
+def test_manifest_fingerprint_tracks_manifests(tmp_path):
+    """Test new files and rewritten content files change the fingerprint."""
+    path = tmp_path / "app"
+    path.mkdir()
+    (path / "README.md").write_text("docs")
+    (path / "package.json").write_text("{}")
+    before = manifest_fingerprint(path)
+    (path / "README.md").write_text("other docs")
+    assert manifest_fingerprint(path) == before
+
+    (path / "go.mod").write_text("module x")
+    added = manifest_fingerprint(path)
+    assert added["dir"] != before["dir"]
+    assert list(added["files"]) == ["package.json"]
+
+    (path / "package.json").write_text('{"name": "x"}')
+    assert manifest_fingerprint(path)["files"] != added["files"]
+    assert manifest_fingerprint(tmp_path / "gone") is None
+    assert manifest_fingerprint(path / "README.md") is None
+
+
+def test_analyze_inventory_skips_unchanged_projects(tmp_path):
+    """Test only projects with changed manifests are re-analyzed."""
+    a = make_project(tmp_path, "a", {"package.json": json.dumps(
+        {"dependencies": {"react": "18"}})})
+    b = make_project(tmp_path, "b", {"Cargo.toml": ""})
+    inventory = [{"name": "a", "local_path": a},
+                 {"name": "b", "local_path": b}]
+
+    assert analyze_inventory(inventory).analyzed == 2
+    stats = analyze_inventory(inventory)
+    assert (stats.analyzed, stats.unchanged) == (0, 2)
+
+    # Rewritten package.json drops React; a new setup.py adds Python
+    pkg = os.path.join(a, "package.json")
+    with open(pkg, "w", encoding="utf-8") as f:
+        json.dump({"dependencies": {"lodash": "4"}}, f)
+    os.utime(pkg, ns=(1, 1))
+    open(os.path.join(a, "setup.py"), "w").close()
+    stats = analyze_inventory(inventory)
+    assert (stats.analyzed, stats.unchanged) == (1, 1)
+    assert inventory[0]["languages"] == ["JavaScript", "Python"]
+    assert "frameworks" not in inventory[0]
+
+    assert analyze_inventory(inventory, force=True).analyzed == 2
+
+
+def test_analyze_entry_stats_only_present_content_files(
+    tmp_path, monkeypatch
+):
+    """Test a first analysis stats the content files it listed, not all."""
+    from proj.analyzer import analyze_entry
+
+    path = make_project(tmp_path, "app", {
+        "package.json": "{}", "setup.py": "",
+    })
+    calls = []
+    for name in ("scandir", "stat"):
+        original = getattr(os, name)
+
+        def counted(*args, _name=name, _original=original, **kwargs):
+            calls.append(_name)
+            return _original(*args, **kwargs)
+
+        monkeypatch.setattr(os, name, counted)
+
+    result = analyze_entry({"local_path": path})
+
+    assert list(result["fingerprint"]["files"]) == ["package.json"]
+    assert sorted(calls) == ["scandir", "stat", "stat"]
+
+
+def test_analyze_inventory_stores_lockfile_dependencies(tmp_path):
+    """Test lockfile pairs are stored per entry and refreshed on change."""
+    path = make_project(tmp_path, "svc", {
+        "Cargo.toml": "",
+        "Cargo.lock": '[[package]]\nname = "serde"\nversion = "1.0.0"\n',
+        "go.sum": "golang.org/x/text v0.3.0 h1:x=\n",
+    })
+    inventory = [{"name": "svc", "local_path": path}]
+
+    analyze_inventory(inventory)
+    assert inventory[0]["dependencies"] == {
+        "Cargo.lock": [["serde", "1.0.0"]],
+        "go.sum": [["golang.org/x/text", "v0.3.0"]],
+    }
+    assert list(inventory[0]["analysis_fingerprint"]["files"]) == [
+        "Cargo.lock", "go.sum",
+    ]
+
+    lock = os.path.join(path, "Cargo.lock")
+    with open(lock, "a", encoding="utf-8") as f:
+        f.write('[[package]]\nname = "anyhow"\nversion = "1.0.1"\n')
+    os.utime(lock, ns=(1, 1))
+    assert analyze_inventory(inventory).analyzed == 1
+    assert inventory[0]["dependencies"]["Cargo.lock"] == [
+        ["anyhow", "1.0.1"], ["serde", "1.0.0"],
+    ]
+
+
+def test_ranked_languages_puts_most_code_first():
+    """Test counted languages lead, manifest-only ones follow."""
+    from proj.analyzer import ranked_languages
+
+    project = {"languages": ["Python", "C/C++"]}
+    assert ranked_languages(project) == ["Python", "C/C++"]
+
+    project["loc"] = {
+        "Go": {"files": 900, "lines": 200000},
+        "Python": {"files": 1, "lines": 40},
+        "Shell": {"files": 3, "lines": 0},
+    }
+    assert ranked_languages(project) == ["Go", "Python", "C/C++"]
+
+
+def test_ranked_languages_merges_counted_and_detected(tmp_path):
+    """Test a language both counted and detected is listed once."""
+    from proj.analyzer import analyze_inventory_loc, ranked_languages
+    from proj.loc import LocCounter
+
+    path = make_project(tmp_path, "engine", {
+        "CMakeLists.txt": "project(engine)\n", "Makefile": "all:\n",
+        "main.cpp": "int main() {\n  return 0;\n}\n",
+        "util.h": "#pragma once\n", "run.py": "print(1)\n",
+    })
+    inventory = [{"name": "engine", "local_path": path}]
+    analyze_inventory(inventory)
+    with LocCounter() as counter:
+        analyze_inventory_loc(inventory, counter)
+
+    project = inventory[0]
+    assert project["languages"] == ["C/C++"]
+    assert set(project["loc"]) == {"C/C++", "Python"}
+    assert ranked_languages(project) == ["C/C++", "Python"]
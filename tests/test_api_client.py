@@ -1,4 +1,11 @@
 """Tests for API client."""
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
 
 
 def test_api_client_exists():
@@ -79,3 +86,135 @@ def test_api_client_archive_project():
 
     client = APIClient()
     assert hasattr(client, 'archive_project')
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Answer with the server's scripted statuses, then 200."""
+
+    def do_GET(self):
+        self.respond()
+
+    def do_POST(self):
+        self.respond()
+
+    def do_PATCH(self):
+        self.respond()
+
+    def respond(self):
+        server = self.server
+        server.requests.append(self.command)
+        status, headers = (
+            server.script.pop(0) if server.script else (200, {})
+        )
+        body = json.dumps({"ok": status == 200}).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_backend():
+    """Start a stub backend; set ``server.script`` to (status, headers)."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    server.daemon_threads = True
+    server.requests = []
+    server.script = []
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(url, sleeps, **policy):
+    """Build an APIClient that records its retry sleeps."""
+    from proj.api_client import APIClient
+    from proj.config import Config
+    from proj.retry import RetryPolicy
+    from proj.transport import Transport
+
+    return APIClient(
+        config=Config(api_url=url),
+        transport=Transport(),
+        retry_policy=RetryPolicy(jitter=False, **policy),
+        sleep=sleeps.append,
+    )
+
+
+def test_api_client_retries_idempotent_requests(flaky_backend):
+    """Test GETs are retried with backoff and Retry-After is honored."""
+    flaky_backend.script = [(503, {}), (429, {"Retry-After": "2"})]
+    sleeps = []
+    client = make_client(flaky_backend.url, sleeps)
+
+    assert client.get_project(1) == {"ok": True}
+    assert flaky_backend.requests == ["GET"] * 3
+    assert sleeps == [0.5, 2.0]
+
+
+def test_api_client_does_not_retry_post_or_default_patch(flaky_backend):
+    """Test non-idempotent requests surface the first failure."""
+    from proj.error_handler import APIError
+
+    sleeps = []
+    client = make_client(flaky_backend.url, sleeps)
+    flaky_backend.script = [(503, {})]
+    with pytest.raises(APIError):
+        client.create_project({"name": "x"})
+    flaky_backend.script = [(503, {})]
+    with pytest.raises(APIError):
+        client.update_project(1, {"name": "x"})
+
+    patching = make_client(flaky_backend.url, sleeps, retry_patch=True)
+    flaky_backend.script = [(503, {})]
+    assert patching.update_project(1, {"name": "x"}) == {"ok": True}
+    assert flaky_backend.requests == ["POST", "PATCH", "PATCH", "PATCH"]
+
+
+def test_api_client_circuit_breaker_fails_fast():
+    """Test repeated connection errors open the circuit for later calls."""
+    from proj.error_handler import BackendConnectionError, CircuitOpenError
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    sleeps = []
+    client = make_client(f"http://127.0.0.1:{port}", sleeps, retries=2)
+
+    # 3 attempts, then 2 more failures open the circuit (threshold 5)
+    with pytest.raises(BackendConnectionError):
+        client.list_projects()
+    with pytest.raises(CircuitOpenError):
+        client.list_projects()
+    with pytest.raises(CircuitOpenError):
+        client.get_project(1)
+    assert client.circuit_breaker.failures == 5
+
+
+def test_api_client_releases_trial_after_other_errors(flaky_backend):
+    """Test a half-open trial that fails without a connection error
+    lets the next request through as the new trial."""
+    client = make_client(flaky_backend.url, [])
+    breaker = client.circuit_breaker
+    breaker.failures = breaker.threshold
+    breaker.opened_at = breaker._clock() - breaker.reset_after
+
+    send = client.transport.request
+
+    def invalid_url(*args, **kwargs):
+        raise requests.exceptions.InvalidURL("bad url")
+
+    client.transport.request = invalid_url
+    with pytest.raises(requests.exceptions.InvalidURL):
+        client.get_project(1)
+
+    client.transport.request = send
+    assert client.get_project(1) == {"ok": True}
+    assert not breaker.is_open
@@ -170,3 +170,67 @@ def test_cli_inv_status_command_with_data(mock_xdg_dirs):
     assert result.exit_code == 0
     assert "1" in result.stdout or "Total Projects" in result.stdout
 
+
+def test_cli_inv_scan_local_jobs_merges_in_root_order(
+    mock_xdg_dirs, tmp_path
+):
+    """Test that concurrent root scans merge in configured root order."""
+    import json
+    import yaml
+    from proj.commands.inventory import get_inventory_file
+    from proj.config import get_config_file
+
+    roots = []
+    for name in ("zeta", "alpha", "mid"):
+        root = tmp_path / "roots" / name
+        for i in range(3):
+            (root / f"{name}-{i}" / ".git").mkdir(parents=True)
+        roots.append(str(root))
+    config_file = get_config_file()
+    config_file.parent.mkdir(parents=True, exist_ok=True)
+    config_file.write_text(yaml.dump({"local_scan_dirs": roots}))
+
+    result = runner.invoke(app, ["inv", "scan", "local", "--jobs", "3"])
+    assert result.exit_code == 0
+
+    with open(get_inventory_file(), encoding="utf-8") as f:
+        names = [item["name"] for item in json.load(f)]
+    assert names == [
+        "zeta-0", "zeta-1", "zeta-2",
+        "alpha-0", "alpha-1", "alpha-2",
+        "mid-0", "mid-1", "mid-2",
+    ]
+
+
+def test_cli_inv_scan_local_resume_reuses_walk_options(
+    mock_xdg_dirs, tmp_path
+):
+    """Test --resume keeps the journaled excludes and rejects new ones."""
+    import json
+    from proj.commands.inventory import (
+        get_inventory_file, get_scan_journal_file,
+    )
+
+    root = tmp_path / "ws"
+    for name in ("app", "skipme", "tool"):
+        (root / "group" / name / ".git").mkdir(parents=True)
+
+    result = runner.invoke(app, [
+        "inv", "scan", "local", "--dir", str(root), "--depth", "3",
+        "--exclude", "skipme", "--max-entries", "1",
+    ])
+    assert "--resume" in result.stdout
+    params = json.loads(get_scan_journal_file().read_text())["params"]
+    assert params["exclude"][-1] == "skipme"
+
+    result = runner.invoke(
+        app, ["inv", "scan", "local", "--resume", "--exclude", "other"]
+    )
+    assert result.exit_code == 1
+    assert "--exclude" in result.stdout
+
+    result = runner.invoke(app, ["inv", "scan", "local", "--resume"])
+    assert result.exit_code == 0
+    with open(get_inventory_file(), encoding="utf-8") as f:
+        names = sorted(item["name"] for item in json.load(f))
+    assert names == ["app", "tool"]
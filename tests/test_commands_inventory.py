@@ -1,6 +1,7 @@
 """Tests for inventory commands."""
 import subprocess
 import sys
+from pathlib import Path
 
 
 def test_inv_command_group_exists():
@@ -34,6 +35,17 @@ def test_inv_scan_local_exists():
     assert result.returncode == 0
 
 
+def test_inv_scan_local_has_full_option():
+    """Test that inv scan local command has --full option."""
+    result = subprocess.run(
+        [sys.executable, "-m", "proj", "inv", "scan", "local", "--help"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0
+    assert "--full" in result.stdout
+
+
 def test_inv_analyze_exists():
     """Test that inv analyze command exists."""
     result = subprocess.run(
@@ -42,6 +54,8 @@ def test_inv_analyze_exists():
         text=True,
     )
     assert result.returncode == 0
+    assert "--jobs" in result.stdout
+    assert "--loc" in result.stdout
 
 
 def test_inv_dedupe_exists():
@@ -93,3 +107,321 @@ def test_inv_status_exists():
         text=True,
     )
     assert result.returncode == 0
+
+
+def _item(path: str, marker: str) -> dict:
+    """Build a minimal local scan result."""
+    return {"name": Path(path).name, "local_path": path, "marker": marker}
+
+
+def test_merge_scan_results_overlapping_roots():
+    """Test dedupe and cross-root subproject filtering of scan results."""
+    from proj.commands.inventory import merge_scan_results
+
+    outer = Path("/ws")
+    inner = Path("/ws/repo")
+    merged = merge_scan_results([
+        (inner, [
+            _item("/ws/repo", ".git"),
+            _item("/ws/repo/web", "package.json"),
+        ]),
+        (outer, [
+            _item("/ws/repo", ".git"),
+            _item("/ws/tool", "go.mod"),
+        ]),
+    ])
+
+    assert [p["local_path"] for p in merged] == ["/ws/repo", "/ws/tool"]
+
+
+def test_merge_scan_results_keeps_root_level_subprojects():
+    """Test a repo that is itself the scan root keeps its subprojects."""
+    from proj.commands.inventory import merge_scan_results
+
+    merged = merge_scan_results([
+        (Path("/ws/repo"), [
+            _item("/ws/repo", ".git"),
+            _item("/ws/repo/web", "package.json"),
+        ]),
+    ])
+
+    assert len(merged) == 2
+
+
+def test_scan_result_stream_writes_jsonl(tmp_path):
+    """Test streamed results are deduped and written one JSON per line."""
+    import json
+
+    from proj.commands.inventory import JsonlWriter, ScanResultStream
+
+    target = tmp_path / "out.jsonl"
+    outer = Path("/ws")
+    inner = Path("/ws/repo")
+    with JsonlWriter(str(target)) as writer:
+        stream = ScanResultStream(writer)
+        assert stream.add(inner, _item("/ws/repo", ".git"))
+        assert stream.add(inner, _item("/ws/repo/web", "package.json"))
+        assert not stream.add(outer, _item("/ws/repo", ".git"))
+        assert not stream.add(outer, _item("/ws/repo/api", "go.mod"))
+        assert stream.add(outer, _item("/ws/tool", "go.mod"))
+
+    lines = target.read_text().splitlines()
+    assert [json.loads(line)["local_path"] for line in lines] == [
+        "/ws/repo", "/ws/repo/web", "/ws/tool",
+    ]
+    assert writer.count == 3
+
+
+def test_inv_scan_local_jsonl_stdout(tmp_path):
+    """Test --jsonl - streams projects to stdout and status to stderr."""
+    import json
+    import os
+
+    (tmp_path / "ws" / "app").mkdir(parents=True)
+    (tmp_path / "ws" / "app" / "go.mod").touch()
+    env = dict(os.environ, XDG_DATA_HOME=str(tmp_path / "data"),
+               XDG_CONFIG_HOME=str(tmp_path / "config"))
+    result = subprocess.run(
+        [sys.executable, "-m", "proj", "inv", "scan", "local",
+         "--dir", str(tmp_path / "ws"), "--jsonl", "-"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+    assert result.returncode == 0
+    items = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [item["name"] for item in items] == ["app"]
+    assert "Streamed 1 local projects" in result.stderr
+
+
+def test_forge_settings_fall_back_to_github_names(mock_xdg_dirs):
+    """Test forge_* settings win and github_* remain the fallback."""
+    import json
+
+    from proj.commands.inventory import (
+        forge_jobs, forge_max_wait, get_forge_sync_file,
+        get_legacy_sync_file, load_forge_sync, save_forge_sync,
+    )
+    from proj.config import Config
+
+    legacy = Config(github_jobs=6, github_max_wait=60)
+    assert (forge_jobs(legacy), forge_max_wait(legacy)) == (6, 60)
+    assert forge_jobs(legacy, jobs=2) == 2
+    neutral = Config(github_jobs=6, forge_jobs=3, forge_max_wait=0)
+    assert (forge_jobs(neutral), forge_max_wait(neutral)) == (3, 0)
+
+    legacy_file = get_legacy_sync_file()
+    legacy_file.parent.mkdir(parents=True, exist_ok=True)
+    legacy_file.write_text(json.dumps({"https://api.github.com": {}}))
+    assert load_forge_sync() == {"https://api.github.com": {}}
+    save_forge_sync({"https://gitlab.com/api/v4": {}})
+    assert get_forge_sync_file().name == "forge_sync.json"
+    assert load_forge_sync() == {"https://gitlab.com/api/v4": {}}
+
+
+def test_upsert_forge_items_replaces_changed_repos():
+    """Test rescanned repos replace their entries and new ones append."""
+    from proj.commands.inventory import upsert_forge_items
+
+    existing = [
+        {"name": "a", "remote_url": "https://gh/a", "scan_source": "github",
+         "languages": ["Go"]},
+        {"name": "a", "remote_url": "https://gh/a", "scan_source": "local"},
+        {"name": "b", "remote_url": "https://gh/b", "scan_source": "github"},
+    ]
+    merged = upsert_forge_items(existing, [
+        {"name": "a2", "remote_url": "https://gh/a", "scan_source": "github"},
+        {"name": "c", "remote_url": "https://gh/c", "scan_source": "github"},
+    ])
+
+    assert [(item["name"], item["scan_source"]) for item in merged] == [
+        ("a2", "github"), ("a", "local"), ("b", "github"), ("c", "github"),
+    ]
+    assert merged[0]["languages"] == ["Go"]
+
+
+def test_inv_status_shows_github_quota(tmp_path):
+    """Test inv status reports the last recorded GitHub quota."""
+    import json
+    import os
+    import time
+
+    data_dir = tmp_path / "data" / "proj"
+    data_dir.mkdir(parents=True)
+    (data_dir / "github_rate_limit.json").write_text(json.dumps({
+        "limit": 5000, "remaining": 4321, "reset_at": time.time() + 600,
+        "checked_at": time.time(),
+    }))
+    env = dict(os.environ, XDG_DATA_HOME=str(tmp_path / "data"),
+               XDG_CONFIG_HOME=str(tmp_path / "config"), COLUMNS="200")
+    result = subprocess.run(
+        [sys.executable, "-m", "proj", "inv", "status"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+    assert result.returncode == 0
+    assert "4321/5000" in result.stdout
+
+
+def test_inv_analyze_loc_counts_lines(tmp_path):
+    """Test analyze --loc stores line counts and reuses them on rerun."""
+    import json
+    import os
+
+    app = tmp_path / "app"
+    (app / "src").mkdir(parents=True)
+    (app / "setup.py").write_text("")
+    (app / "src" / "engine.cpp").write_text("int a;\nint b;\nint c;\n")
+    data_dir = tmp_path / "data" / "proj"
+    data_dir.mkdir(parents=True)
+    inventory_file = data_dir / "inventory.json"
+    inventory_file.write_text(json.dumps(
+        [{"name": "app", "local_path": str(app)}]
+    ))
+    env = dict(os.environ, XDG_DATA_HOME=str(tmp_path / "data"),
+               XDG_CONFIG_HOME=str(tmp_path / "config"), COLUMNS="200")
+    command = [sys.executable, "-m", "proj", "inv", "analyze", "--loc"]
+
+    result = subprocess.run(command, capture_output=True, text=True, env=env)
+
+    assert result.returncode == 0, result.stdout
+    item = json.loads(inventory_file.read_text())[0]
+    assert item["languages"] == ["Python"]
+    assert item["loc"] == {
+        "C/C++": {"files": 1, "lines": 3},
+        "Python": {"files": 1, "lines": 0},
+    }
+    assert (data_dir / "loc_cache.json").exists()
+
+    status = subprocess.run(
+        [sys.executable, "-m", "proj", "inv", "status"],
+        capture_output=True, text=True, env=env,
+    )
+    assert "C/C++(1), Python(1)" in status.stdout
+
+
+def test_graphql_repo_item_maps_recorded_fixture():
+    """Test recorded GraphQL nodes map onto the inventory item shape."""
+    import json
+
+    from proj.forges import GitHubClient
+
+    page = json.loads(
+        (Path(__file__).parent / "fixtures" / "github_graphql"
+         / "repos_page1.json").read_text()
+    )
+    node = page["data"]["repositoryOwner"]["repositories"]["nodes"][0]
+    client = GitHubClient()
+    item = client.graphql_repo_item(node)
+
+    rest_keys = set(client.repo_item({"name": "x", "html_url": "u"}))
+    assert rest_keys <= set(item)
+    assert item["remote_url"] == "https://github.com/octo-org/api-server"
+    assert item["language"] == "Go"
+    assert item["languages"] == ["Go", "Shell", "Dockerfile"]
+    assert item["language_bytes"]["Go"] == 182340
+    assert item["topics"] == ["golang", "api"]
+    assert item["archived"] is False
+    assert item["last_commit_at"] == "2025-11-30T10:00:00Z"
+
+
+def test_inv_scan_github_multiple_owners_partial_failure(
+    tmp_path, repo_server
+):
+    """Test owners are scanned together and one failure spares the rest."""
+    import json
+    import os
+
+    repos = [{"name": f"r{i}", "html_url": f"https://gh/r{i}",
+              "updated_at": "2025-01-01T00:00:00Z"} for i in range(150)]
+    server = repo_server(repos)
+    env = dict(os.environ, XDG_DATA_HOME=str(tmp_path / "data"),
+               XDG_CONFIG_HOME=str(tmp_path / "config"),
+               XDG_CACHE_HOME=str(tmp_path / "cache"),
+               PROJ_GITHUB_API_URL=server.url, COLUMNS="200")
+    env.pop("PROJ_GITHUB_TOKEN", None)
+    result = subprocess.run(
+        [sys.executable, "-m", "proj", "inv", "scan", "github",
+         "--user", "alice", "--org", "acme", "--org", "missing-org",
+         "--jsonl", "-"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+    assert result.returncode == 1
+    items = [json.loads(line) for line in result.stdout.splitlines()]
+    assert len(items) == 300
+    assert {item["owner"] for item in items} == {"alice", "acme"}
+    assert "HTTP 404" in result.stderr
+    assert {path.split("?")[0] for path in server.requests} == {
+        "/users/alice/repos", "/orgs/acme/repos", "/orgs/missing-org/repos",
+    }
+
+
+def test_inv_scan_gitlab_groups_into_inventory(tmp_path, repo_server):
+    """Test GitLab groups are scanned into the inventory and upserted."""
+    import json
+    import os
+
+    projects = [{"path": f"p{i}", "web_url": f"https://gl/acme/p{i}",
+                 "last_activity_at": "2025-01-01T00:00:00Z"}
+                for i in range(120)]
+    server = repo_server(projects, paging="gitlab")
+    env = dict(os.environ, XDG_DATA_HOME=str(tmp_path / "data"),
+               XDG_CONFIG_HOME=str(tmp_path / "config"),
+               XDG_CACHE_HOME=str(tmp_path / "cache"),
+               PROJ_GITLAB_API_URL=server.url, COLUMNS="200")
+    command = [sys.executable, "-m", "proj", "inv", "scan", "gitlab",
+               "--group", "acme/platform"]
+    for _ in range(2):
+        result = subprocess.run(
+            command, capture_output=True, text=True, env=env
+        )
+        assert result.returncode == 0, result.stderr
+
+    inventory = json.loads(
+        (tmp_path / "data" / "proj" / "inventory.json").read_text()
+    )
+    assert len(inventory) == 120
+    assert {item["scan_source"] for item in inventory} == {"gitlab"}
+    assert inventory[0]["owner"] == "acme/platform"
+    assert "GitLab Owners" in result.stdout
+
+
+def test_enrich_github_languages_uses_etag_cache(tmp_path, repo_server):
+    """Test languages are fetched concurrently and revalidated later."""
+    from proj.commands.inventory import enrich_github_languages
+    from proj.forges import GitHubClient
+    from proj.http_cache import HTTPCache
+
+    server = repo_server([])
+    items = [
+        {"name": f"repo{i}", "remote_url": f"https://github.com/o/repo{i}"}
+        for i in range(12)
+    ]
+    items.append({"name": "local", "remote_url": ""})
+    cache = HTTPCache(tmp_path / "http")
+
+    with GitHubClient(api_url=server.url, cache=cache) as client:
+        stats = enrich_github_languages(client, items, jobs=4)
+    assert (stats.updated, stats.skipped, stats.failed) == (12, 1, 0)
+    assert items[0]["languages"] == ["Python", "C"]
+    assert items[0]["language_bytes"] == {"Python": 500, "C": 10}
+
+    with GitHubClient(api_url=server.url, cache=cache) as client:
+        stats = enrich_github_languages(client, items, jobs=4)
+    assert (stats.updated, stats.unchanged) == (0, 12)
+
+
+def test_inv_enrich_exists():
+    """Test that inv enrich command exists."""
+    result = subprocess.run(
+        [sys.executable, "-m", "proj", "inv", "enrich", "--help"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0
@@ -0,0 +1,29 @@
+"""Tests for the tech stack detector registry."""
+from proj.detectors import DETECTORS, CATEGORIES, Detector, DetectorIndex
+
+
+def test_registry_categories_and_unique_names():
+    """Test every detector reports into a known category once."""
+    assert {detector.category for detector in DETECTORS} <= set(CATEGORIES)
+    keys = [(detector.category, detector.name) for detector in DETECTORS]
+    assert len(keys) == len(set(keys))
+
+
+def test_index_matches_files_suffixes_dirs_and_dependencies():
+    """Test each match kind, reported in registry order."""
+    index = DetectorIndex([
+        Detector("B", "languages", suffixes=(".b",)),
+        Detector("A", "languages", files=("a.txt",)),
+        Detector("D", "frameworks", dirs=("d",)),
+        Detector("P", "frameworks", dependencies=("p",)),
+    ])
+
+    assert index.match(["a.txt", "x.b"], ["d", "other"], ["p"]) == {
+        "languages": ["B", "A"],
+        "frameworks": ["D", "P"],
+        "build_systems": [],
+    }
+    # Names only match in their own kind
+    assert index.match(["d", "p", "b"], ["a.txt"]) == {
+        "languages": [], "frameworks": [], "build_systems": [],
+    }
@@ -0,0 +1,83 @@
+"""Tests for the shared forge client engine."""
+import pytest
+import requests
+
+from proj.forges import (
+    FORGES, GiteaClient, GitHubClient, GitLabClient, RateLimiter,
+    page_number, with_page,
+)
+from proj.retry import RetryPolicy
+
+
+def test_page_url_helpers():
+    """Test reading and replacing the page query parameter."""
+    url = "https://api.github.com/user/1/repos?per_page=100&page=7"
+
+    assert page_number(url) == 7
+    assert page_number("https://api.github.com/x") is None
+    assert page_number(with_page(url, 3)) == 3
+    assert "per_page=100" in with_page(url, 3)
+
+
+def test_forge_registry():
+    """Test every forge is registered under its scan_source name."""
+    assert FORGES == {
+        "github": GitHubClient,
+        "gitlab": GitLabClient,
+        "gitea": GiteaClient,
+    }
+
+
+def test_forges_authenticate_with_their_header():
+    """Test each client sends its forge's token header."""
+    github = GitHubClient(token="t1")
+    gitlab = GitLabClient(token="t2")
+    gitea = GiteaClient(token="t3", api_url="https://git.example/api/v1")
+
+    assert github.headers["Authorization"] == "token t1"
+    assert gitlab.headers["PRIVATE-TOKEN"] == "t2"
+    assert "Authorization" not in gitlab.headers
+    assert gitea.headers["Authorization"] == "token t3"
+
+
+def test_rate_limiter_reads_gitlab_headers():
+    """Test unprefixed RateLimit-* headers are tracked too."""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update({
+        "RateLimit-Limit": "2000",
+        "RateLimit-Remaining": "1999",
+        "RateLimit-Reset": "1700000000",
+    })
+    limiter = RateLimiter()
+    limiter.update(response)
+
+    assert limiter.snapshot() == {
+        "limit": 2000, "remaining": 1999, "reset_at": 1700000000.0,
+    }
+
+
+def test_transient_failures_are_retried(repo_server):
+    """Test a 503 and a dropped connection are retried, not raised."""
+    repos = [{"name": f"repo{i}"} for i in range(250)]
+    server = repo_server(repos, flaky={2}, drop={3})
+    sleeps = []
+
+    with GitHubClient(
+        api_url=server.url, jobs=2, sleep=sleeps.append,
+        retry_policy=RetryPolicy(backoff=0.01, jitter=False),
+    ) as client:
+        assert list(client.iter_repos("someone")) == repos
+
+    assert sorted(sleeps) == [0.01, 0.01]
+    assert len(server.requests) == 5
+
+
+def test_retries_give_up_after_policy_limit(repo_server):
+    """Test a page that keeps failing raises once retries run out."""
+    server = repo_server([{"name": "x"}], flaky={1})
+    policy = RetryPolicy(retries=0)
+
+    with GitHubClient(api_url=server.url, retry_policy=policy) as client:
+        with pytest.raises(requests.HTTPError):
+            list(client.iter_repos("someone"))
@@ -0,0 +1,39 @@
+"""Tests for the Gitea client."""
+from urllib.parse import parse_qs, urlsplit
+
+from proj.forges import GiteaClient
+
+
+def make_repos(count):
+    """Build fake Gitea repository listings."""
+    return [{"name": f"repo{i}", "html_url": f"https://gitea/o/repo{i}",
+             "updated_at": "2025-01-01T00:00:00Z"} for i in range(count)]
+
+
+def test_iter_repos_pages_with_limit(repo_server):
+    """Test pages are sized with ``limit`` and fetched concurrently."""
+    repos = make_repos(220)
+    server = repo_server(repos, paging="gitea", delay=0.02)
+
+    with GiteaClient(api_url=server.url, jobs=4) as client:
+        assert list(client.iter_repos("infra")) == repos
+
+    assert len(server.requests) == 5
+    assert server.max_active > 1
+    first = urlsplit(server.requests[0])
+    assert first.path == "/orgs/infra/repos"
+    assert parse_qs(first.query)["limit"] == ["50"]
+
+
+def test_iter_repos_ignores_since(repo_server):
+    """Test Gitea listings are complete even with a sync mark."""
+    repos = make_repos(60)
+    server = repo_server(repos, paging="gitea")
+
+    with GiteaClient(api_url=server.url) as client:
+        listed = list(
+            client.iter_repos("bob", since="2030-01-01", kind="users")
+        )
+
+    assert listed == repos
+    assert urlsplit(server.requests[0]).path == "/users/bob/repos"
@@ -0,0 +1,263 @@
+"""Tests for the GitHub REST and GraphQL client."""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests
+
+from proj.forges import (
+    GitHubClient, GraphQLError, RateLimiter, RateLimitError,
+)
+from proj.http_cache import HTTPCache
+
+
+def make_repos(count):
+    """Build fake repository listings."""
+    return [{"name": f"repo{i}", "html_url": f"https://x/{i}"}
+            for i in range(count)]
+
+
+def test_iter_repos_parallel_pages_in_order(repo_server):
+    """Test remaining pages are fetched concurrently and kept in order."""
+    repos = make_repos(1050)
+    server = repo_server(repos, delay=0.05)
+
+    with GitHubClient(api_url=server.url, jobs=4) as client:
+        names = [repo["name"] for repo in client.iter_repos("someone")]
+
+    assert names == [repo["name"] for repo in repos]
+    assert len(server.requests) == 11
+    assert server.max_active > 1
+
+
+def test_iter_repos_follows_next_without_last(repo_server):
+    """Test serial pagination when no last relation is sent."""
+    repos = make_repos(250)
+    server = repo_server(repos, last_link=False)
+
+    with GitHubClient(api_url=server.url, jobs=4) as client:
+        names = [repo["name"] for repo in client.iter_repos("someone")]
+
+    assert names == [repo["name"] for repo in repos]
+    assert server.max_active == 1
+
+
+def test_iter_repos_raises_http_errors(repo_server):
+    """Test a failing page surfaces as an HTTPError."""
+    server = repo_server(make_repos(800))
+
+    with GitHubClient(api_url=server.url, jobs=4) as client:
+        with pytest.raises(requests.HTTPError):
+            list(client.iter_repos("fail"))
+
+
+def test_iter_repos_revalidates_with_etags(repo_server, tmp_path):
+    """Test a rescan is answered by 304s and returns the cached pages."""
+    repos = make_repos(450)
+    server = repo_server(repos)
+    cache = HTTPCache(tmp_path / "http", identity="token-a")
+
+    with GitHubClient(api_url=server.url, cache=cache) as client:
+        first = list(client.iter_repos("someone"))
+        assert client.not_modified == 0
+
+    with GitHubClient(api_url=server.url, cache=cache) as client:
+        assert list(client.iter_repos("someone")) == first
+        assert client.requests_made == 5
+        assert client.not_modified == 5
+
+    repos[0]["name"] = "renamed"
+    with GitHubClient(api_url=server.url, cache=cache) as client:
+        assert list(client.iter_repos("someone"))[0]["name"] == "renamed"
+        assert client.not_modified == 4
+
+
+def test_iter_repos_stops_at_high_water_mark(repo_server):
+    """Test an incremental listing stops at the first older repo."""
+    repos = [
+        {"name": f"repo{i}", "updated_at": f"2025-01-{31 - i // 10:02d}"}
+        for i in range(300)
+    ]
+    server = repo_server(repos)
+
+    with GitHubClient(api_url=server.url, jobs=4) as client:
+        changed = list(client.iter_repos("someone", since="2025-01-28"))
+
+    assert [repo["name"] for repo in changed] == [
+        f"repo{i}" for i in range(40)
+    ]
+    assert len(server.requests) == 1
+
+
+class FakeClock:
+    """Clock whose sleeps advance time instantly."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+def quota_response(remaining, limit=100, reset_in=50, clock=None):
+    """Build a response carrying rate limit headers."""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update({
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(clock.now + reset_in)),
+    })
+    return response
+
+
+def test_rate_limiter_paces_low_quota():
+    """Test the last part of the quota is spread until the reset."""
+    clock = FakeClock()
+    limiter = RateLimiter(sleep=clock.sleep, clock=clock.time)
+    limiter.acquire()
+    limiter.update(quota_response(5, clock=clock))
+
+    for _ in range(3):
+        limiter.acquire()
+
+    # 50s left for 5 requests, then 4 left for the remaining 40s
+    assert clock.sleeps == [10.0, 10.0]
+
+
+def test_rate_limiter_waits_for_reset_or_gives_up():
+    """Test an exhausted quota waits for the reset within max_wait."""
+    clock = FakeClock()
+    limiter = RateLimiter(max_wait=100, sleep=clock.sleep, clock=clock.time)
+    limiter.update(quota_response(0, clock=clock))
+    limiter.acquire()
+    assert clock.sleeps == [51.0]
+
+    limiter.update(quota_response(0, reset_in=3600, clock=clock))
+    with pytest.raises(RateLimitError):
+        limiter.acquire()
+
+
+def test_iter_repos_retries_after_retry_after(repo_server):
+    """Test 429 responses pause the scan and the page is retried."""
+    repos = make_repos(500)
+    server = repo_server(repos, throttle={1, 3})
+    clock = FakeClock()
+    limiter = RateLimiter(sleep=clock.sleep, clock=clock.time)
+
+    with GitHubClient(
+        api_url=server.url, jobs=2, rate_limiter=limiter
+    ) as client:
+        assert list(client.iter_repos("someone")) == repos
+        assert client.requests_made == 7
+    assert limiter.waited >= 60
+
+
+def test_iter_repos_keeps_pages_before_rate_limit(repo_server):
+    """Test pages yielded before a too-long wait are kept."""
+    server = repo_server(make_repos(500), throttle={3})
+    limiter = RateLimiter(max_wait=5)
+    fetched = []
+
+    with GitHubClient(
+        api_url=server.url, jobs=1, rate_limiter=limiter
+    ) as client:
+        with pytest.raises(RateLimitError):
+            for repo in client.iter_repos("someone"):
+                fetched.append(repo)
+
+    assert len(fetched) == 200
+
+
+FIXTURES = Path(__file__).parent / "fixtures" / "github_graphql"
+
+
+class GraphQLHandler(BaseHTTPRequestHandler):
+    """Replay recorded GraphQL responses, selected by cursor."""
+
+    def do_POST(self):
+        server = self.server
+        length = int(self.headers["Content-Length"])
+        body = json.loads(self.rfile.read(length))
+        auth = self.headers.get("Authorization")
+        server.requests.append((self.path, body, auth))
+        cursor = body["variables"]["cursor"]
+        if body["variables"]["login"] == "ghost":
+            payload = {"data": {"repositoryOwner": None}}
+        else:
+            page = server.pages.get(cursor)
+            payload = json.loads((FIXTURES / page).read_text())
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def graphql_server():
+    """Stub GraphQL endpoint serving the recorded two-page listing."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GraphQLHandler)
+    server.daemon_threads = True
+    server.requests = []
+    server.pages = {
+        None: "repos_page1.json",
+        "Y3Vyc29yOnYyOpK5MjAyNS0xMS0yOA==": "repos_page2.json",
+    }
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_graphql_url_for_enterprise():
+    """Test the GraphQL endpoint is derived from the REST root."""
+    assert GitHubClient().graphql_url == "https://api.github.com/graphql"
+    assert GitHubClient(
+        api_url="https://ghe.example.com/api/v3"
+    ).graphql_url == "https://ghe.example.com/api/graphql"
+
+
+def test_iter_repos_graphql_follows_cursors(graphql_server):
+    """Test GraphQL pages are chained by cursor with one query per page."""
+    url = f"http://127.0.0.1:{graphql_server.server_address[1]}"
+
+    with GitHubClient(token="secret", api_url=url) as client:
+        nodes = list(client.iter_repos_graphql("octo-org"))
+
+    assert [node["name"] for node in nodes] == [
+        "api-server", "web-app", "infra", "old-fork", "empty",
+    ]
+    cursors = [body["variables"]["cursor"]
+               for _, body, _ in graphql_server.requests]
+    assert cursors == [None, "Y3Vyc29yOnYyOpK5MjAyNS0xMS0yOA=="]
+    path, body, auth = graphql_server.requests[0]
+    assert path == "/graphql"
+    assert auth == "token secret"
+    assert "repositoryTopics" in body["query"]
+
+
+def test_iter_repos_graphql_since_and_missing_owner(graphql_server):
+    """Test the high-water mark stops early and unknown owners raise."""
+    url = f"http://127.0.0.1:{graphql_server.server_address[1]}"
+
+    with GitHubClient(token="secret", api_url=url) as client:
+        changed = list(client.iter_repos_graphql(
+            "octo-org", since="2025-11-29T00:00:00Z"
+        ))
+        assert [node["name"] for node in changed] == ["api-server", "web-app"]
+        assert len(graphql_server.requests) == 1
+
+        with pytest.raises(GraphQLError):
+            list(client.iter_repos_graphql("ghost"))
@@ -0,0 +1,98 @@
+"""Tests for the GitLab client."""
+from urllib.parse import parse_qs, urlsplit
+
+from proj.forges import GitLabClient
+from proj.http_cache import HTTPCache
+
+
+def make_projects(count):
+    """Build fake GitLab project listings, most recently active first."""
+    return [{"path": f"proj{i}", "web_url": f"https://gl/g/proj{i}",
+             "last_activity_at": f"2025-01-01T00:{59 - i % 60:02d}:00Z"}
+            for i in range(count)]
+
+
+def test_iter_repos_parallel_pages_from_total_pages(repo_server):
+    """Test X-Total-Pages fans the remaining pages out in order."""
+    projects = make_projects(450)
+    server = repo_server(projects, paging="gitlab", delay=0.02)
+
+    with GitLabClient(api_url=server.url, jobs=4) as client:
+        assert list(client.iter_repos("acme/platform")) == projects
+
+    assert len(server.requests) == 5
+    assert server.max_active > 1
+    first = urlsplit(server.requests[0])
+    assert first.path == "/groups/acme%2Fplatform/projects"
+    query = parse_qs(first.query)
+    assert query["include_subgroups"] == ["true"]
+    assert query["order_by"] == ["last_activity_at"]
+
+
+def test_iter_repos_follows_next_page_without_total(repo_server):
+    """Test listings without X-Total-Pages are followed page by page."""
+    projects = make_projects(250)
+    server = repo_server(projects, paging="gitlab", last_link=False)
+
+    with GitLabClient(api_url=server.url, jobs=4) as client:
+        assert list(client.iter_repos("alice", kind="users")) == projects
+
+    pages = [
+        parse_qs(urlsplit(path).query).get("page", ["1"])[0]
+        for path in server.requests
+    ]
+    assert pages == ["1", "2", "3"]
+    assert urlsplit(server.requests[0]).path == "/users/alice/projects"
+
+
+def test_iter_repos_stops_at_last_activity_mark(repo_server):
+    """Test an incremental listing stops at older projects."""
+    projects = make_projects(50)
+    server = repo_server(projects, paging="gitlab")
+
+    with GitLabClient(api_url=server.url) as client:
+        names = [
+            repo["path"]
+            for repo in client.iter_repos(
+                "acme", since="2025-01-01T00:50:00Z"
+            )
+        ]
+
+    assert names == [f"proj{i}" for i in range(10)]
+    assert len(server.requests) == 1
+
+
+def test_iter_repos_pages_through_cached_listing(repo_server, tmp_path):
+    """Test a rescan answered by 304s still follows every page."""
+    projects = make_projects(250)
+    server = repo_server(projects, paging="gitlab")
+    cache = HTTPCache(tmp_path / "http")
+
+    with GitLabClient(api_url=server.url, cache=cache) as client:
+        assert list(client.iter_repos("acme")) == projects
+
+    with GitLabClient(api_url=server.url, cache=cache) as client:
+        assert list(client.iter_repos("acme")) == projects
+        assert client.requests_made == client.not_modified == 3
+
+
+def test_repo_item_maps_project():
+    """Test GitLab projects map onto the inventory item shape."""
+    item = GitLabClient().repo_item({
+        "path": "api", "web_url": "https://gitlab.com/acme/api",
+        "description": None, "last_activity_at": "2025-02-01T00:00:00Z",
+        "topics": ["go"], "archived": True,
+        "forked_from_project": {"id": 1},
+    })
+
+    assert item == {
+        "name": "api",
+        "remote_url": "https://gitlab.com/acme/api",
+        "description": "",
+        "source": "gitlab",
+        "language": "",
+        "updated_at": "2025-02-01T00:00:00Z",
+        "topics": ["go"],
+        "archived": True,
+        "fork": True,
+    }
@@ -0,0 +1,194 @@
+"""Tests for the native git metadata reader."""
+import shutil
+import subprocess
+
+import pytest
+
+from proj.gitmeta import GitConfigError, GitMetadataReader, parse_config
+
+
+@pytest.fixture
+def isolated_git(tmp_path, monkeypatch):
+    """Isolate git from the user's system and global config."""
+    global_config = tmp_path / "global.gitconfig"
+    global_config.write_text("")
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(global_config))
+    return global_config
+
+
+def make_repo(path, config_text):
+    """Create a minimal repository with the given .git/config."""
+    (path / ".git").mkdir(parents=True)
+    (path / ".git" / "config").write_text(config_text)
+    return path
+
+
+def test_parse_config_values(tmp_path):
+    """Test sections, subsections, quoting, comments and bare keys."""
+    config = tmp_path / "config"
+    config.write_text(
+        "[core]\n"
+        "\tbare = false ; comment\n"
+        "\tfilemode\n"
+        '[remote "origin"]\n'
+        '\turl = "git@host:a b.git"  # trailing\n'
+        "[Section.Sub]\n"
+        "\tkey = one \\\n"
+        "two\n"
+    )
+
+    assert parse_config(config) == [
+        ("core", "", "bare", "false"),
+        ("core", "", "filemode", "true"),
+        ("remote", "origin", "url", "git@host:a b.git"),
+        ("section", "sub", "key", "one two"),
+    ]
+
+
+def test_parse_config_malformed(tmp_path):
+    """Test that malformed config raises GitConfigError."""
+    config = tmp_path / "config"
+    config.write_text('[remote "origin"]\n\turl = "unterminated\n')
+
+    with pytest.raises(GitConfigError):
+        parse_config(config)
+
+
+def test_remote_url_from_config(tmp_path, isolated_git):
+    """Test reading remote.origin.url from .git/config."""
+    repo = make_repo(
+        tmp_path / "repo",
+        '[remote "origin"]\n\turl = https://github.com/user/repo.git\n',
+    )
+
+    reader = GitMetadataReader()
+    assert reader.remote_url(repo) == "https://github.com/user/repo.git"
+
+
+def test_remote_url_missing_origin(tmp_path, isolated_git):
+    """Test that a repository without origin returns None."""
+    repo = make_repo(tmp_path / "repo", "[core]\n\tbare = false\n")
+
+    assert GitMetadataReader().remote_url(repo) is None
+
+
+def test_remote_url_follows_worktree_gitdir(tmp_path, isolated_git):
+    """Test linked worktrees resolve config via gitdir and commondir."""
+    main = make_repo(
+        tmp_path / "main",
+        '[remote "origin"]\n\turl = git@github.com:user/main.git\n',
+    )
+    wt_git = main / ".git" / "worktrees" / "feature"
+    wt_git.mkdir(parents=True)
+    (wt_git / "commondir").write_text("../..\n")
+    worktree = tmp_path / "feature"
+    worktree.mkdir()
+    (worktree / ".git").write_text(f"gitdir: {wt_git}\n")
+
+    reader = GitMetadataReader()
+    assert reader.remote_url(worktree) == "git@github.com:user/main.git"
+
+
+def test_remote_url_follows_submodule_gitdir(tmp_path, isolated_git):
+    """Test submodules resolve a relative gitdir pointer."""
+    parent = make_repo(tmp_path / "parent", "")
+    module_git = parent / ".git" / "modules" / "lib"
+    module_git.mkdir(parents=True)
+    (module_git / "config").write_text(
+        '[remote "origin"]\n\turl = https://example.com/lib.git\n'
+    )
+    sub = parent / "lib"
+    sub.mkdir()
+    (sub / ".git").write_text("gitdir: ../.git/modules/lib\n")
+
+    reader = GitMetadataReader()
+    assert reader.remote_url(sub) == "https://example.com/lib.git"
+
+
+def test_remote_url_include_and_instead_of(tmp_path, isolated_git):
+    """Test include.path and global url.<base>.insteadOf rewrites."""
+    isolated_git.write_text(
+        '[url "git@github.com:"]\n\tinsteadOf = gh:\n'
+        '[url "git@github.com:org/"]\n\tinsteadOf = gh:org/\n'
+    )
+    (tmp_path / "shared.gitconfig").write_text(
+        '[remote "origin"]\n\turl = gh:org/repo.git\n'
+    )
+    repo = make_repo(
+        tmp_path / "repo",
+        "[include]\n\tpath = ../../shared.gitconfig\n",
+    )
+
+    reader = GitMetadataReader()
+    assert reader.remote_url(repo) == "git@github.com:org/repo.git"
+
+
+def test_outer_config_parsed_once_per_reader(
+    tmp_path, isolated_git, monkeypatch
+):
+    """Test global configs are parsed once; includeIf runs per repo."""
+    import proj.gitmeta as gitmeta
+
+    work = tmp_path / "work"
+    isolated_git.write_text(
+        f'[includeIf "gitdir:{work}/"]\n\tpath = work.gitconfig\n'
+    )
+    (tmp_path / "work.gitconfig").write_text(
+        '[url "git@work.example:"]\n\tinsteadOf = work:\n'
+    )
+    repos = [
+        make_repo(work / "a", '[remote "origin"]\n\turl = work:a.git\n'),
+        make_repo(work / "b", '[remote "origin"]\n\turl = work:b.git\n'),
+        make_repo(tmp_path / "home" / "c",
+                  '[remote "origin"]\n\turl = work:c.git\n'),
+    ]
+    parsed = []
+    original = gitmeta.parse_config
+
+    def counted(path):
+        parsed.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(gitmeta, "parse_config", counted)
+
+    reader = GitMetadataReader()
+    assert [reader.remote_url(repo) for repo in repos] == [
+        "git@work.example:a.git", "git@work.example:b.git", "work:c.git",
+    ]
+    assert parsed.count("global.gitconfig") == 1
+    assert parsed.count("work.gitconfig") == 1
+    assert parsed.count("config") == 3
+
+
+def test_unsupported_include_if_raises(tmp_path, isolated_git):
+    """Test that unsupported includeIf conditions defer to git."""
+    repo = make_repo(
+        tmp_path / "repo",
+        '[includeIf "onbranch:main"]\n\tpath = extra\n',
+    )
+
+    with pytest.raises(GitConfigError):
+        GitMetadataReader().remote_url(repo)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_remote_url_matches_git(tmp_path, isolated_git):
+    """Test that the native reader agrees with git remote get-url."""
+    isolated_git.write_text(
+        '[url "https://mirror.example.com/"]\n'
+        "\tinsteadOf = https://github.com/\n"
+    )
+    repo = tmp_path / "repo"
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    subprocess.run(
+        ["git", "-C", str(repo), "remote", "add", "origin",
+         "https://github.com/user/repo.git"],
+        check=True,
+    )
+    expected = subprocess.run(
+        ["git", "-C", str(repo), "remote", "get-url", "origin"],
+        capture_output=True, text=True, check=True,
+    ).stdout.strip()
+
+    assert GitMetadataReader().remote_url(repo) == expected
@@ -0,0 +1,59 @@
+"""Tests for the conditional request cache."""
+import requests
+
+from proj.http_cache import HTTPCache, credential_identity
+
+
+def make_response(url, body, headers):
+    """Build a requests.Response as if received from a server."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers.update(headers)
+    response._content = body.encode()
+    return response
+
+
+def test_cache_entries_are_scoped_by_identity(tmp_path):
+    """Test entries stored for one token are not seen by another."""
+    url = "https://api.github.com/users/a/repos?page=1"
+    mine = HTTPCache(tmp_path, credential_identity("token-a"))
+    mine.store(url, make_response(url, "[1]", {"ETag": '"v1"'}))
+
+    assert mine.conditional_headers(mine.lookup(url)) == {
+        "If-None-Match": '"v1"'
+    }
+    assert HTTPCache(tmp_path, credential_identity("token-b")).lookup(
+        url
+    ) is None
+    assert HTTPCache(tmp_path).lookup(url) is None
+    assert "token-a" not in credential_identity("token-a")
+
+
+def test_cache_replays_stored_body_on_304(tmp_path):
+    """Test replay keeps the cached body and links with fresh headers."""
+    url = "https://api.github.com/users/a/repos?page=1"
+    cache = HTTPCache(tmp_path)
+    cache.store(url, make_response(url, '[{"name": "x"}]', {
+        "ETag": '"v1"', "Link": '<https://n>; rel="next"',
+    }))
+    not_modified = make_response(url, "", {
+        "ETag": '"v1"', "X-RateLimit-Remaining": "4999",
+        "Content-Length": "0",
+    })
+    not_modified.status_code = 304
+
+    replayed = cache.replay(cache.lookup(url), not_modified)
+    assert replayed.status_code == 200
+    assert replayed.json() == [{"name": "x"}]
+    assert replayed.links["next"]["url"] == "https://n"
+    assert replayed.headers["X-RateLimit-Remaining"] == "4999"
+
+
+def test_cache_skips_responses_without_validators(tmp_path):
+    """Test responses without ETag or Last-Modified are not stored."""
+    url = "https://example.com/x"
+    cache = HTTPCache(tmp_path)
+    cache.store(url, make_response(url, "{}", {}))
+
+    assert cache.lookup(url) is None
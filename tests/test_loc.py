@@ -0,0 +1,130 @@
+"""Tests for lines-of-code counting."""
+import os
+
+from proj.loc import (
+    LocCache, LocCounter, count_lines, file_language,
+)
+from proj.scanner import ScanFilter
+
+
+def write(path, content):
+    """Create a file (and its parents) holding ``content``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+def age(path, seconds=10):
+    """Move a file's mtime out of the cache's racy window."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 10**9))
+
+
+def test_count_lines_chunks_and_binary(tmp_path):
+    """Test newline counting across chunks, a missing last newline, NULs."""
+    text = write(tmp_path / "a.py", b"one\ntwo\nthree")
+    empty = write(tmp_path / "b.py", b"")
+    binary = write(tmp_path / "c.py", b"x\0y\n")
+
+    assert [count_lines(str(text), size) for size in (1, 2, 3, 64)] == [3] * 4
+    assert count_lines(str(empty)) == 0
+    assert count_lines(str(binary)) is None
+    assert count_lines(str(tmp_path / "gone.py")) is None
+
+
+def test_file_language_by_name_and_suffix():
+    """Test exact names win over suffixes and unknown files are skipped."""
+    assert file_language("main.rs") == "Rust"
+    assert file_language("Gemfile") == "Ruby"
+    assert file_language("engine.hpp") == file_language("io.c") == "C/C++"
+    assert file_language("Makefile") is None
+    assert file_language("App.vue") is None
+    assert file_language("notes.txt") is None
+
+
+def test_counter_applies_scan_ignore_rules(tmp_path):
+    """Test node_modules, excludes, .projignore and .gitignore are pruned."""
+    root = tmp_path / "repo"
+    write(root / "src" / "main.go", b"package main\n\nfunc main() {}\n")
+    write(root / "src" / "util.go", b"package main\n")
+    write(root / "node_modules" / "x" / "index.js", b"a\nb\n")
+    write(root / "vendor" / "lib.go", b"a\n" * 50)
+    write(root / "build" / "out.js", b"a\n" * 50)
+    write(root / "gen" / "big.min.js", b"a\n")
+    write(root / "gen" / "keep.js", b"a\n")
+    write(root / ".projignore", b"build\n")
+    write(root / "gen" / ".gitignore", b"*.min.js\n")
+
+    ignore = ScanFilter(exclude=["vendor"], use_gitignore=True)
+    with LocCounter(ignore=ignore) as counter:
+        loc = counter.count(str(root))
+
+    assert loc == {
+        "Go": {"files": 2, "lines": 4},
+        "JavaScript": {"files": 1, "lines": 1},
+    }
+    assert counter.stats.dirs_skipped == 3
+    assert LocCounter().count(str(tmp_path / "missing")) is None
+
+
+def test_counter_parallel_matches_serial(tmp_path):
+    """Test the worker pool gives the same totals as a serial walk."""
+    root = tmp_path / "mono"
+    suffixes = [".py", ".ts", ".cpp", ".md"]
+    for i in range(120):
+        path = root / f"pkg{i % 6}" / f"mod{i % 4}" / f"f{i}{suffixes[i % 4]}"
+        write(path, b"x\n" * (i + 1))
+
+    serial = LocCounter(jobs=1).count(str(root))
+    with LocCounter(jobs=8) as counter:
+        parallel = counter.count(str(root))
+
+    assert parallel == serial
+    assert list(serial) == ["C/C++", "TypeScript", "Python"]
+    assert serial["Python"] == {"files": 30, "lines": sum(range(1, 120, 4))}
+
+
+def test_cache_skips_unchanged_files(tmp_path):
+    """Test a rerun only reads files whose stat changed and saves counts."""
+    root = tmp_path / "repo"
+    a = write(root / "a.py", b"1\n2\n")
+    b = write(root / "b.py", b"1\n")
+    age(a)
+    age(b)
+    cache_file = tmp_path / "loc_cache.json"
+
+    cache = LocCache.load(cache_file)
+    first = LocCounter(cache=cache)
+    assert first.count(str(root))["Python"]["lines"] == 3
+    cache.save(cache_file)
+
+    b.write_bytes(b"1\n2\n3\n")
+    age(b, 5)
+    second = LocCounter(cache=LocCache.load(cache_file))
+    loc = second.count(str(root))
+
+    assert loc["Python"] == {"files": 2, "lines": 5}
+    assert (second.stats.files_read, second.stats.files_cached) == (1, 1)
+
+    forced = LocCounter(cache=LocCache.load(cache_file, use_cached=False))
+    forced.count(str(root))
+    assert forced.stats.files_read == 2
+
+
+def test_cache_save_drops_deleted_files(tmp_path):
+    """Test a recounted root's records are replaced, other roots kept."""
+    root = tmp_path / "repo"
+    a = write(root / "a.py", b"1\n")
+    age(a)
+    other = str(tmp_path / "other")
+    cache = LocCache({
+        str(root): {"deleted.py": [1, 1, 1, 1]},
+        other: {"x.py": [1, 1, 1, 1]},
+    })
+    LocCounter(cache=cache).count(str(root))
+    cache.save(tmp_path / "loc_cache.json")
+
+    saved = LocCache.load(tmp_path / "loc_cache.json").roots
+    assert sorted(saved) == sorted([str(root), other])
+    assert list(saved[str(root)]) == ["a.py"]
+    assert saved[other] == {"x.py": [1, 1, 1, 1]}
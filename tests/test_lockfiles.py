@@ -0,0 +1,183 @@
+"""Tests for streaming lockfile parsers."""
+import io
+import json
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from proj.lockfiles import (
+    iter_json_tokens, parse_go_sum, parse_package_lock, parse_toml_packages,
+    parse_yarn_lock, read_lockfile,
+)
+
+
+def test_json_tokens_survive_chunk_boundaries():
+    """Test tokens cut by tiny chunks come out whole and correctly typed."""
+    text = json.dumps({"a b": ["x\"y", 1, True, None], "k": {"v": "é"}})
+    expected = list(iter_json_tokens(io.StringIO(text)))
+
+    for size in range(1, 8):
+        assert list(iter_json_tokens(io.StringIO(text), size)) == expected
+    assert expected == [
+        ("open", "{"), ("key", "a b"), ("open", "["), ("string", 'x"y'),
+        ("close", "]"), ("key", "k"), ("open", "{"), ("key", "v"),
+        ("string", "é"), ("close", "}"), ("close", "}"),
+    ]
+
+
+def test_parse_package_lock_v3_and_v1():
+    """Test v3 packages by node_modules path and the nested v1 tree."""
+    v3 = json.dumps({
+        "lockfileVersion": 3,
+        "packages": {
+            "": {"name": "app", "version": "1.0.0"},
+            "node_modules/@babel/core": {
+                "version": "7.1.0", "dependencies": {"version": "^1"},
+            },
+            "node_modules/a/node_modules/b": {"version": "2.0.0"},
+            "node_modules/linked": {"resolved": "libs/x", "link": True},
+        },
+        "dependencies": {"ignored": {"version": "9.9.9"}},
+    }, indent=2)
+    v1 = json.dumps({
+        "lockfileVersion": 1,
+        "dependencies": {
+            "a": {
+                "version": "1.0.0",
+                "requires": {"b": "^2"},
+                "dependencies": {"b": {"version": "2.0.0"}},
+            },
+        },
+    })
+
+    assert list(parse_package_lock(io.StringIO(v3))) == [
+        ("@babel/core", "7.1.0"), ("b", "2.0.0"),
+    ]
+    assert list(parse_package_lock(io.StringIO(v1))) == [
+        ("a", "1.0.0"), ("b", "2.0.0"),
+    ]
+
+
+def test_parse_yarn_lock_classic_and_berry():
+    """Test both yarn.lock generations, skipping metadata and workspaces."""
+    classic = textwrap.dedent('''\
+        # yarn lockfile v1
+
+
+        "@babel/code-frame@^7.0.0", "@babel/code-frame@^7.10.4":
+          version "7.12.13"
+          dependencies:
+            "@babel/highlight" "^7.10.4"
+
+        lodash@^4.17.0:
+          version "4.17.21"
+    ''')
+    berry = textwrap.dedent('''\
+        __metadata:
+          version: 6
+
+        "app@workspace:.":
+          version: 0.0.0-use.local
+
+        "react@npm:^18.0.0":
+          version: 18.2.0
+    ''')
+
+    assert list(parse_yarn_lock(io.StringIO(classic))) == [
+        ("@babel/code-frame", "7.12.13"), ("lodash", "4.17.21"),
+    ]
+    assert list(parse_yarn_lock(io.StringIO(berry))) == [
+        ("react", "18.2.0"),
+    ]
+
+
+def test_parse_toml_packages_ignores_sub_tables():
+    """Test poetry/uv/Cargo [[package]] tables and nothing else."""
+    lock = textwrap.dedent('''\
+        version = 1
+
+        [[package]]
+        name = "idna"
+        version = "3.7"
+        source = { registry = "https://pypi.org/simple" }
+        dependencies = [
+            { name = "other" },
+        ]
+
+        [package.extras]
+        version = ["x"]
+
+        [[package]]
+        name = "serde"
+        version = "1.0.0"
+
+        [metadata]
+        name = "not-a-package"
+    ''')
+
+    assert list(parse_toml_packages(io.StringIO(lock))) == [
+        ("idna", "3.7"), ("serde", "1.0.0"),
+    ]
+
+
+def test_parse_go_sum_and_read_lockfile(tmp_path):
+    """Test go.sum pairs are de-duplicated and sorted by read_lockfile."""
+    go_sum = (
+        "golang.org/x/text v0.3.0 h1:abc=\n"
+        "golang.org/x/text v0.3.0/go.mod h1:def=\n"
+        "github.com/a/b v1.2.0/go.mod h1:ghi=\n"
+    )
+    path = tmp_path / "go.sum"
+    path.write_text(go_sum)
+
+    assert len(list(parse_go_sum(io.StringIO(go_sum)))) == 3
+    assert read_lockfile(path) == [
+        ["github.com/a/b", "v1.2.0"], ["golang.org/x/text", "v0.3.0"],
+    ]
+    assert read_lockfile(tmp_path / "missing" / "go.sum") == []
+
+
+MEMORY_PROBE = """
+import resource, sys
+from proj.lockfiles import read_lockfile
+pairs = read_lockfile(sys.argv[1])
+print(len(pairs), resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def test_package_lock_memory_ceiling(tmp_path):
+    """Test a 100 MB package-lock.json parses in well under 100 MB."""
+    pytest.importorskip("resource")
+    path = tmp_path / "package-lock.json"
+    entry = (
+        '    "node_modules/parent{i}/node_modules/pkg{n}": {{\n'
+        '      "version": "1.{v}.0",\n'
+        '      "resolved": "https://registry.npmjs.org/pkg{n}.tgz",\n'
+        '      "integrity": "sha512-' + "A" * 86 + '==",\n'
+        '      "dev": true,\n'
+        '      "dependencies": {{"left-pad": "^1.3.0"}}\n'
+        "    }},\n"
+    )
+    target = 100 * 2**20
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{\n  "lockfileVersion": 3,\n  "packages": {\n')
+        i = size = 0
+        while size < target:
+            line = entry.format(i=i, n=i % 2000, v=i % 7)
+            f.write(line)
+            size += len(line)
+            i += 1
+        f.write('    "": {"name": "big"}\n  }\n}\n')
+
+    result = subprocess.run(
+        [sys.executable, "-c", MEMORY_PROBE, str(path)],
+        capture_output=True, text=True, check=True,
+    )
+    pairs, max_rss_kb = map(int, result.stdout.split())
+
+    assert pairs == 14000  # 2000 names x 7 versions
+    # Interpreter baseline plus a few chunks: a whole-file json.load
+    # needs several times the file size
+    assert max_rss_kb < 80 * 1024
@@ -0,0 +1,103 @@
+"""Tests for the API retry policy and circuit breaker."""
+from datetime import datetime, timezone
+
+import pytest
+import requests
+
+from proj.error_handler import CircuitOpenError
+from proj.retry import CircuitBreaker, RetryPolicy, retry_after_seconds
+
+
+def response_with(headers):
+    """Build a response carrying ``headers``."""
+    response = requests.Response()
+    response.status_code = 503
+    response.headers.update(headers)
+    return response
+
+
+def test_retry_policy_only_retries_idempotent_methods():
+    """Test POST is never retried and PATCH only when opted in."""
+    policy = RetryPolicy(retries=2)
+
+    assert policy.can_retry("GET", 0)
+    assert policy.can_retry("delete", 1)
+    assert not policy.can_retry("GET", 2)
+    assert not policy.can_retry("POST", 0)
+    assert not policy.can_retry("PATCH", 0)
+    assert RetryPolicy(retry_patch=True).can_retry("PATCH", 0)
+
+
+def test_retry_policy_backoff_and_jitter():
+    """Test delays double up to max_delay and jitter stays below them."""
+    policy = RetryPolicy(backoff=0.5, max_delay=3, jitter=False)
+    assert [policy.delay(n) for n in range(5)] == [0.5, 1, 2, 3, 3]
+
+    jittered = RetryPolicy(backoff=0.5, max_delay=3)
+    delays = [jittered.delay(2) for _ in range(50)]
+    assert all(0 <= delay <= 2 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_retry_policy_honors_retry_after():
+    """Test Retry-After wins over backoff unless it is too long."""
+    policy = RetryPolicy(max_delay=30, jitter=False)
+
+    assert policy.delay(0, response_with({"Retry-After": "7"})) == 7
+    assert policy.delay(0, response_with({"Retry-After": "120"})) is None
+    assert policy.delay(0, response_with({})) == 0.5
+
+
+def test_retry_after_http_date():
+    """Test the HTTP-date form of Retry-After."""
+    now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    response = response_with({"Retry-After": "Wed, 01 Jan 2025 12:00:20 GMT"})
+
+    assert retry_after_seconds(response, now=now) == 20
+    assert retry_after_seconds(response_with({"Retry-After": "soon"})) is None
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_circuit_breaker_opens_and_half_opens():
+    """Test the circuit opens at threshold and a trial request closes it."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=3, reset_after=30, clock=clock)
+    for _ in range(3):
+        breaker.before_request()
+        breaker.record_failure()
+
+    assert breaker.is_open
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    clock.now += 30
+    breaker.before_request()  # the trial request
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()  # others wait for the trial
+    breaker.record_success()
+
+    assert not breaker.is_open
+    breaker.before_request()
+
+
+def test_circuit_breaker_reopens_after_failed_trial():
+    """Test a failing trial request re-opens the circuit immediately."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=2, reset_after=10, clock=clock)
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now += 10
+    breaker.before_request()
+    breaker.record_failure()
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
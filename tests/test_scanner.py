@@ -0,0 +1,464 @@
+"""Tests for the local project scanner."""
+import os
+import time
+from pathlib import Path
+
+from proj.scanner import (
+    IgnoreRules, PathTrie, ScanBudget, ScanCache, ScanFilter, ScanJournal,
+    ScanStats, WalkState, walk_projects,
+)
+
+
+def make_tree(root: Path, paths: list[str]) -> None:
+    """Create files (or directories for paths ending in /) under root."""
+    for rel in paths:
+        target = root / rel
+        if rel.endswith("/"):
+            target.mkdir(parents=True, exist_ok=True)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.touch()
+
+
+def age_tree(root: Path, seconds: int = 3600) -> None:
+    """Backdate directory mtimes so the cache treats them as settled."""
+    past = time.time() - seconds
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, (past, past))
+
+
+def found_paths(root: Path, depth: int, **kwargs) -> list[tuple[str, str]]:
+    """Return (relative path, marker) pairs found by the walker."""
+    return [
+        (found.path.relative_to(root).as_posix(), found.marker)
+        for found in walk_projects(root, depth, **kwargs)
+    ]
+
+
+def test_walk_finds_all_markers(tmp_path):
+    """Test that each marker type is detected in one pass."""
+    make_tree(tmp_path, [
+        "alpha/.git/",
+        "beta/package.json",
+        "gamma/pyproject.toml",
+        "delta/Cargo.toml",
+        "epsilon/go.mod",
+        "plain/README.md",
+    ])
+
+    assert found_paths(tmp_path, 2) == [
+        ("alpha", ".git"),
+        ("beta", "package.json"),
+        ("delta", "Cargo.toml"),
+        ("epsilon", "go.mod"),
+        ("gamma", "pyproject.toml"),
+    ]
+
+
+def test_walk_prefers_git_marker(tmp_path):
+    """Test that .git wins when a directory has several markers."""
+    make_tree(tmp_path, ["repo/.git/", "repo/package.json"])
+
+    assert found_paths(tmp_path, 2) == [("repo", ".git")]
+
+
+def test_walk_respects_depth(tmp_path):
+    """Test that directories past max depth are never listed."""
+    make_tree(tmp_path, [
+        "a/.git/",
+        "group/b/.git/",
+        "group/deeper/c/.git/",
+    ])
+    stats = ScanStats()
+
+    assert found_paths(tmp_path, 2, stats=stats) == [
+        ("a", ".git"),
+        ("group/b", ".git"),
+    ]
+    # root, a, group, group/b, group/deeper - never group/deeper/c
+    assert stats.dirs_scanned == 5
+
+
+def test_walk_prunes_node_modules_and_git(tmp_path):
+    """Test that node_modules and .git internals are not walked."""
+    make_tree(tmp_path, [
+        "app/package.json",
+        "app/node_modules/dep/package.json",
+        "repo/.git/modules/sub/package.json",
+    ])
+
+    assert found_paths(tmp_path, 5) == [
+        ("app", "package.json"),
+        ("repo", ".git"),
+    ]
+
+
+def test_walk_skips_subprojects_inside_repo(tmp_path):
+    """Test that marker hits inside a git repo are not separate projects."""
+    make_tree(tmp_path, [
+        "repo/.git/",
+        "repo/frontend/package.json",
+        "repo/vendored/.git/",
+    ])
+
+    assert found_paths(tmp_path, 3) == [
+        ("repo", ".git"),
+        ("repo/vendored", ".git"),
+    ]
+
+
+def test_walk_missing_root(tmp_path):
+    """Test that an unreadable root yields nothing."""
+    assert found_paths(tmp_path / "missing", 2) == []
+
+
+def test_cache_reuses_unchanged_directories(tmp_path):
+    """Test that a rescan lists no directory whose entries are unchanged."""
+    root = tmp_path / "workspace"
+    make_tree(root, ["a/.git/", "b/package.json", "c/docs/"])
+    age_tree(root)
+    cache_file = tmp_path / "scan_cache.json"
+
+    first = ScanCache.load(cache_file)
+    expected = found_paths(root, 2, cache=first)
+    first.save(cache_file)
+
+    stats = ScanStats()
+    second = ScanCache.load(cache_file)
+    assert found_paths(root, 2, stats=stats, cache=second) == expected
+    assert stats.dirs_scanned == 0
+    assert stats.dirs_cached == 5
+
+
+def test_cache_relists_changed_directory(tmp_path):
+    """Test that adding an entry invalidates only that directory."""
+    make_tree(tmp_path, ["a/.git/", "c/docs/"])
+    age_tree(tmp_path)
+    cache = ScanCache()
+    found_paths(tmp_path, 2, cache=cache)
+
+    make_tree(tmp_path, ["c/go.mod"])
+    stats = ScanStats()
+    rescan = ScanCache(cache.updated)
+    assert found_paths(tmp_path, 2, stats=stats, cache=rescan) == [
+        ("a", ".git"),
+        ("c", "go.mod"),
+    ]
+    assert stats.dirs_scanned == 1
+
+
+def test_cache_full_walk_ignores_records(tmp_path):
+    """Test that use_cached=False lists every directory again."""
+    make_tree(tmp_path, ["a/.git/"])
+    age_tree(tmp_path)
+    cache = ScanCache()
+    found_paths(tmp_path, 2, cache=cache)
+
+    stats = ScanStats()
+    found_paths(
+        tmp_path, 2, stats=stats,
+        cache=ScanCache(cache.updated, use_cached=False),
+    )
+    assert stats.dirs_scanned == 2
+    assert stats.dirs_cached == 0
+
+
+def test_cache_skips_recently_modified_directories(tmp_path):
+    """Test that directories changed during the scan are not cached."""
+    make_tree(tmp_path, ["a/.git/"])
+    cache = ScanCache()
+    found_paths(tmp_path, 2, cache=cache)
+
+    assert str(tmp_path) not in cache.updated
+
+
+def make_random_tree(root: Path, seed: int) -> None:
+    """Create a pseudo-random workspace with repos, markers and prunes."""
+    import random
+
+    rng = random.Random(seed)
+    markers = [".git/", "package.json", "pyproject.toml", "Cargo.toml",
+               "go.mod", "README.md", "node_modules/x/package.json"]
+    paths = []
+    for i in range(300):
+        parts = [f"d{rng.randint(0, 6)}" for _ in range(rng.randint(1, 5))]
+        paths.append("/".join(parts) + "/" + rng.choice(markers))
+    make_tree(root, paths)
+
+
+def test_parallel_walk_matches_serial(tmp_path):
+    """Test that the work-stealing walk returns exactly the serial result."""
+    for seed in range(3):
+        root = tmp_path / f"tree{seed}"
+        make_random_tree(root, seed)
+        for depth in (2, 4, 6):
+            serial_stats = ScanStats()
+            serial = found_paths(root, depth, stats=serial_stats)
+            for workers in (2, 8):
+                parallel_stats = ScanStats()
+                parallel = found_paths(
+                    root, depth, stats=parallel_stats, workers=workers
+                )
+                assert parallel == serial
+                assert parallel_stats.dirs_scanned == serial_stats.dirs_scanned
+
+
+def test_unordered_parallel_walk_streams_projects(tmp_path, monkeypatch):
+    """Test ordered=False yields a project while the walk is still busy."""
+    import threading
+
+    from proj import scanner
+
+    root = tmp_path / "ws"
+    (root / "app" / ".git").mkdir(parents=True)
+    (root / "slow" / "lib" / ".git").mkdir(parents=True)
+    released = threading.Event()
+    waited = []
+    read_dir = scanner._read_dir
+
+    def blocking_read_dir(path, walk, stats):
+        if path.endswith("slow"):
+            waited.append(released.wait(5))
+        return read_dir(path, walk, stats)
+
+    monkeypatch.setattr(scanner, "_read_dir", blocking_read_dir)
+    state = WalkState()
+    found = walk_projects(root, 3, workers=2, state=state, ordered=False)
+
+    assert next(found).path.name == "app"
+    released.set()
+    assert [project.path.name for project in found] == ["lib"]
+    assert waited == [True]
+    assert state.complete
+    assert [f.path.name for f in state.found] == ["app", "lib"]
+
+
+def test_path_trie_lookup_and_dedupe():
+    """Test insert, membership and duplicate rejection."""
+    trie = PathTrie()
+
+    assert trie.insert("/ws/repo", "repo")
+    assert not trie.insert("/ws/repo", "again")
+    assert trie.insert("/ws/repo/pkg", "pkg")
+
+    assert "/ws/repo" in trie
+    assert "/ws" not in trie
+    assert "/ws/other" not in trie
+    assert trie.get("/ws/repo") == "repo"
+    assert len(trie) == 2
+
+
+def test_path_trie_ancestors():
+    """Test that ancestors yields strict ancestors outermost first."""
+    trie = PathTrie()
+    trie.insert("/ws", "ws")
+    trie.insert("/ws/repo", "repo")
+    trie.insert("/ws/repo/pkg/lib", "lib")
+
+    assert list(trie.ancestors("/ws/repo/pkg/lib")) == ["ws", "repo"]
+    assert list(trie.ancestors("/ws/repo")) == ["ws"]
+    assert list(trie.ancestors("/elsewhere/x")) == []
+
+
+def test_ignore_rules_matching():
+    """Test gitignore-style anchoring, wildcards and negation."""
+    rules = IgnoreRules([
+        "# comment",
+        "build/",
+        "bazel-*",
+        "/top",
+        "docs/generated",
+        "!keep-build",
+        "*-build",
+    ])
+
+    assert rules.match("build") is True
+    assert rules.match("a/b/build") is True
+    assert rules.match("bazel-out") is True
+    assert rules.match("top") is True
+    assert rules.match("a/top") is None
+    assert rules.match("docs/generated") is True
+    assert rules.match("x/docs/generated") is None
+    assert rules.match("src") is None
+
+    negated = IgnoreRules(["*-build", "!keep-build"])
+    assert negated.match("keep-build") is False
+    assert negated.match("drop-build") is True
+
+
+def test_walk_prunes_configured_excludes_and_projignore(tmp_path):
+    """Test config globs and .projignore prune during the walk."""
+    make_tree(tmp_path, [
+        "app/pyproject.toml",
+        "app/.venv/lib/pyproject.toml",
+        "bazel-out/x/go.mod",
+        "scratch/tool/go.mod",
+        ".projignore",
+    ])
+    (tmp_path / ".projignore").write_text("/scratch\n")
+    stats = ScanStats()
+
+    assert found_paths(
+        tmp_path, 4, stats=stats,
+        ignore=ScanFilter(exclude=[".venv", "bazel-*"]),
+    ) == [("app", "pyproject.toml")]
+    assert stats.dirs_skipped == 3
+
+
+def test_walk_honors_gitignore_when_enabled(tmp_path):
+    """Test nested .gitignore files prune only when enabled."""
+    make_tree(tmp_path, [
+        "repo/.git/",
+        "repo/out/nested/.git/",
+        "repo/keep/nested/.git/",
+    ])
+    (tmp_path / "repo" / ".gitignore").write_text("out/\n")
+
+    assert found_paths(
+        tmp_path, 4, ignore=ScanFilter(use_gitignore=True)
+    ) == [("repo", ".git"), ("repo/keep/nested", ".git")]
+    assert len(found_paths(tmp_path, 4, ignore=ScanFilter())) == 3
+
+
+def test_explicit_excludes_win_over_gitignore_negation(tmp_path):
+    """Test a .gitignore negation cannot re-include an excluded dir."""
+    make_tree(tmp_path, [
+        "repo/.git/",
+        "repo/build/tool/.git/",
+        "repo/dist/tool/.git/",
+    ])
+    (tmp_path / "repo" / ".gitignore").write_text("!build/\n!dist/\n")
+    (tmp_path / ".projignore").write_text("dist\n")
+
+    assert found_paths(
+        tmp_path, 4, ignore=ScanFilter(exclude=["build"], use_gitignore=True)
+    ) == [("repo", ".git")]
+
+
+def test_walk_ignores_symlinks_by_default(tmp_path):
+    """Test that symlinked directories are not followed by default."""
+    make_tree(tmp_path, ["real/app/go.mod", "links/"])
+    (tmp_path / "links" / "app").symlink_to(tmp_path / "real" / "app")
+
+    assert found_paths(tmp_path, 3) == [("real/app", "go.mod")]
+
+
+def test_walk_follows_symlinks_once(tmp_path):
+    """Test followed symlinks and loops never visit a directory twice."""
+    make_tree(tmp_path, ["a/app/go.mod", "b/"])
+    (tmp_path / "b" / "alias").symlink_to(tmp_path / "a")
+    (tmp_path / "a" / "loop").symlink_to(tmp_path)
+    stats = ScanStats()
+
+    assert found_paths(
+        tmp_path, 6, stats=stats, follow_symlinks=True
+    ) == [("a/app", "go.mod")]
+    # b/alias and a/loop both lead to directories already walked
+    assert stats.dirs_aliased == 2
+
+
+def test_walk_one_file_system(tmp_path, monkeypatch):
+    """Test that directories on another device are not entered."""
+    import proj.scanner as scanner
+
+    make_tree(tmp_path, ["local/go.mod", "mnt/share/remote/go.mod"])
+    mount = str(tmp_path / "mnt" / "share")
+    real_stat = os.stat
+
+    class FakeStat:
+        """stat result reporting a different device."""
+
+        def __init__(self, st):
+            self._st = st
+            self.st_dev = st.st_dev + 1
+
+        def __getattr__(self, name):
+            return getattr(self._st, name)
+
+    def fake_stat(path, *args, **kwargs):
+        """Pretend mnt/share is a mount point."""
+        st = real_stat(path, *args, **kwargs)
+        return FakeStat(st) if str(path) == mount else st
+
+    monkeypatch.setattr(scanner.os, "stat", fake_stat)
+    stats = ScanStats()
+
+    assert found_paths(
+        tmp_path, 4, stats=stats, one_file_system=True
+    ) == [("local", "go.mod")]
+    assert stats.mounts_skipped == 1
+    assert len(found_paths(tmp_path, 4)) == 2
+
+
+def resume_until_complete(root: Path, depth: int, tmp_path: Path,
+                          **kwargs) -> list[tuple[str, str]]:
+    """Walk in small entry budgets, round-tripping state via a journal."""
+    journal_file = tmp_path / "journal.json"
+    ScanJournal(journal_file, {"depth": depth}).save()
+    for _ in range(1000):
+        journal = ScanJournal.load(journal_file)
+        state = journal.state(str(root))
+        found = found_paths(
+            root, depth, state=state,
+            budget=ScanBudget(max_entries=20), **kwargs
+        )
+        if state.complete:
+            return found
+        journal.save()
+    raise AssertionError("walk never completed")
+
+
+def test_entry_budget_stops_walk_with_pending(tmp_path):
+    """Test that an exhausted budget leaves unvisited directories pending."""
+    make_random_tree(tmp_path, 0)
+    state = WalkState()
+    budget = ScanBudget(max_entries=10)
+
+    partial = found_paths(tmp_path, 4, state=state, budget=budget)
+    assert not state.complete
+    assert state.pending
+    assert budget.reason == "entry budget exhausted"
+    assert len(partial) < len(found_paths(tmp_path, 4))
+
+
+def test_stopped_budget_visits_nothing(tmp_path):
+    """Test that stop() before the walk leaves the root pending."""
+    make_tree(tmp_path, ["a/.git/"])
+    state = WalkState()
+    budget = ScanBudget()
+    budget.stop()
+
+    assert found_paths(tmp_path, 2, state=state, budget=budget) == []
+    assert [task.path for task in state.pending] == [str(tmp_path)]
+    assert budget.reason == "interrupted"
+
+
+def test_resumed_walk_matches_uninterrupted(tmp_path):
+    """Test that budget-limited runs resumed from the journal add up."""
+    root = tmp_path / "tree"
+    make_random_tree(root, 1)
+    expected = found_paths(root, 5)
+
+    assert resume_until_complete(root, 5, tmp_path) == expected
+    assert resume_until_complete(root, 5, tmp_path, workers=4) == expected
+
+
+def test_scan_journal_roundtrip(tmp_path):
+    """Test that a saved journal restores params, pending and found."""
+    make_tree(tmp_path, ["ws/a/.git/", "ws/b/go.mod"])
+    root = tmp_path / "ws"
+    journal = ScanJournal(tmp_path / "journal.json", {"depth": 2})
+    state = journal.state(str(root))
+    budget = ScanBudget(max_entries=1)
+    found_paths(root, 2, state=state, budget=budget)
+    journal.save()
+
+    loaded = ScanJournal.load(tmp_path / "journal.json")
+    assert loaded.params == {"depth": 2}
+    restored = loaded.state(str(root))
+    assert restored.pending == state.pending
+    assert restored.found == state.found
+    assert not restored.complete
+
+    loaded.discard()
+    assert ScanJournal.load(tmp_path / "journal.json") is None
@@ -0,0 +1,122 @@
+"""Tests for the shared HTTP transport."""
+import gzip
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from proj.api_client import APIClient
+from proj.config import Config
+from proj.forges import GitHubClient
+from proj.transport import TimeoutPolicy, Transport
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 handler recording which connection served each request."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.connections.add(self.client_address)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+            server.headers.append(dict(self.headers))
+        try:
+            time.sleep(server.delay)
+            body = json.dumps([{"name": "repo", "html_url": "u"}]).encode()
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = gzip.compress(body)
+                self.send_response(200)
+                self.send_header("Content-Encoding", "gzip")
+            else:
+                self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def keepalive_server():
+    """Start a keep-alive stub server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    server.daemon_threads = True
+    server.connections = set()
+    server.headers = []
+    server.active = 0
+    server.max_active = 0
+    server.delay = 0.0
+    server.lock = threading.Lock()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_timeout_policy():
+    """Test requests get (connect, read) timeouts from the policy."""
+    policy = TimeoutPolicy(connect=2, read=7, bulk_read=40)
+
+    assert policy.timeout() == (2, 7)
+    assert policy.timeout(bulk=True) == (2, 40)
+
+
+def test_transport_reuses_connections_and_gzips(keepalive_server):
+    """Test sequential requests share one kept-alive connection."""
+    with Transport() as transport:
+        for _ in range(5):
+            response = transport.request("GET", keepalive_server.url)
+            assert response.json() == [{"name": "repo", "html_url": "u"}]
+
+    assert len(keepalive_server.connections) == 1
+    assert response.headers["Content-Encoding"] == "gzip"
+
+
+def test_transport_caps_connections_per_host(keepalive_server):
+    """Test threads beyond pool_size wait for a pooled connection."""
+    keepalive_server.delay = 0.05
+    with Transport(pool_size=2) as transport:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(
+                lambda _: transport.request("GET", keepalive_server.url),
+                range(16),
+            ))
+
+    assert keepalive_server.max_active <= 2
+    assert len(keepalive_server.connections) <= 2
+
+
+def test_clients_share_transport_without_sharing_credentials(
+    keepalive_server
+):
+    """Test forge and API clients reuse one pool with their own headers."""
+    transport = Transport()
+    config = Config(api_url=keepalive_server.url)
+    github = GitHubClient(
+        token="secret", api_url=keepalive_server.url, transport=transport
+    )
+    api = APIClient(config=config, transport=transport)
+
+    github.get(keepalive_server.url)
+    api.list_projects()
+    github.close()
+    api.list_projects()
+
+    forge_headers, api_headers, _ = keepalive_server.headers
+    assert forge_headers["Authorization"] == "token secret"
+    assert "Authorization" not in api_headers
+    assert api_headers["Accept"] == "application/json"
+    assert len(keepalive_server.connections) == 1
+    transport.close()